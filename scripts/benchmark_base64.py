@@ -0,0 +1,64 @@
+"""
+Compares decoding base64 page content in one shot and in chunks.
+
+For a synthetic 20 MiB screenshot encoded as the API returns it, reports
+the time and the peak memory above the encoded response of:
+
+- one shot: base64.b64decode on the whole content.
+- decode_content: decoded chunk by chunk into a bytearray.
+- decode_content to file: decoded chunk by chunk into a file.
+
+Usage: PYTHONPATH=src python scripts/benchmark_base64.py [MiB]
+"""
+
+import base64
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from oxylabs.sources.ecommerce.response import EcommerceResponse
+
+
+def measure(run) -> tuple:
+    gc.collect()
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    png = os.urandom(size * 1024 * 1024)
+    response = EcommerceResponse(
+        {"results": [{"content": base64.b64encode(png).decode()}]}
+    )
+    result = response.results[0]
+    del png
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "page.png")
+        variants = (
+            ("one shot", lambda: base64.b64decode(result.content)),
+            ("decode_content", lambda: result.decode_content()),
+            ("decode_content to file", lambda: result.decode_content(path)),
+        )
+        print(f"{'variant':<24}{'ms':>10}{'peak MiB':>12}")
+        for name, run in variants:
+            seconds, peak = measure(run)
+            print(
+                f"{name:<24}{seconds * 1000:>10.0f}"
+                f"{peak / 1024 / 1024:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
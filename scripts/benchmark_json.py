@@ -0,0 +1,87 @@
+"""
+Compares the JSON codecs on response bodies.
+
+Decodes and re-encodes each body with every installed codec and reports
+the average time per body. Pass recorded response bodies as files, or run
+without arguments to use a synthetic parsed Amazon result with embedded
+HTML.
+
+Usage: PYTHONPATH=src python scripts/benchmark_json.py [body.json ...]
+"""
+
+import json
+import sys
+import timeit
+
+from oxylabs.internal.codec import get_codec
+
+
+def synthetic_body() -> bytes:
+    html = "<div class='s-result-item'>" + "x" * 2000 + "</div>"
+    products = [
+        {
+            "pos": pos,
+            "url": f"/dp/B0{pos:08d}",
+            "asin": f"B0{pos:08d}",
+            "price": 19.99 + pos,
+            "title": f"Product {pos} " * 5,
+            "rating": 4.5,
+            "currency": "USD",
+            "reviews_count": 1000 + pos,
+            "is_prime": pos % 2 == 0,
+        }
+        for pos in range(1, 61)
+    ]
+    data = {
+        "results": [
+            {
+                "content": html * 200,
+                "content_parsed": {
+                    "results": {"organic": products, "paid": products[:5]},
+                    "query": "nike",
+                    "parse_status_code": 12000,
+                },
+                "status_code": 200,
+                "page": page,
+            }
+            for page in range(1, 4)
+        ],
+        "job": {"id": "7000000000000000001", "status": "done"},
+    }
+    return json.dumps(data).encode()
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        bodies = []
+        for path in sys.argv[1:]:
+            with open(path, "rb") as file:
+                bodies.append(file.read())
+    else:
+        bodies = [synthetic_body()]
+    size = sum(len(body) for body in bodies) / len(bodies)
+    print(f"{len(bodies)} bodies, {size / 1024 / 1024:.1f} MiB on average")
+
+    print(f"{'codec':<10}{'decode ms':>12}{'encode ms':>12}")
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            print(f"{name:<10}{'not installed':>24}")
+            continue
+        decoded = [codec.loads(body) for body in bodies]
+        number = 20
+        decode = timeit.timeit(
+            lambda: [codec.loads(body) for body in bodies], number=number
+        )
+        encode = timeit.timeit(
+            lambda: [codec.dumps(data) for data in decoded], number=number
+        )
+        per_body = 1000 / number / len(bodies)
+        print(
+            f"{name:<10}{decode * per_body:>12.2f}{encode * per_body:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Measures the memory held per parsed response.
+
+Builds a batch of SERP responses from a synthetic parsed Google search
+result and reports the memory they hold, with and without the raw
+response data.
+
+Usage: PYTHONPATH=src python scripts/benchmark_responses.py [count]
+"""
+
+import copy
+import gc
+import sys
+import tracemalloc
+
+from oxylabs.sources.serp.response import SERPResponse
+
+
+def make_result(pages: int = 1) -> dict:
+    sitelinks = {
+        "inline": [
+            {"url": f"https://example.com/{i}", "title": f"Link {i}"}
+            for i in range(4)
+        ]
+    }
+    organic = [
+        {
+            "pos": pos,
+            "url": f"https://example.com/result/{pos}",
+            "desc": "A description of the result " * 4,
+            "title": f"Result {pos}",
+            "sitelinks": sitelinks,
+            "url_shown": f"example.com > result > {pos}",
+            "pos_overall": pos,
+        }
+        for pos in range(1, 11)
+    ]
+    paid = [
+        {
+            "pos": pos,
+            "url": f"https://ads.example.com/{pos}",
+            "desc": "An ad",
+            "title": f"Ad {pos}",
+            "sitelinks": sitelinks,
+        }
+        for pos in range(1, 4)
+    ]
+    return {
+        "results": [
+            {
+                "content_parsed": {
+                    "url": "https://www.google.com/search?q=nike",
+                    "page": page,
+                    "results": {
+                        "organic": organic,
+                        "paid": paid,
+                        "related_searches": {
+                            "pos_overall": 14,
+                            "related_searches": [
+                                f"nike {i}" for i in range(8)
+                            ],
+                        },
+                        "total_results_count": 1000000,
+                    },
+                    "parse_status_code": 12000,
+                },
+                "status_code": 200,
+                "page": page,
+                "url": "https://www.google.com/search?q=nike",
+                "parser_type": "",
+            }
+            for page in range(1, pages + 1)
+        ],
+        "job": {"id": "7000000000000000001", "status": "done"},
+    }
+
+
+def measure(build, count: int) -> float:
+    """
+    Returns the memory, in bytes, held per object returned by `build`.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = [build() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return (after - before) / count
+
+
+def build_all(model) -> None:
+    """
+    Builds every nested model, as the models did before they were lazy.
+    """
+    for nested in model._nested:
+        value = nested.__get__(model)
+        for item in value if isinstance(value, list) else (value,):
+            build_all(item)
+
+
+def build_full(data: dict, keep_raw: bool) -> SERPResponse:
+    response = SERPResponse(copy.deepcopy(data), keep_raw=keep_raw)
+    if keep_raw:
+        build_all(response)
+    return response
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    data = make_result()
+
+    rows = (
+        ("raw data only", lambda: copy.deepcopy(data)),
+        ("models + raw", lambda: build_full(data, keep_raw=True)),
+        ("models, keep_raw=False", lambda: build_full(data, keep_raw=False)),
+    )
+    print(f"{'variant':<28}{'bytes per response':>20}")
+    for name, build in rows:
+        print(f"{name:<28}{measure(build, count):>20,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Measures the memory held by responses with large page content.
+
+Builds a batch of ecommerce responses, each holding a synthetic 1 MiB HTML
+page, the way a client builds them from decoded results, and reports the
+memory the batch holds and the time per response, with the content kept in
+memory and spilled to scratch files.
+
+Usage: PYTHONPATH=src python scripts/benchmark_spill.py [count]
+"""
+
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from oxylabs.internal.spill import spill_results
+from oxylabs.sources.ecommerce.response import EcommerceResponse
+
+HTML = '<div class="product">' + "x" * 1000 + "</div>\n"
+
+
+def make_result(page: int) -> dict:
+    # A fresh string per result, as decoding a response body would give.
+    content = "".join([HTML] * 1000) + str(page)
+    return {"results": [{"content": content, "page": page}]}
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    with tempfile.TemporaryDirectory() as spill_dir:
+        variants = (
+            ("in memory", lambda result: result),
+            (
+                "spilled",
+                lambda result: spill_results(result, 64 * 1024, spill_dir),
+            ),
+        )
+        print(f"{'variant':<12}{'us':>10}{'MiB held':>12}")
+        for name, prepare in variants:
+            gc.collect()
+            tracemalloc.start()
+            start = time.perf_counter()
+            held = [
+                EcommerceResponse(prepare(make_result(page)))
+                for page in range(count)
+            ]
+            seconds = time.perf_counter() - start
+            memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del held
+            gc.collect()
+            print(
+                f"{name:<12}{seconds / count * 1e6:>10.0f}"
+                f"{memory / 1024 / 1024:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Compares buffering a results document with streaming it.
+
+For a synthetic job with `pages` HTML pages of about 3 MiB each, reports
+the time and the peak memory to go through every results item when:
+
+- buffered: the whole body is read, then decoded with the stdlib.
+- streamed: the body is fed to ResultStream in 64 KiB chunks.
+- streamed + spill: as above, with `content` spilled to temporary files.
+
+Usage: PYTHONPATH=src python scripts/benchmark_streaming.py [pages]
+"""
+
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from oxylabs.internal.streaming import ResultStream
+from oxylabs.utils.defaults import DEFAULT_STREAM_CHUNK_SIZE
+
+
+def body(pages: int) -> bytes:
+    html = '<div class="s-result-item">\n' + "x" * 2000 + "</div>\n"
+    document = {
+        "results": [
+            {"content": html * 1500, "page": page, "status_code": 200}
+            for page in range(1, pages + 1)
+        ],
+        "job": {"id": "7000000000000000001", "status": "done"},
+    }
+    return json.dumps(document).encode()
+
+
+def socket(data: bytes):
+    # Copies each chunk, as reading from a socket would.
+    for start in range(0, len(data), DEFAULT_STREAM_CHUNK_SIZE):
+        yield bytes(data[start : start + DEFAULT_STREAM_CHUNK_SIZE])
+
+
+def buffered(data: bytes) -> int:
+    document = json.loads(b"".join(socket(data)))
+    return sum(1 for _ in document["results"])
+
+
+def streamed(data: bytes, **kwargs) -> int:
+    stream = ResultStream(**kwargs)
+    count = 0
+    for chunk in socket(data):
+        for _ in stream.feed(chunk):
+            count += 1
+    stream.close()
+    return count
+
+
+def measure(run) -> tuple:
+    gc.collect()
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main() -> None:
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    data = body(pages)
+    print(f"{pages} pages, {len(data) / 1024 / 1024:.1f} MiB body")
+    with tempfile.TemporaryDirectory() as spill_dir:
+        variants = (
+            ("buffered", lambda: buffered(data)),
+            ("streamed", lambda: streamed(data)),
+            (
+                "streamed + spill",
+                lambda: streamed(
+                    data, spill_threshold=1024 * 1024, spill_dir=spill_dir
+                ),
+            ),
+        )
+        print(f"{'variant':<20}{'ms':>10}{'peak MiB':>12}")
+        for name, run in variants:
+            seconds, peak = measure(run)
+            print(
+                f"{name:<20}{seconds * 1000:>10.0f}{peak / 1024 / 1024:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
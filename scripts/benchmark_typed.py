@@ -0,0 +1,158 @@
+"""
+Compares typed struct decoding with building response objects.
+
+For synthetic parsed google_search and amazon_search results, reports the
+time to go from the response bytes to fully built results, and the memory
+the results hold, for:
+
+- json + response objects: the stdlib decoder, then every nested model
+  of SERPResponse or EcommerceResponse built.
+- typed structs: the bytes decoded straight into the structs of
+  `oxylabs.sources.structs` (requires msgspec).
+
+Usage: PYTHONPATH=src python scripts/benchmark_typed.py [count]
+"""
+
+import gc
+import json
+import sys
+import timeit
+import tracemalloc
+
+from oxylabs.sources.ecommerce.response import EcommerceResponse
+from oxylabs.sources.serp.response import SERPResponse
+
+
+def google_search_body() -> bytes:
+    sitelinks = {
+        "inline": [
+            {"url": f"https://example.com/{i}", "title": f"Link {i}"}
+            for i in range(4)
+        ]
+    }
+    organic = [
+        {
+            "pos": pos,
+            "url": f"https://example.com/result/{pos}",
+            "desc": "A description of the result " * 4,
+            "title": f"Result {pos}",
+            "sitelinks": sitelinks,
+            "url_shown": f"example.com > result > {pos}",
+            "pos_overall": pos,
+        }
+        for pos in range(1, 11)
+    ]
+    content = {
+        "url": "https://www.google.com/search?q=nike",
+        "page": 1,
+        "results": {
+            "paid": [],
+            "organic": organic,
+            "total_results_count": 1000000,
+        },
+        "parse_status_code": 12000,
+    }
+    return body(content)
+
+
+def amazon_search_body() -> bytes:
+    items = [
+        {
+            "pos": pos,
+            "url": f"/dp/B0{pos:08d}",
+            "asin": f"B0{pos:08d}",
+            "price": 19.99 + pos,
+            "title": f"Product {pos} " * 5,
+            "rating": 4.5,
+            "currency": "USD",
+            "is_prime": pos % 2 == 0,
+            "url_image": f"https://m.media-amazon.com/images/{pos}.jpg",
+            "best_seller": False,
+            "is_sponsored": False,
+            "manufacturer": "",
+            "pricing_count": 1,
+            "reviews_count": 1000 + pos,
+            "is_amazons_choice": False,
+        }
+        for pos in range(1, 61)
+    ]
+    content = {
+        "url": "https://www.amazon.com/s?k=nike",
+        "page": 1,
+        "query": "nike",
+        "results": {"paid": items[:5], "organic": items},
+        "parse_status_code": 12000,
+    }
+    return body(content)
+
+
+def body(content: dict) -> bytes:
+    document = {
+        "results": [
+            {
+                "content_parsed": content,
+                "status_code": 200,
+                "page": 1,
+            }
+        ],
+        "job": {"id": "7000000000000000001", "status": "done"},
+    }
+    return json.dumps(document).encode()
+
+
+def build_all(model) -> None:
+    for nested in model._nested:
+        value = nested.__get__(model)
+        for item in value if isinstance(value, list) else (value,):
+            build_all(item)
+
+
+def held_memory(build, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = [build() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return (after - before) / count
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    try:
+        from oxylabs.sources import structs
+    except ImportError:
+        structs = None
+
+    cases = (
+        ("google_search", google_search_body(), SERPResponse),
+        ("amazon_search", amazon_search_body(), EcommerceResponse),
+    )
+    print(f"{'source':<16}{'variant':<26}{'us':>10}{'bytes held':>12}")
+    for source, data, response_class in cases:
+
+        def objects():
+            response = response_class(json.loads(data))
+            build_all(response)
+            return response
+
+        variants = [("json + response objects", objects)]
+        if structs is not None:
+            variants.append(
+                ("typed structs", lambda: structs.decode(data, source))
+            )
+        for name, build in variants:
+            seconds = timeit.timeit(build, number=count) / count
+            memory = held_memory(build, count)
+            print(
+                f"{source:<16}{name:<26}{seconds * 1e6:>10.0f}{memory:>12,.0f}"
+            )
+        if structs is None:
+            print(
+                f"{source:<16}{'typed structs':<26}{'msgspec not installed':>22}"
+            )
+
+
+if __name__ == "__main__":
+    main()
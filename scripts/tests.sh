@@ -12,5 +12,29 @@ python -m unittest tests.sources.ecommerce.test_wayfair.TestWayfairSearchAsync
 python -m unittest tests.sources.ecommerce.test_wayfair.TestWayfairUrlSync
 python -m unittest tests.sources.ecommerce.test_wayfair.TestWayfairUrlAsync
 
+# Run response tests
+python -m unittest tests.sources.test_response
+
 # Run proxy tests
 python -m unittest tests.proxy.test_proxy.TestProxyGet
+
+# Run client tests
+python -m unittest tests.internal.test_realtime_client
+python -m unittest tests.internal.test_batch
+python -m unittest tests.internal.test_callback
+python -m unittest tests.internal.test_polling
+python -m unittest tests.internal.test_async_client
+python -m unittest tests.internal.test_rate_limit
+python -m unittest tests.internal.test_retry
+python -m unittest tests.internal.test_bulk
+python -m unittest tests.internal.test_cache
+python -m unittest tests.internal.test_singleflight
+python -m unittest tests.internal.test_journal
+python -m unittest tests.internal.test_deadline
+python -m unittest tests.internal.test_cancellation
+python -m unittest tests.internal.test_hedging
+python -m unittest tests.internal.test_router
+python -m unittest tests.internal.test_codec
+python -m unittest tests.internal.test_typed
+python -m unittest tests.internal.test_streaming
+python -m unittest tests.internal.test_spill
@@ -1,2 +1,7 @@
-from .internal import AsyncClient, RealtimeClient
+from .internal import (
+    AsyncClient,
+    CallbackServer,
+    RealtimeClient,
+    RouterClient,
+)
 from .proxy.proxy import ProxyClient
@@ -1 +1,13 @@
+from .bulk import BulkResult
+from .cache import DiskCache, ResultCache
+from .callback import CallbackServer
+from .codec import JSONCodec, MsgspecCodec, OrjsonCodec
+from .hedging import HedgePolicy
 from .internal import AsyncClient, RealtimeClient
+from .journal import JobJournal
+from .polling import AdaptivePollPolicy, FixedPollPolicy, PollPolicy
+from .rate_limit import RateLimiter
+from .retry import CircuitBreaker, RetryPolicy
+from .router import RouterClient
+from .spill import SpilledContent
+from .streaming import ResultStream
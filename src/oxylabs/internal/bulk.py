@@ -0,0 +1,70 @@
+from typing import Any, Callable, Optional, Tuple, Union
+
+
+class BulkResult:
+    def __init__(
+        self,
+        index: int,
+        request: Union[tuple, dict],
+        response: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Holds the outcome of one request of a bulk scrape.
+
+        Args:
+            index (int): The position of the request in the input.
+            request (Union[tuple, dict]): The (method, params) request as
+            given, or the payload of a resumed job.
+            response: The SERPResponse or EcommerceResponse, if the scrape
+            method returned one, or the API result of a resumed job.
+            error (Optional[BaseException]): The exception raised by the
+            scrape method, if any.
+        """
+        self.index = index
+        self.request = request
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """
+        Returns whether the request produced a response without errors.
+        """
+        return (
+            self.error is None
+            and self.response is not None
+            and getattr(self.response, "error", None) is None
+        )
+
+
+def resolve_scrape_method(
+    client, call: Tuple[Union[str, Callable], Optional[dict]]
+) -> Tuple[Callable, dict]:
+    """
+    Resolves a bulk call into a scrape method and its keyword arguments.
+
+    Args:
+        client: The client the request is run with.
+        call (tuple): A (method, params) pair. The method is either a
+        scrape method of the client, e.g. `client.serp.google.scrape_search`,
+        or its dotted path relative to the client, e.g.
+        "serp.google.scrape_search".
+
+    Returns:
+        Tuple[Callable, dict]: The scrape method and its keyword arguments.
+
+    Raises:
+        ValueError: If the method cannot be resolved.
+    """
+    method, params = call
+    if isinstance(method, str):
+        target = client
+        for name in method.split("."):
+            target = getattr(target, name, None)
+            if target is None:
+                raise ValueError(f"Unknown scrape method: {method}")
+        method = target
+    if not callable(method) or not method.__name__.startswith("scrape_"):
+        raise ValueError(f"Not a scrape method: {method}")
+    return method, dict(params or {})
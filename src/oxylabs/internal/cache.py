@@ -0,0 +1,481 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from oxylabs.utils.defaults import (
+    DEFAULT_CACHE_MAX_BYTES,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_DISK_CACHE_MAX_BYTES,
+)
+
+
+def payload_key(payload: dict) -> str:
+    """
+    Returns a canonical hash of a payload.
+
+    Payloads with the same parameters hash the same regardless of the
+    order their keys were set in.
+
+    Args:
+        payload (dict): The payload, with empty values already removed.
+
+    Returns:
+        str: The hex digest identifying the payload.
+    """
+    canonical = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def is_cacheable(result: dict) -> bool:
+    """
+    Returns whether a result may be cached.
+
+    Results the target site answered with an error status are not cached,
+    so that the next request retries them. Results decoded into typed
+    structs are not cached either.
+    """
+    if not isinstance(result, dict):
+        return False
+    return not any(
+        (page.get("status_code") or 0) >= 400
+        for page in result.get("results") or []
+    )
+
+
+class ResultCache:
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        ttl: float = DEFAULT_CACHE_TTL,
+        source_ttls: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """
+        Initializes an in-memory LRU cache of scrape results.
+
+        Results are keyed by the canonical hash of their payload and expire
+        after the TTL of their source. They are kept JSON encoded and every
+        hit decodes a fresh copy, so that callers modifying a response do
+        not modify the cached result. Once the cache holds more than
+        `max_entries` results or `max_bytes` of JSON, the least recently
+        used results are evicted.
+
+        Args:
+            max_entries (int): The maximum number of cached results.
+            max_bytes (int): The maximum total size of the cached results,
+            measured as their JSON encoding.
+            ttl (float): Seconds a result stays fresh.
+            source_ttls (Optional[Dict[str, float]]): Seconds results of
+            individual sources stay fresh, overriding `ttl`. A TTL of 0
+            disables caching for the source.
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._source_ttls = dict(source_ttls or {})
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the total size in bytes of the cached results.
+        """
+        return self._bytes
+
+    def ttl_for(self, source: Optional[str]) -> float:
+        """
+        Returns the number of seconds results of the source stay fresh.
+        """
+        return self._source_ttls.get(source, self._ttl)
+
+    def get(self, payload: dict) -> Optional[dict]:
+        """
+        Returns the cached result of a payload.
+
+        Args:
+            payload (dict): The payload of the request.
+
+        Returns:
+            Optional[dict]: The result, or None if it is not cached or
+            expired.
+        """
+        key = payload_key(payload)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            encoded = entry[2]
+        return json.loads(encoded)
+
+    def set(self, payload: dict, result: dict) -> None:
+        """
+        Caches the result of a payload.
+
+        Args:
+            payload (dict): The payload of the request.
+            result (dict): The result returned by the API.
+        """
+        ttl = self.ttl_for(payload.get("source"))
+        if ttl <= 0 or not is_cacheable(result):
+            return
+        encoded = json.dumps(
+            result, separators=(",", ":"), default=str
+        ).encode()
+        size = len(encoded)
+        if size > self._max_bytes:
+            return
+
+        key = payload_key(payload)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, size, encoded)
+            self._bytes += size
+            while (
+                len(self._entries) > self._max_entries
+                or self._bytes > self._max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """
+        Removes every cached result and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+class DiskCache:
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            expires REAL NOT NULL,
+            accessed REAL NOT NULL,
+            size INTEGER NOT NULL,
+            data BLOB NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)",
+        """
+        CREATE TABLE IF NOT EXISTS blobs (
+            hash TEXT PRIMARY KEY,
+            data BLOB NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS response_blobs (
+            key TEXT NOT NULL,
+            hash TEXT NOT NULL,
+            PRIMARY KEY (key, hash)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS response_blobs_hash "
+        "ON response_blobs (hash)",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_DISK_CACHE_MAX_BYTES,
+        ttl: float = DEFAULT_CACHE_TTL,
+        source_ttls: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """
+        Initializes a persistent cache of scrape results in a SQLite file.
+
+        The cache survives restarts and can be shared by several processes
+        on one machine. Results are stored as compressed JSON keyed by the
+        canonical hash of their payload. Page contents are stored
+        separately by their own hash, so identical pages returned for
+        different payloads are kept once. Expired results are dropped and,
+        once the file holds more than `max_bytes`, the least recently used
+        results are evicted. The size is tracked as results are written and
+        only recounted when compacting, so results written by other
+        processes are noticed at the next compaction.
+
+        Args:
+            path (str): The path of the SQLite database file.
+            max_bytes (int): The maximum total size of the compressed
+            results and page contents.
+            ttl (float): Seconds a result stays fresh.
+            source_ttls (Optional[Dict[str, float]]): Seconds results of
+            individual sources stay fresh, overriding `ttl`. A TTL of 0
+            disables caching for the source.
+        """
+        self._path = path
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._source_ttls = dict(source_ttls or {})
+        self._conn = None
+        self._pid = None
+        # Bytes stored as of the last count, plus the bytes written since.
+        self._bytes = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return (
+                self._connect()
+                .execute("SELECT COUNT(*) FROM responses")
+                .fetchone()[0]
+            )
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the total size in bytes of the stored results and page
+        contents.
+        """
+        with self._lock:
+            return self._size(self._connect())
+
+    def ttl_for(self, source: Optional[str]) -> float:
+        """
+        Returns the number of seconds results of the source stay fresh.
+        """
+        return self._source_ttls.get(source, self._ttl)
+
+    def get(self, payload: dict) -> Optional[dict]:
+        """
+        Returns the cached result of a payload.
+
+        Args:
+            payload (dict): The payload of the request.
+
+        Returns:
+            Optional[dict]: The result, or None if it is not cached or
+            expired.
+        """
+        key = payload_key(payload)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT expires, data FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[0] <= now:
+                with conn:
+                    self._delete(conn, key)
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+
+            stored = json.loads(zlib.decompress(row[1]))
+            result = stored["result"]
+            pages = result.get("results") or []
+            for index, content_hash in stored["blobs"].items():
+                blob = conn.execute(
+                    "SELECT data FROM blobs WHERE hash = ?", (content_hash,)
+                ).fetchone()
+                if blob is None:
+                    # Compacted away by another process meanwhile.
+                    self.misses += 1
+                    return None
+                pages[int(index)]["content"] = zlib.decompress(
+                    blob[0]
+                ).decode()
+            with conn:
+                conn.execute(
+                    "UPDATE responses SET accessed = ? WHERE key = ?",
+                    (now, key),
+                )
+            self.hits += 1
+            return result
+
+    def set(self, payload: dict, result: dict) -> None:
+        """
+        Caches the result of a payload.
+
+        Args:
+            payload (dict): The payload of the request.
+            result (dict): The result returned by the API.
+        """
+        ttl = self.ttl_for(payload.get("source"))
+        if ttl <= 0 or not is_cacheable(result):
+            return
+
+        # Move raw page contents out of the result into their own blobs.
+        pages = []
+        blobs = {}
+        for index, page in enumerate(result.get("results") or []):
+            if isinstance(page, dict) and isinstance(page.get("content"), str):
+                encoded = page["content"].encode()
+                content_hash = hashlib.sha256(encoded).hexdigest()
+                blobs[str(index)] = (content_hash, encoded)
+                page = {**page, "content": None}
+            pages.append(page)
+        stored = {
+            "result": {**result, "results": pages},
+            "blobs": {index: blob[0] for index, blob in blobs.items()},
+        }
+        data = zlib.compress(
+            json.dumps(stored, separators=(",", ":"), default=str).encode()
+        )
+
+        key = payload_key(payload)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            if self._bytes is None:
+                self._bytes = self._size(conn)
+            written = len(data)
+            with conn:
+                self._delete(conn, key)
+                for content_hash, encoded in blobs.values():
+                    exists = conn.execute(
+                        "SELECT 1 FROM blobs WHERE hash = ?", (content_hash,)
+                    ).fetchone()
+                    if exists is None:
+                        compressed = zlib.compress(encoded)
+                        conn.execute(
+                            "INSERT INTO blobs (hash, data) VALUES (?, ?)",
+                            (content_hash, compressed),
+                        )
+                        written += len(compressed)
+                    conn.execute(
+                        "INSERT OR IGNORE INTO response_blobs (key, hash) "
+                        "VALUES (?, ?)",
+                        (key, content_hash),
+                    )
+                conn.execute(
+                    "INSERT INTO responses "
+                    "(key, expires, accessed, size, data) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, now + ttl, now, len(data), data),
+                )
+            # Replaced results are not subtracted, so the total may only
+            # overestimate the size, and compaction recounts it.
+            self._bytes += written
+            if self._bytes > self._max_bytes:
+                self._compact(conn, now)
+
+    def compact(self) -> None:
+        """
+        Drops expired results and evicts the least recently used ones until
+        the cache fits in `max_bytes`.
+        """
+        with self._lock:
+            self._compact(self._connect(), time.time())
+
+    def clear(self) -> None:
+        """
+        Removes every cached result and resets the counters.
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM responses")
+                conn.execute("DELETE FROM response_blobs")
+                conn.execute("DELETE FROM blobs")
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        """
+        Closes the connection to the database file.
+        """
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Returns the connection of the current process, opening it and
+        creating the schema if needed.
+        """
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(
+                self._path, timeout=30, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                for statement in self._SCHEMA:
+                    conn.execute(statement)
+            self._conn = conn
+            self._pid = os.getpid()
+            self._bytes = None
+        return self._conn
+
+    @staticmethod
+    def _size(conn: sqlite3.Connection) -> int:
+        return conn.execute(
+            "SELECT (SELECT IFNULL(SUM(size), 0) FROM responses)"
+            " + (SELECT IFNULL(SUM(LENGTH(data)), 0) FROM blobs)"
+        ).fetchone()[0]
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, key: str) -> None:
+        """
+        Deletes a result, leaving its page contents for compaction.
+        """
+        conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+        conn.execute("DELETE FROM response_blobs WHERE key = ?", (key,))
+
+    def _compact(self, conn: sqlite3.Connection, now: float) -> None:
+        with conn:
+            expired = conn.execute(
+                "SELECT key FROM responses WHERE expires <= ?", (now,)
+            ).fetchall()
+            for (key,) in expired:
+                self._delete(conn, key)
+            self._drop_orphan_blobs(conn)
+
+        self._bytes = self._size(conn)
+        while self._bytes > self._max_bytes:
+            count = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[
+                0
+            ]
+            if count == 0:
+                break
+            # Evict a tenth of the results per round to limit rescans.
+            oldest = conn.execute(
+                "SELECT key FROM responses ORDER BY accessed LIMIT ?",
+                (max(count // 10, 1),),
+            ).fetchall()
+            with conn:
+                for (key,) in oldest:
+                    self._delete(conn, key)
+                self._drop_orphan_blobs(conn)
+            self._bytes = self._size(conn)
+
+    @staticmethod
+    def _drop_orphan_blobs(conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "DELETE FROM blobs WHERE hash NOT IN "
+            "(SELECT hash FROM response_blobs)"
+        )
@@ -0,0 +1,183 @@
+import asyncio
+import hmac
+import logging
+import secrets
+from collections import OrderedDict
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from aiohttp import web
+
+from oxylabs.utils.defaults import (
+    DEFAULT_CALLBACK_FALLBACK_AFTER,
+    DEFAULT_CALLBACK_HOST,
+    DEFAULT_CALLBACK_PATH,
+    DEFAULT_CALLBACK_PORT,
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Number of notifications kept for jobs nobody is waiting on yet.
+_MAX_UNCLAIMED = 10000
+
+
+class CallbackServer:
+    def __init__(
+        self,
+        public_url: str,
+        host: str = DEFAULT_CALLBACK_HOST,
+        port: int = DEFAULT_CALLBACK_PORT,
+        path: str = DEFAULT_CALLBACK_PATH,
+        token: Optional[str] = None,
+        fallback_after: int = DEFAULT_CALLBACK_FALLBACK_AFTER,
+    ) -> None:
+        """
+        Initializes an embedded server receiving job completion callbacks.
+
+        When attached to an AsyncClient, submitted jobs get this server as
+        their `callback_url` and are resolved as soon as the notification
+        arrives instead of being polled.
+
+        The server only accepts callbacks carrying its token, which is
+        added to the callback URL as the `token` query parameter.
+
+        Args:
+            public_url (str): The URL the API posts callbacks to, e.g.
+            "https://example.com/callback". It must be reachable from the
+            internet and forward to `path` on this server, e.g. through a
+            reverse proxy or tunnel.
+            host (str): The interface to listen on.
+            port (int): The port to listen on. Use 0 to pick a free port.
+            path (str): The path callbacks are posted to.
+            token (Optional[str]): The shared secret callbacks must carry.
+            A random one is generated if not provided.
+            fallback_after (int): Seconds to wait for a callback before
+            falling back to polling the job status.
+        """
+        if not public_url:
+            raise ValueError("public_url is required")
+        self._host = host
+        self._port = port
+        self._path = path
+        self._public_url = public_url
+        self.token = token or secrets.token_urlsafe(32)
+        self.fallback_after = fallback_after
+        self._runner = None
+        self._waiters = {}
+        self._unclaimed = OrderedDict()
+
+    @property
+    def port(self) -> int:
+        """
+        Returns the port the server listens on.
+        """
+        return self._port
+
+    @property
+    def url(self) -> str:
+        """
+        Returns the URL the API should post job callbacks to, carrying the
+        server's token.
+        """
+        parts = urlsplit(self._public_url)
+        query = parse_qsl(parts.query) + [("token", self.token)]
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    async def __aenter__(self) -> "CallbackServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        """
+        Starts listening for job callbacks.
+        """
+        app = web.Application()
+        app.router.add_post(self._path, self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        if self._port == 0:
+            self._port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """
+        Stops the server and releases every pending waiter.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+        # Pending jobs fall back to polling.
+        for future in self._waiters.values():
+            if not future.done():
+                future.set_result(None)
+        self._waiters.clear()
+
+    async def wait_for(self, job_id: str, timeout: float) -> Optional[str]:
+        """
+        Waits for the completion callback of the given job.
+
+        Args:
+            job_id (str): The ID of the job.
+            timeout (float): The maximum time to wait in seconds.
+
+        Returns:
+            Optional[str]: The final job status, or None if no callback
+            arrived in time.
+        """
+        if job_id in self._unclaimed:
+            return self._unclaimed.pop(job_id)
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[job_id] = future
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._waiters.pop(job_id, None)
+
+    def notify(self, job_id: str, status: str) -> None:
+        """
+        Resolves the waiter of a job with its final status.
+
+        Args:
+            job_id (str): The ID of the job.
+            status (str): The final status of the job.
+        """
+        future = self._waiters.get(job_id)
+        if future is not None:
+            if not future.done():
+                future.set_result(status)
+            return
+
+        # The callback may arrive before anyone started waiting on it.
+        self._unclaimed[job_id] = status
+        while len(self._unclaimed) > _MAX_UNCLAIMED:
+            self._unclaimed.popitem(last=False)
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        """
+        Handles a job callback posted by the API.
+        """
+        token = request.query.get("token", "")
+        if not hmac.compare_digest(token.encode(), self.token.encode()):
+            logger.warning("Callback with an invalid token rejected")
+            return web.Response(status=403)
+
+        try:
+            data = await request.json()
+            job_id = data["id"]
+            status = data["status"]
+        except Exception as e:
+            logger.error(f"Invalid callback received: {e}")
+            return web.Response(status=400)
+
+        if status in ("done", "faulted"):
+            self.notify(job_id, status)
+        return web.Response(status=200)
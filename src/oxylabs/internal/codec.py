@@ -0,0 +1,110 @@
+import json
+from typing import Any, Optional, Union
+
+
+class JSONCodec:
+    """
+    Encodes request payloads and decodes response bodies with the standard
+    library's json module.
+
+    Subclass it and override `dumps` and `loads` to plug in another JSON
+    library.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encodes an object as UTF-8 JSON.
+        """
+        return json.dumps(
+            obj, separators=(",", ":"), ensure_ascii=False
+        ).encode()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decodes a JSON document.
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Encodes and decodes JSON with orjson.
+
+    Raises:
+        ImportError: If orjson is not installed.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    Encodes and decodes JSON with msgspec.
+
+    Raises:
+        ImportError: If msgspec is not installed.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._decoder.decode(data)
+
+
+_CODECS = {
+    codec.name: codec for codec in (JSONCodec, OrjsonCodec, MsgspecCodec)
+}
+
+
+def get_codec(
+    codec: Optional[Union[str, JSONCodec]],
+) -> Optional[JSONCodec]:
+    """
+    Resolves a client's `codec` setting.
+
+    Args:
+        codec (Optional[Union[str, JSONCodec]]): A codec, the name of one
+        ("json", "orjson" or "msgspec"), "auto" for the fastest installed
+        one, or None to leave JSON handling to the HTTP libraries.
+
+    Returns:
+        Optional[JSONCodec]: The codec, or None.
+
+    Raises:
+        ValueError: If the codec name is unknown.
+        ImportError: If the named codec's library is not installed.
+    """
+    if codec is None or isinstance(codec, JSONCodec):
+        return codec
+    if codec == "auto":
+        for fast in (OrjsonCodec, MsgspecCodec):
+            try:
+                return fast()
+            except ImportError:
+                pass
+        return JSONCodec()
+    if codec not in _CODECS:
+        raise ValueError(f"Unknown JSON codec: {codec}")
+    return _CODECS[codec]()
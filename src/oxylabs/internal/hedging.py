@@ -0,0 +1,93 @@
+import threading
+from collections import deque
+from typing import Optional
+
+from oxylabs.utils.defaults import (
+    DEFAULT_HEDGE_MAX_RATIO,
+    DEFAULT_HEDGE_MIN_SAMPLES,
+    DEFAULT_HEDGE_PERCENTILE,
+    DEFAULT_HEDGE_WINDOW,
+)
+
+
+class HedgePolicy:
+    def __init__(
+        self,
+        percentile: float = DEFAULT_HEDGE_PERCENTILE,
+        max_ratio: float = DEFAULT_HEDGE_MAX_RATIO,
+        window: int = DEFAULT_HEDGE_WINDOW,
+        min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES,
+    ) -> None:
+        """
+        Decides when a slow realtime request is duplicated.
+
+        A request that has not answered by the configured percentile of the
+        recent latencies of its source gets a second, identical request,
+        and whichever answers first wins. Since duplicates are billed, at
+        most `max_ratio` of all requests are hedged.
+
+        Args:
+            percentile (float): The latency percentile, between 0 and 1,
+            after which a request is hedged.
+            max_ratio (float): The maximum fraction of requests hedged.
+            window (int): How many latencies are kept per source.
+            min_samples (int): Latencies needed before requests of a source
+            are hedged.
+        """
+        self._percentile = percentile
+        self._max_ratio = max_ratio
+        self._window = window
+        self._min_samples = min_samples
+        self._latencies = {}
+        self._requests = 0
+        self._hedged = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hedged(self) -> int:
+        """
+        Returns the number of requests hedged so far.
+        """
+        return self._hedged
+
+    def hedge_delay(self, source: Optional[str]) -> Optional[float]:
+        """
+        Counts a new request and returns when to hedge it.
+
+        Args:
+            source (Optional[str]): The source of the request.
+
+        Returns:
+            Optional[float]: Seconds after which to send a duplicate, or None
+            if not enough latencies of the source are known yet.
+        """
+        with self._lock:
+            self._requests += 1
+            latencies = sorted(self._latencies.get(source, ()))
+        if len(latencies) < self._min_samples:
+            return None
+        return latencies[int(self._percentile * (len(latencies) - 1))]
+
+    def acquire(self) -> bool:
+        """
+        Takes a hedge from the budget.
+
+        Returns:
+            bool: True if the request may be hedged, False if that would
+            exceed `max_ratio`.
+        """
+        with self._lock:
+            if self._hedged + 1 > self._max_ratio * self._requests:
+                return False
+            self._hedged += 1
+            return True
+
+    def record(self, source: Optional[str], latency: float) -> None:
+        """
+        Records the latency of a successful request.
+        """
+        with self._lock:
+            latencies = self._latencies.setdefault(
+                source, deque(maxlen=self._window)
+            )
+            latencies.append(latency)
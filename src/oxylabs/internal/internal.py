@@ -1,13 +1,66 @@
 import asyncio
 import base64
+import json
 import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
 
 import aiohttp
 import requests
 
+from oxylabs.internal.bulk import BulkResult, resolve_scrape_method
+from oxylabs.internal.cache import DiskCache, ResultCache, payload_key
+from oxylabs.internal.callback import CallbackServer
+from oxylabs.internal.codec import JSONCodec, get_codec
+from oxylabs.internal.hedging import HedgePolicy
+from oxylabs.internal.journal import JobJournal
+from oxylabs.internal.poller import JobPoller
+from oxylabs.internal.polling import AdaptivePollPolicy, PollPolicy
+from oxylabs.internal.rate_limit import RateLimiter
+from oxylabs.internal.retry import (
+    APIError,
+    CircuitBreaker,
+    RequestOutcome,
+    RetryableError,
+    RetryEngine,
+    RetryPolicy,
+    parse_retry_after,
+)
+from oxylabs.internal.singleflight import AsyncSingleFlight, SingleFlight
+from oxylabs.internal.streaming import ResultStream
 from oxylabs.sources.ecommerce.ecommerce import Ecommerce, EcommerceAsync
 from oxylabs.sources.serp.serp import SERP, SERPAsync
-from oxylabs.utils.defaults import ASYNC_BASE_URL, SYNC_BASE_URL
+from oxylabs.utils import utils
+from oxylabs.utils.defaults import (
+    ASYNC_BASE_URL,
+    ASYNC_BATCH_URL,
+    BATCH_MAX_QUERIES,
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_BULK_WORKERS,
+    DEFAULT_CONNECT_RETRIES,
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_POLL_RATE,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_REQUEST_TIMEOUT_ASYNC,
+    DEFAULT_STREAM_CHUNK_SIZE,
+    SYNC_BASE_URL,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -36,145 +89,1424 @@ class APICredentials:
 
 
 class BaseClient:
-    def __init__(self, base_url: str, api_credentials: APICredentials) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        api_credentials: APICredentials,
+        codec: Optional[Union[str, JSONCodec]] = None,
+        typed: bool = False,
+    ) -> None:
         self._base_url = base_url
         self._api_credentials = api_credentials
         self._headers = {
             "Content-Type": "application/json",
             "Authorization": f"Basic {self._api_credentials.get_encoded_credentials()}",
         }
+        self._codec = get_codec(codec)
+        self._structs = None
+        if typed:
+            # Requires msgspec, which is an optional dependency.
+            from oxylabs.sources import structs
+
+            self._structs = structs
+
+    def _json_body(self, payload: Optional[dict]) -> dict:
+        """
+        Returns the keyword arguments sending `payload` as the JSON body of
+        a request, encoded with the client's codec if it has one.
+        """
+        if payload is None:
+            return {}
+        if self._codec is None:
+            return {"json": payload}
+        return {"data": self._codec.dumps(payload)}
+
+    def _typed_source(self, payload: dict) -> Optional[str]:
+        """
+        Returns the source of a payload if its results are decoded into
+        typed structs, None otherwise.
+        """
+        if self._structs is None or not payload.get("parse"):
+            return None
+        source = payload.get("source")
+        return source if source in self._structs.PARSERS else None
+
+    def _decode_typed(self, body: bytes, source: str):
+        """
+        Decodes a results document into the typed structs of its source,
+        or into a plain dict if it does not match them.
+        """
+        try:
+            return self._structs.decode(body, source)
+        except self._structs.ValidationError as e:
+            logger.warning(f"Decoding {source} results untyped: {e}")
+        return (self._codec or JSONCodec()).loads(body)
 
 
 class RealtimeClient(BaseClient):
-    def __init__(self, username: str, password: str) -> None:
-        super().__init__(SYNC_BASE_URL, APICredentials(username, password))
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        connect_retries: int = DEFAULT_CONNECT_RETRIES,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        cache: Optional[Union[ResultCache, DiskCache]] = None,
+        coalesce: bool = True,
+        hedge_policy: Optional[HedgePolicy] = None,
+        keep_raw: bool = True,
+        codec: Optional[Union[str, JSONCodec]] = None,
+        typed: bool = False,
+        spill_threshold: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+    ) -> None:
+        """
+        Initializes an instance of RealtimeClient.
+
+        The client keeps a pooled keep-alive HTTP session, so consecutive
+        requests, including ones made from multiple threads, reuse warm
+        connections instead of opening a new one per request.
+
+        Args:
+            username (str): The username for API authentication.
+            password (str): The password for API authentication.
+            pool_connections (int): The number of host pools to cache.
+            pool_maxsize (int): The maximum number of connections kept alive
+            per host.
+            connect_retries (int): How many times to retry failed connection
+            attempts.
+            rate_limiter (Optional[RateLimiter]): Paces requests to the
+            account's rate and concurrency limits.
+            retry_policy (Optional[RetryPolicy]): Decides which failures are
+            retried and how long to back off.
+            circuit_breaker (Optional[CircuitBreaker]): Sheds requests to
+            endpoints that keep failing.
+            cache (Optional[Union[ResultCache, DiskCache]]): Serves repeated
+            requests from previously fetched results. None disables caching.
+            coalesce (bool): Whether identical requests made concurrently
+            from several threads share one round trip.
+            hedge_policy (Optional[HedgePolicy]): Sends a duplicate of
+            requests that take unusually long and uses whichever answers
+            first. None disables hedging.
+            keep_raw (bool): Whether responses keep the raw response data.
+            If False, responses are fully built and only keep the parsed
+            models, which takes less memory when many are held.
+            codec (Optional[Union[str, JSONCodec]]): Encodes payloads and
+            decodes responses. "auto" uses orjson or msgspec when installed
+            and the standard library otherwise. None leaves JSON to the HTTP
+            library.
+            typed (bool): Whether parsed results of the sources in
+            `oxylabs.sources.structs.PARSERS` are decoded straight into
+            typed structs instead of response objects. Requires msgspec.
+            spill_threshold (Optional[int]): The size in bytes, UTF-8
+            encoded, above which `content` values of responses are written
+            to scratch files and returned as SpilledContent, which reads
+            them back on demand. None keeps them in memory.
+            spill_dir (Optional[str]): The directory of the scratch files.
+            Defaults to the system's temporary directory.
+        """
+        super().__init__(
+            SYNC_BASE_URL, APICredentials(username, password), codec, typed
+        )
+        self._session = utils.create_http_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            connect_retries=connect_retries,
+        )
+        self._rate_limiter = (
+            rate_limiter if rate_limiter is not None else RateLimiter()
+        )
+        self._retry = RetryEngine(retry_policy, circuit_breaker)
+        self._cache = cache
+        self._inflight = SingleFlight() if coalesce else None
+        self._hedge_policy = hedge_policy
+        self._pool_maxsize = pool_maxsize
+        self._hedge_executor = None
+        self._hedge_lock = threading.Lock()
+        self._keep_raw = keep_raw
+        self._spill_threshold = spill_threshold
+        self._spill_dir = spill_dir
         self.serp = SERP(self)
         self.ecommerce = Ecommerce(self)
 
-    def _req(self, payload: dict, method: str, config: dict) -> dict:
+    def __enter__(self) -> "RealtimeClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the underlying HTTP session and its pooled connections.
+        """
+        with self._hedge_lock:
+            if self._hedge_executor is not None:
+                self._hedge_executor.shutdown(wait=False)
+                # Recreated by the next hedged request.
+                self._hedge_executor = None
+        self._session.close()
+
+    def _coalesce(self, payload: dict, config: dict, fetch: Callable) -> tuple:
+        """
+        Calls `fetch`, sharing the call with identical requests, i.e. the
+        same payload and config, made meanwhile from other threads.
+        """
+        if self._inflight is None:
+            return fetch()
+        key = payload_key({"payload": payload, "config": config})
+        return self._inflight.do(key, fetch)
+
+    def scrape_many(
+        self,
+        calls: Iterable[tuple],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+        ordered: bool = False,
+    ) -> Iterator[BulkResult]:
+        """
+        Runs many scrape requests on a thread pool and yields their results.
+
+        The workers share the client's connection pool, so `max_workers`
+        should not exceed the client's `pool_maxsize`. Requests are pulled
+        from the input only when a worker frees up, so memory stays bounded
+        however long the input is. Closing the generator early cancels the
+        requests not started yet and waits for the running ones.
+
+        Args:
+            calls (Iterable[tuple]): (method, params) pairs, where method
+            is a scrape method of this client, e.g.
+            `client.serp.google.scrape_search`, or its dotted path
+            "serp.google.scrape_search", and params are its keyword
+            arguments. Sources are named by their scrape method rather
+            than their API source name, so params are validated and
+            shaped the same way as in direct calls.
+            max_workers (int): The number of worker threads.
+            ordered (bool): Whether to yield results in input order instead
+            of completion order.
+
+        Yields:
+            BulkResult: The result of each call.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        def run(index: int, call: tuple) -> BulkResult:
+            try:
+                method, params = resolve_scrape_method(self, call)
+                return BulkResult(index, call, method(**params))
+            except Exception as e:
+                logger.error(f"An error occurred: {e}")
+                return BulkResult(index, call, error=e)
+
+        iterator = enumerate(calls)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        # In input order, a slow call holds back the ones after it, so
+        # the window of submitted requests is kept a bit wider.
+        window = max_workers * 2 if ordered else max_workers
+        pending = deque() if ordered else set()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < window:
+                    item = next(iterator, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    future = executor.submit(run, *item)
+                    if ordered:
+                        pending.append(future)
+                    else:
+                        pending.add(future)
+
+                if not pending:
+                    break
+
+                if ordered:
+                    yield pending.popleft().result()
+                    continue
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _req(
+        self,
+        payload: dict,
+        method: str,
+        config: dict,
+        outcome: Optional[RequestOutcome] = None,
+    ) -> dict:
         """
         Sends a HTTP request to the specified URL with the given payload
         and method.
 
+        Connection errors, 429 and 5xx responses are retried according to
+        the client's retry policy. Read timeouts are not: the request may
+        have reached the API, and sending it again would run it twice.
+
         Args:
             payload (dict): The payload to be sent with the request.
             method (str): The HTTP method to be used for the request
             (e.g., "POST", "GET").
             config (dict): Additional configuration options for the
             request.
+            outcome (Optional[RequestOutcome]): Collects the number of
+            retries and the final failure reason.
 
         Returns:
             dict: The JSON response from the server, if the request is
             successful.
                   None, if an error occurs during the request.
-
-        Raises:
-            requests.exceptions.Timeout: If the request times out.
-            requests.exceptions.HTTPError: If an HTTP error occurs.
-            requests.exceptions.RequestException: If a general request
-            error occurs.
         """
-        try:
-            if method == "POST":
-                response = requests.post(
-                    self._base_url,
-                    headers=self._headers,
-                    json=payload,
-                    timeout=config["request_timeout"],
+        outcome = outcome if outcome is not None else RequestOutcome()
+        if method != "POST":
+            logger.error(f"Unsupported method: {method}")
+            outcome.error = f"Unsupported method: {method}"
+            return None
+
+        def attempt() -> dict:
+            try:
+                with self._rate_limiter.limit(payload.get("source")):
+                    response = self._session.post(
+                        self._base_url,
+                        headers=self._headers,
+                        timeout=config["request_timeout"],
+                        **self._json_body(payload),
+                    )
+            except requests.exceptions.ConnectionError as err:
+                # Includes connect timeouts.
+                raise RetryableError(f"Connection error occurred: {err}")
+            except requests.exceptions.Timeout:
+                raise RetryableError(
+                    f"Timeout error. The request to {self._base_url} with method {method} has timed out.",
+                    retry=False,
                 )
-            else:
-                logger.error(f"Unsupported method: {method}")
-                return None
-            response.raise_for_status()
 
-            if response.status_code == 200:
+            if self._retry.policy.is_retryable_status(response.status_code):
+                raise RetryableError(
+                    f"HTTP error occurred: {response.status_code} - {response.reason}",
+                    response.status_code,
+                    parse_retry_after(response.headers.get("Retry-After")),
+                )
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError as err:
+                raise requests.exceptions.HTTPError(
+                    f"HTTP error occurred: {err} - {response.text}"
+                )
+            typed_source = self._typed_source(payload)
+            if typed_source is not None:
+                return self._decode_typed(response.content, typed_source)
+            if self._codec is None:
                 return response.json()
-            else:
-                logger.error(f"Error occurred: {response.status_code}")
-                return None
+            return self._codec.loads(response.content)
 
-        except requests.exceptions.Timeout:
-            logger.error(
-                f"Timeout error. The request to {self._base_url} with method {method} has timed out."
-            )
-            return None
-        except requests.exceptions.HTTPError as err:
-            logger.error(f"HTTP error occurred: {err}")
-            logger.error(response.text)
-            return None
-        except requests.exceptions.RequestException as err:
-            logger.error(f"Error occurred: {err}")
+        def send(send_outcome: RequestOutcome) -> dict:
+            return self._retry.call(self._base_url, attempt, send_outcome)
+
+        try:
+            if self._hedge_policy is None:
+                return send(outcome)
+            return self._send_hedged(payload.get("source"), send, outcome)
+        except Exception as err:
+            logger.error(str(err))
             return None
 
+    def _send_hedged(
+        self, source: Optional[str], send: Callable, outcome: RequestOutcome
+    ) -> dict:
+        """
+        Sends a request and, if it has not answered by the hedge delay of
+        its source, a duplicate of it. The first successful answer wins.
+
+        The losing request cannot be interrupted mid-flight. It is dropped if
+        it has not started yet, otherwise its answer is ignored.
+
+        Args:
+            source (Optional[str]): The source of the request.
+            send (Callable): Sends the request, collecting its retries and
+            failure reason in the given RequestOutcome.
+            outcome (RequestOutcome): Collects the retries and failure
+            reason of the winning request.
+
+        Returns:
+            dict: The JSON response of the winning request.
+        """
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                # Every hedged call occupies a worker, leave room for as
+                # many callers as the connection pool serves and their
+                # duplicates.
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=max(32, 2 * self._pool_maxsize),
+                    thread_name_prefix="oxylabs-hedge",
+                )
+        executor = self._hedge_executor
+
+        started = []
+        primary_started = threading.Event()
+
+        def send_primary(primary_outcome: RequestOutcome) -> dict:
+            started.append(time.monotonic())
+            primary_started.set()
+            return send(primary_outcome)
+
+        primary_outcome = RequestOutcome()
+        primary = executor.submit(send_primary, primary_outcome)
+        outcomes = {primary: primary_outcome}
+
+        def record_latency(future) -> None:
+            # Record every primary, including losers, to keep the latency
+            # distribution unbiased by hedging.
+            if not future.cancelled() and future.exception() is None:
+                latency = time.monotonic() - started[0]
+                self._hedge_policy.record(source, latency)
+
+        primary.add_done_callback(record_latency)
+
+        delay = self._hedge_policy.hedge_delay(source)
+        if delay is not None:
+            # Time spent queued for a worker does not count: a duplicate
+            # would queue just the same, and latencies exclude it too.
+            primary_started.wait()
+            left = started[0] + delay - time.monotonic()
+            done, _ = wait([primary], timeout=max(left, 0))
+            if not done and self._hedge_policy.acquire():
+                logger.info(f"Hedging a {source} request after {delay:.2f}s")
+                hedge_outcome = RequestOutcome()
+                outcomes[executor.submit(send, hedge_outcome)] = hedge_outcome
+
+        pending = set(outcomes)
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                winner = outcomes[future]
+                outcome.retries += winner.retries
+                try:
+                    result = future.result()
+                except Exception as e:
+                    error = e
+                    outcome.error = winner.error
+                    outcome.transient = winner.transient
+                    continue
+                for loser in pending:
+                    loser.cancel()
+                outcome.error = None
+                return result
+        raise error
+
+    def _stream_req(
+        self,
+        payload: dict,
+        config: dict,
+        spill_threshold: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+    ) -> Iterator[dict]:
+        """
+        Sends a realtime request and yields the items of its results array
+        as they arrive, without buffering the whole body.
+
+        The request is not retried, as items may have been yielded before
+        a failure.
+
+        Args:
+            payload (dict): The payload to be sent with the request.
+            config (dict): Additional configuration options for the
+            request.
+            spill_threshold (Optional[int]): The size in bytes above which
+            `content` values are written to temporary files. Defaults to
+            the client's.
+            spill_dir (Optional[str]): The directory of the spill files.
+            Defaults to the client's.
+
+        Yields:
+            dict: Each item of the results array.
+
+        Raises:
+            requests.exceptions.RequestException: If the request failed.
+            ValueError: If the body ended early.
+        """
+        stream = ResultStream(
+            (
+                spill_threshold
+                if spill_threshold is not None
+                else self._spill_threshold
+            ),
+            spill_dir or self._spill_dir,
+        )
+        with self._rate_limiter.limit(payload.get("source")):
+            response = self._session.post(
+                self._base_url,
+                headers=self._headers,
+                timeout=config["request_timeout"],
+                stream=True,
+                **self._json_body(payload),
+            )
+        try:
+            with response:
+                response.raise_for_status()
+                for chunk in response.iter_content(DEFAULT_STREAM_CHUNK_SIZE):
+                    yield from stream.feed(chunk)
+            stream.close()
+        finally:
+            # Drops a value half spilled when the body failed or the caller
+            # stopped reading.
+            stream.abort()
+
 
 class AsyncClient(BaseClient):
-    def __init__(self, username: str, password: str) -> None:
-        super().__init__(ASYNC_BASE_URL, APICredentials(username, password))
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        callback_server: Optional[CallbackServer] = None,
+        poll_policy: Optional[PollPolicy] = None,
+        poll_rate: float = DEFAULT_POLL_RATE,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        connection_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        cache: Optional[Union[ResultCache, DiskCache]] = None,
+        coalesce: bool = True,
+        journal: Optional[JobJournal] = None,
+        keep_raw: bool = True,
+        codec: Optional[Union[str, JSONCodec]] = None,
+        typed: bool = False,
+        spill_threshold: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+    ) -> None:
+        """
+        Initializes an instance of AsyncClient.
+
+        Every vertical of the client shares a single HTTP session. Used as
+        `async with AsyncClient(...)`, the session is kept open until the
+        block exits. Otherwise it is closed whenever no request is running.
+
+        Args:
+            username (str): The username for API authentication.
+            password (str): The password for API authentication.
+            callback_server (Optional[CallbackServer]): A started callback
+            server. When set, jobs are submitted with its URL as
+            `callback_url` and complete on notification instead of polling.
+            poll_policy (Optional[PollPolicy]): Schedules job status checks.
+            Defaults to an AdaptivePollPolicy.
+            poll_rate (float): The maximum number of job status checks per
+            second, shared by every pending job of the client.
+            connection_limit (int): The maximum number of simultaneous
+            connections. 0 means no limit.
+            connection_limit_per_host (int): The maximum number of
+            simultaneous connections to the same host. 0 means no limit.
+            dns_cache_ttl (int): Seconds to cache resolved DNS entries.
+            keepalive_timeout (float): Seconds to keep idle connections open.
+            rate_limiter (Optional[RateLimiter]): Paces job submissions and
+            caps the number of jobs in flight to the account's limits.
+            retry_policy (Optional[RetryPolicy]): Decides which failures are
+            retried and how long to back off.
+            circuit_breaker (Optional[CircuitBreaker]): Sheds requests to
+            endpoints that keep failing.
+            cache (Optional[Union[ResultCache, DiskCache]]): Serves repeated
+            requests from previously fetched results. None disables caching.
+            coalesce (bool): Whether identical requests made concurrently
+            share one job.
+            journal (Optional[JobJournal]): Records submitted jobs so that
+            they are awaited again instead of resubmitted after a restart.
+            keep_raw (bool): Whether responses keep the raw response data.
+            If False, responses are fully built and only keep the parsed
+            models, which takes less memory when many are held.
+            codec (Optional[Union[str, JSONCodec]]): Encodes payloads and
+            decodes responses. "auto" uses orjson or msgspec when installed
+            and the standard library otherwise. None leaves JSON to the HTTP
+            library.
+            typed (bool): Whether parsed results of the sources in
+            `oxylabs.sources.structs.PARSERS` are decoded straight into
+            typed structs instead of response objects. Requires msgspec.
+            spill_threshold (Optional[int]): The size in bytes, UTF-8
+            encoded, above which `content` values of responses are written
+            to scratch files and returned as SpilledContent, which reads
+            them back on demand. None keeps them in memory.
+            spill_dir (Optional[str]): The directory of the scratch files.
+            Defaults to the system's temporary directory.
+        """
+        super().__init__(
+            ASYNC_BASE_URL, APICredentials(username, password), codec, typed
+        )
+        self._callback_server = callback_server
+        self._poll_policy = (
+            poll_policy if poll_policy is not None else AdaptivePollPolicy()
+        )
+        self._poller = JobPoller(self, poll_rate)
+        self._rate_limiter = (
+            rate_limiter if rate_limiter is not None else RateLimiter()
+        )
+        self._retry = RetryEngine(retry_policy, circuit_breaker)
+        self._cache = cache
+        self._inflight = AsyncSingleFlight() if coalesce else None
+        self._journal = journal
+        self._keep_raw = keep_raw
+        self._spill_threshold = spill_threshold
+        self._spill_dir = spill_dir
+        self._cancellations = {}
+        self._typed_jobs = {}
+        self._connector_options = {
+            "limit": connection_limit,
+            "limit_per_host": connection_limit_per_host,
+            "ttl_dns_cache": dns_cache_ttl,
+            "keepalive_timeout": keepalive_timeout,
+        }
+        self._session = None
+        self._requests = 0
+        self._managed = False
         self.serp = SERPAsync(self)
         self.ecommerce = EcommerceAsync(self)
 
+    async def __aenter__(self) -> "AsyncClient":
+        self._managed = True
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # Let job cancellations sent on the way out reach the API.
+        if self._cancellations:
+            await asyncio.gather(
+                *self._cancellations.values(), return_exceptions=True
+            )
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the shared HTTP session and its pooled connections.
+        """
+        self._managed = False
+        await self._close_session()
+
+    async def _close_session(self) -> None:
+        """
+        Closes the shared HTTP session, which the next request reopens.
+        """
+        session, self._session = self._session, None
+        await utils.close(session)
+
+    async def _acquire_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared HTTP session, creating it if needed, and counts
+        the caller as a running request.
+
+        Every call must be paired with `_release_session`.
+
+        Returns:
+            aiohttp.ClientSession: The shared session.
+        """
+        self._requests += 1
+        self._session = await utils.ensure_session(
+            self._session, self._connector_options
+        )
+        return self._session
+
+    async def _release_session(self) -> None:
+        """
+        Marks a request as finished, closing the shared session once no
+        request is running unless the client is used as a context manager.
+        """
+        self._requests -= 1
+        if self._requests == 0 and not self._managed:
+            # Only the session is closed when idle, the client stays usable.
+            await self._close_session()
+
+    async def _coalesce(
+        self, payload: dict, config: dict, fetch: Callable
+    ) -> tuple:
+        """
+        Awaits `fetch()`, sharing the call with identical requests, i.e. the
+        same payload and config, made meanwhile by other coroutines. Calls
+        with different timeouts, poll intervals or deadlines are not shared,
+        so no caller waits longer than it asked for.
+        """
+        if self._inflight is None:
+            return await fetch()
+        key = payload_key({"payload": payload, "config": config})
+        return await self._inflight.do(key, fetch)
+
+    async def _cache_get(self, payload: dict) -> Optional[dict]:
+        """
+        Returns the cached result of a payload, if the client has a cache.
+        A DiskCache is read on a worker thread so that its file I/O does not
+        block the event loop.
+        """
+        if self._cache is None:
+            return None
+        if not isinstance(self._cache, DiskCache):
+            return self._cache.get(payload)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._cache.get, payload)
+
+    async def _cache_set(self, payload: dict, result: dict) -> None:
+        """
+        Caches the result of a payload, if the client has a cache. A
+        DiskCache is written on a worker thread.
+        """
+        if self._cache is None:
+            return
+        if not isinstance(self._cache, DiskCache):
+            self._cache.set(payload, result)
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._cache.set, payload, result)
+
+    async def scrape_many(
+        self,
+        calls: Union[Iterable[tuple], AsyncIterator[tuple]],
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        stop_after: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[BulkResult]:
+        """
+        Runs many scrape requests with at most `concurrency` in flight and
+        yields their results as they complete.
+
+        Requests are pulled from the input only when a slot frees up, so
+        memory stays bounded however long the input is. Closing the
+        generator early with `aclose()`, or reaching `stop_after`, cancels
+        the requests still in flight along with their jobs.
+
+        Args:
+            calls (Union[Iterable[tuple], AsyncIterator[tuple]]): (method,
+            params) pairs, where method is a scrape method of this client,
+            e.g. `client.serp.google.scrape_search`, or its dotted path
+            "serp.google.scrape_search", and params are its keyword
+            arguments. Sources are named by their scrape method rather
+            than their API source name, so params are validated and
+            shaped the same way as in direct calls.
+            concurrency (int): The maximum number of requests in flight.
+            stop_after (Optional[int]): Stop once this many requests
+            succeeded. None runs every request.
+            deadline (Optional[float]): Seconds the whole run may take.
+            Once they passed, the requests still in flight are cancelled
+            along with their jobs and the rest are not started. Per call
+            deadlines can be passed in params on top of it.
+
+        Yields:
+            BulkResult: The result of each call, in completion order.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        async def run(index: int, call: tuple) -> BulkResult:
+            try:
+                method, params = resolve_scrape_method(self, call)
+                response = await method(**params)
+                return BulkResult(index, call, response)
+            except Exception as e:
+                logger.error(f"An error occurred: {e}")
+                return BulkResult(index, call, error=e)
+
+        if hasattr(calls, "__aiter__"):
+            iterator = calls.__aiter__()
+
+            async def next_call():
+                return await iterator.__anext__()
+
+        else:
+            iterator = iter(calls)
+
+            async def next_call():
+                try:
+                    return next(iterator)
+                except StopIteration:
+                    raise StopAsyncIteration
+
+        loop = asyncio.get_running_loop()
+        deadline_at = None if deadline is None else loop.time() + deadline
+        # Keep the shared session open for the whole run.
+        await self._acquire_session()
+        pending = set()
+        index = 0
+        succeeded = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < concurrency:
+                    try:
+                        call = await next_call()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.add(asyncio.ensure_future(run(index, call)))
+                    index += 1
+
+                if not pending:
+                    break
+
+                timeout = None
+                if deadline_at is not None:
+                    timeout = max(deadline_at - loop.time(), 0)
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    logger.error("Deadline exceeded")
+                    return
+                for task in done:
+                    result = task.result()
+                    yield result
+                    succeeded += result.ok
+                    if stop_after is not None and succeeded >= stop_after:
+                        return
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            await self._release_session()
+
+    async def resume(
+        self,
+        request_timeout: Optional[int] = None,
+        job_completion_timeout: Optional[int] = None,
+        poll_interval: Optional[int] = None,
+    ) -> List[BulkResult]:
+        """
+        Awaits the jobs the client's journal recorded as pending, e.g. after
+        a crash, and fetches their results without resubmitting them.
+
+        Results are stored in the client's cache, if any, so rerunning the
+        interrupted workload afterwards only submits what is missing. Like
+        the jobs of a batch, at most as many jobs as the rate limiter's
+        concurrency limit, or DEFAULT_BULK_CONCURRENCY without one, are
+        awaited at a time.
+
+        Args:
+            request_timeout (Optional[int]): The timeout in seconds for each
+            request.
+            job_completion_timeout (Optional[int]): The interval in seconds
+            for each job to time out if it does not complete.
+            poll_interval (Optional[int]): The interval in seconds to poll
+            the server for job status.
+
+        Returns:
+            List[BulkResult]: One result per pending job, with the journaled
+            payload as request and the API result as response.
+        """
+        if self._journal is None:
+            raise ValueError("resume needs a client with a journal")
+
+        config = utils.prepare_config(
+            request_timeout=request_timeout,
+            poll_interval=poll_interval,
+            job_completion_timeout=job_completion_timeout,
+            async_integration=True,
+        )
+        pending = self._journal.pending()
+        for job_id, payload in pending:
+            self._register_typed(job_id, payload)
+        outcomes = [RequestOutcome() for _ in pending]
+        session = await self._acquire_session()
+
+        try:
+            # Bounded like the jobs of a batch, however long the journal is.
+            results = await self._wait_for_results(
+                [job_id for job_id, _ in pending],
+                [payload.get("source") for _, payload in pending],
+                config,
+                session,
+                outcomes,
+            )
+        finally:
+            await self._release_session()
+
+        resumed = []
+        for index, ((_, payload), result, outcome) in enumerate(
+            zip(pending, results, outcomes)
+        ):
+            if result is None:
+                error = Exception(outcome.error or "Failed to get job results")
+                resumed.append(BulkResult(index, payload, error=error))
+                continue
+            await self._cache_set(payload, result)
+            resumed.append(BulkResult(index, payload, result))
+        return resumed
+
+    def _register_typed(self, job_id: str, payload: dict) -> None:
+        """
+        Remembers that the results of a job are decoded into typed structs,
+        if its payload asks for a typed source.
+        """
+        typed_source = self._typed_source(payload)
+        if typed_source is not None:
+            self._typed_jobs[job_id] = typed_source
+
+    def _prepare_payload(self, payload: dict) -> dict:
+        """
+        Points the job callback at the attached callback server, unless the
+        payload already has its own callback URL.
+
+        Args:
+            payload (dict): The payload to prepare.
+
+        Returns:
+            dict: The payload to submit.
+        """
+        if self._callback_server is None or payload.get("callback_url"):
+            return payload
+        return {**payload, "callback_url": self._callback_server.url}
+
+    async def _request_json(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        user_session: aiohttp.ClientSession,
+        request_timeout: Optional[float] = None,
+        payload: Optional[dict] = None,
+        outcome: Optional[RequestOutcome] = None,
+        typed_source: Optional[str] = None,
+    ) -> dict:
+        """
+        Sends a request to the API and returns its JSON body.
+
+        Transient failures (timeouts, connection errors, 429 and 5xx
+        responses) are retried according to the client's retry policy.
+        POST requests are not idempotent, so they are only retried if they
+        failed to connect or got a retryable status, not after a timeout
+        or a dropped connection, when the API may have received them.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL to send the request to.
+            endpoint (str): The endpoint name the circuit is tracked for.
+            user_session (aiohttp.ClientSession): The client session used for
+            making the request.
+            request_timeout (Optional[float]): The timeout for each attempt in
+            seconds.
+            payload (Optional[dict]): The JSON payload to send.
+            outcome (Optional[RequestOutcome]): Collects the number of
+            retries and the final failure reason.
+            typed_source (Optional[str]): Decodes the body into the typed
+            structs of this source.
+
+        Returns:
+            dict: The JSON response data.
+
+        Raises:
+            Exception: If the request failed and could not be retried.
+        """
+        idempotent = method != "POST"
+
+        async def attempt() -> dict:
+            try:
+                async with user_session.request(
+                    method,
+                    url,
+                    headers=self._headers,
+                    timeout=request_timeout,
+                    **self._json_body(payload),
+                ) as response:
+                    if self._retry.policy.is_retryable_status(response.status):
+                        raise RetryableError(
+                            f"HTTP error occurred: {response.status} - {response.reason}",
+                            response.status,
+                            parse_retry_after(
+                                response.headers.get("Retry-After")
+                            ),
+                        )
+                    if response.status >= 400:
+                        message = self._error_message(await response.read())
+                        raise APIError(
+                            f"HTTP error occurred: {response.status} - {response.reason} - {message}",
+                            response.status,
+                        )
+                    if typed_source is not None:
+                        return self._decode_typed(
+                            await response.read(), typed_source
+                        )
+                    if self._codec is None:
+                        return await response.json(content_type=None)
+                    body = await response.read()
+                    return self._codec.loads(body) if body else None
+            except aiohttp.ClientConnectorError as e:
+                raise RetryableError(f"Connection error occurred: {e}")
+            except asyncio.TimeoutError:
+                raise RetryableError(
+                    f"Timeout error. The request to {url} has timed out.",
+                    retry=idempotent,
+                )
+            except aiohttp.ClientConnectionError as e:
+                raise RetryableError(
+                    f"Connection error occurred: {e}", retry=idempotent
+                )
+
+        return await self._retry.call_async(endpoint, attempt, outcome)
+
+    @staticmethod
+    def _error_message(body: bytes) -> Optional[str]:
+        """
+        Returns the message of an error response body: its "message" field
+        if it is a JSON object, otherwise the start of its text, or None if
+        it is empty.
+        """
+        try:
+            data = json.loads(body)
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
+            return data.get("message")
+        text = body.decode("utf-8", "replace").strip()
+        # Error pages may be whole HTML documents.
+        return text[:200] or None
+
     async def _get_job_id(
         self,
         payload: dict,
         user_session: aiohttp.ClientSession,
         request_timeout: int,
+        outcome: Optional[RequestOutcome] = None,
     ) -> str:
         try:
-            async with user_session.post(
+            data = await self._request_json(
+                "POST",
                 self._base_url,
-                headers=self._headers,
-                json=payload,
-                timeout=request_timeout,
-            ) as response:
-                data = await response.json()
-                response.raise_for_status()
-                return data["id"]
-        except aiohttp.ClientResponseError as e:
-            logger.error(
-                f"HTTP error occurred: {e.status} - {e.message} - {data['message']}"
-            )
-        except aiohttp.ClientConnectionError as e:
-            logger.error(f"Connection error occurred: {e}")
-        except asyncio.TimeoutError:
-            logger.error(
-                f"Timeout error. The request to {self._base_url} has timed out."
+                self._base_url,
+                user_session,
+                request_timeout,
+                payload,
+                outcome,
             )
+            self._register_typed(data["id"], payload)
+            return data["id"]
         except Exception as e:
             logger.error(f"Error occurred: {str(e)}")
             return None
 
+    async def submit_batch(
+        self,
+        payloads: List[dict],
+        request_timeout: Optional[int] = None,
+        user_session: Optional[aiohttp.ClientSession] = None,
+    ) -> List[Optional[str]]:
+        """
+        Submits many queries through the batch endpoint.
+
+        Payloads that differ only in their `query` or `url` value are packed
+        into a single batch submission, split into chunks of at most
+        BATCH_MAX_QUERIES values.
+
+        Args:
+            payloads (List[dict]): The payloads to submit, shaped like the
+            ones built by the `scrape_*` methods.
+            request_timeout (Optional[int]): The timeout in seconds for each
+            batch submission.
+            user_session (Optional[aiohttp.ClientSession]): The session to
+            submit with. The client's shared session is used if not
+            provided.
+
+        Returns:
+            List[Optional[str]]: The job IDs in the same order as the
+            payloads, with None for queries that failed to submit.
+        """
+        config = utils.prepare_config(
+            request_timeout=request_timeout, async_integration=True
+        )
+        originals = payloads
+        payloads = [self._prepare_payload(payload) for payload in payloads]
+        job_ids: List[Optional[str]] = [None] * len(payloads)
+        if self._journal is not None:
+            job_ids = [
+                self._journal.pending_job(payload) for payload in originals
+            ]
+            for job_id, payload in zip(job_ids, payloads):
+                if job_id is not None:
+                    self._register_typed(job_id, payload)
+            if all(job_ids):
+                return job_ids
+        session = user_session or await self._acquire_session()
+
+        try:
+            # Payloads with a pending journaled job are not resubmitted.
+            missing = [i for i, job_id in enumerate(job_ids) if job_id is None]
+            groups = self._group_batch([payloads[i] for i in missing])
+            for (field, shared_json), indexes in groups.items():
+                shared = json.loads(shared_json)
+                indexes = [missing[i] for i in indexes]
+                for start in range(0, len(indexes), BATCH_MAX_QUERIES):
+                    chunk = indexes[start : start + BATCH_MAX_QUERIES]
+                    await self._rate_limiter.wait_async(
+                        shared.get("source"), len(chunk)
+                    )
+                    ids = await self._submit_batch_chunk(
+                        field,
+                        shared,
+                        [payloads[i][field] for i in chunk],
+                        session,
+                        config["request_timeout"],
+                    )
+                    typed_source = self._typed_source(shared)
+                    submitted = []
+                    for i, job_id in zip(chunk, ids):
+                        job_ids[i] = job_id
+                        if job_id is None:
+                            continue
+                        if typed_source is not None:
+                            self._typed_jobs[job_id] = typed_source
+                        submitted.append((job_id, originals[i]))
+                    await self._record_submitted(submitted)
+        finally:
+            if user_session is None:
+                await self._release_session()
+
+        return job_ids
+
+    @staticmethod
+    def _group_batch(payloads: List[dict]) -> dict:
+        """
+        Groups payload indexes by the parameters they share.
+
+        Args:
+            payloads (List[dict]): The payloads to group.
+
+        Returns:
+            dict: Maps (field, shared parameters as JSON) to the indexes of
+            the payloads in that group.
+        """
+        groups = {}
+        for i, payload in enumerate(payloads):
+            field = "query" if "query" in payload else "url"
+            if field not in payload:
+                raise ValueError("Batch payloads need a query or url value")
+            shared = {k: v for k, v in payload.items() if k != field}
+            key = (field, json.dumps(shared, sort_keys=True))
+            groups.setdefault(key, []).append(i)
+        return groups
+
+    async def _submit_batch_chunk(
+        self,
+        field: str,
+        shared: dict,
+        values: list,
+        user_session: aiohttp.ClientSession,
+        request_timeout: int,
+    ) -> List[Optional[str]]:
+        """
+        Submits a single batch request.
+
+        Args:
+            field (str): The payload key holding the per-query value.
+            shared (dict): The parameters shared by every query in the batch.
+            values (list): The per-query values.
+            user_session (aiohttp.ClientSession): The session to submit with.
+            request_timeout (int): The timeout for the request in seconds.
+
+        Returns:
+            List[Optional[str]]: The job IDs, in the order of the values.
+        """
+        payload = {**shared, field: values}
+        try:
+            data = await self._request_json(
+                "POST",
+                ASYNC_BATCH_URL,
+                ASYNC_BATCH_URL,
+                user_session,
+                request_timeout,
+                payload,
+            )
+            return [query["id"] for query in data["queries"]]
+        except Exception as e:
+            logger.error(f"Error occurred: {str(e)}")
+        return [None] * len(values)
+
+    async def _run_batch(
+        self,
+        payloads: List[dict],
+        config: dict,
+        user_session: aiohttp.ClientSession,
+        outcomes: List[RequestOutcome],
+    ) -> list:
+        """
+        Submits payloads through the batch endpoint and waits for their
+        results, within the call's deadline.
+
+        With a concurrency limit, every job holds one of the rate limiter's
+        slots from its submission until its results are fetched, so the
+        payloads are submitted in chunks as slots free up. Without one, all
+        payloads are submitted at once and at most DEFAULT_BULK_CONCURRENCY
+        jobs are waited for at a time.
+
+        Args:
+            payloads (List[dict]): The payloads to scrape.
+            config (dict): The configuration for the request, with its
+            deadline started.
+            user_session (aiohttp.ClientSession): The session to use.
+            outcomes (List[RequestOutcome]): Collect how each job went.
+
+        Returns:
+            list: The results in the same order as the payloads, with None
+            for jobs that failed.
+        """
+        slots = self._rate_limiter.async_slots()
+        if slots is None:
+            job_ids = await self._submit_until_deadline(
+                payloads, config, user_session, outcomes
+            )
+            return await self._wait_for_results(
+                job_ids,
+                [payload["source"] for payload in payloads],
+                config,
+                user_session,
+                outcomes,
+            )
+
+        results = [None] * len(payloads)
+
+        async def held_result(index: int, job_id: Optional[str]) -> None:
+            try:
+                results[index] = await self._get_job_result(
+                    job_id,
+                    config,
+                    user_session,
+                    payloads[index]["source"],
+                    outcomes[index],
+                )
+            finally:
+                slots.release()
+
+        tasks = []
+        held = 0
+        start = 0
+        try:
+            while start < len(payloads):
+                acquired = await self._run_until_deadline(
+                    slots.acquire(), config, outcomes[start]
+                )
+                if not acquired:
+                    for outcome in outcomes[start + 1 :]:
+                        outcome.error = outcomes[start].error
+                    break
+                held = 1
+                # Submit as many payloads as there are free slots.
+                while (
+                    start + held < len(payloads)
+                    and held < BATCH_MAX_QUERIES
+                    and not slots.locked()
+                ):
+                    await slots.acquire()
+                    held += 1
+                end = start + held
+                job_ids = await self._submit_until_deadline(
+                    payloads[start:end],
+                    config,
+                    user_session,
+                    outcomes[start:end],
+                )
+                for index, job_id in enumerate(job_ids, start):
+                    tasks.append(
+                        asyncio.ensure_future(held_result(index, job_id))
+                    )
+                held = 0
+                start = end
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            for _ in range(held):
+                slots.release()
+        return results
+
+    async def _wait_for_results(
+        self,
+        job_ids: List[Optional[str]],
+        sources: List[Optional[str]],
+        config: dict,
+        user_session: aiohttp.ClientSession,
+        outcomes: List[RequestOutcome],
+    ) -> list:
+        """
+        Waits for the results of submitted jobs, holding a concurrency slot
+        of the rate limiter per job, or one of DEFAULT_BULK_CONCURRENCY
+        slots without a limit, so that only that many jobs are polled at a
+        time.
+
+        Returns:
+            list: The results in the same order as the job IDs, with None
+            for jobs that failed.
+        """
+        slots = self._rate_limiter.async_slots() or asyncio.Semaphore(
+            DEFAULT_BULK_CONCURRENCY
+        )
+
+        async def result(index: int, job_id: Optional[str]):
+            async with slots:
+                return await self._get_job_result(
+                    job_id,
+                    config,
+                    user_session,
+                    sources[index],
+                    outcomes[index],
+                )
+
+        return await asyncio.gather(
+            *(result(i, job_id) for i, job_id in enumerate(job_ids))
+        )
+
+    async def _submit_until_deadline(
+        self,
+        payloads: List[dict],
+        config: dict,
+        user_session: aiohttp.ClientSession,
+        outcomes: List[RequestOutcome],
+    ) -> List[Optional[str]]:
+        """
+        Submits payloads through the batch endpoint within the call's
+        deadline.
+
+        Returns:
+            List[Optional[str]]: The job IDs in the same order as the
+            payloads, with None for payloads that failed to submit.
+        """
+        submission = RequestOutcome()
+        job_ids = await self._run_until_deadline(
+            self.submit_batch(
+                payloads,
+                self._time_left(config, config["request_timeout"]),
+                user_session,
+            ),
+            config,
+            submission,
+        )
+        if job_ids is None:
+            job_ids = [None] * len(payloads)
+            for outcome in outcomes:
+                outcome.error = submission.error
+        return job_ids
+
     async def _poll_job_status(
         self,
         job_id: str,
         poll_interval: int,
         user_session: aiohttp.ClientSession,
         timeout: int,
+        source: Optional[str] = None,
     ) -> bool:
-        job_status_url = f"{self._base_url}/{job_id}"
-        end_time = asyncio.get_event_loop().time() + timeout
-        while asyncio.get_event_loop().time() < end_time:
-            try:
-                async with user_session.get(
-                    job_status_url,
-                    headers=self._headers,
-                    timeout=poll_interval,
-                ) as response:
-                    data = await response.json()
-                    response.raise_for_status()
-                    if data["status"] == "done":
-                        return True
-                    elif data["status"] == "faulted":
-                        raise Exception("Job faulted")
-            except Exception as e:
-                logger.error(f"Error occurred: {str(e)}")
-                return False
-            await asyncio.sleep(poll_interval)
+        """
+        Polls the status of a job until it completes, through the client's
+        shared job poller.
+
+        Args:
+            job_id (str): The ID of the job.
+            poll_interval (int): The poll interval configured for the call.
+            user_session (aiohttp.ClientSession): The client session used for
+            the status checks.
+            timeout (int): The job completion timeout in seconds.
+            source (Optional[str]): The source of the job.
+
+        Returns:
+            bool: True if the job completed successfully, False otherwise.
+        """
+        return await self._poller.wait(
+            job_id, poll_interval, user_session, timeout, source
+        )
+
+    async def _get_job_status(
+        self,
+        job_id: str,
+        user_session: aiohttp.ClientSession,
+        request_timeout: int,
+    ) -> str:
+        """
+        Fetches the current status of a job.
+
+        Args:
+            job_id (str): The ID of the job.
+            user_session (aiohttp.ClientSession): The client session used for
+            making the request.
+            request_timeout (int): The timeout for the request in seconds.
+
+        Returns:
+            str: The job status, e.g. "pending", "done" or "faulted".
+        """
+        data = await self._request_json(
+            "GET",
+            f"{self._base_url}/{job_id}",
+            f"{self._base_url}/{{job_id}}",
+            user_session,
+            request_timeout,
+        )
+        return data["status"]
+
+    async def _wait_for_job(
+        self,
+        job_id: str,
+        poll_interval: int,
+        user_session: aiohttp.ClientSession,
+        timeout: int,
+        source: Optional[str] = None,
+    ) -> bool:
+        """
+        Waits for a job to complete, using the callback server if one is
+        attached and polling otherwise.
+
+        Jobs whose callback does not arrive within the server's
+        `fallback_after` window are polled for the rest of the timeout.
+        Completion times are fed back to the poll policy.
+
+        Args:
+            job_id (str): The ID of the job.
+            poll_interval (int): The interval in seconds between polls.
+            user_session (aiohttp.ClientSession): The client session used for
+            polling.
+            timeout (int): The job completion timeout in seconds.
+            source (Optional[str]): The source of the job.
+
+        Returns:
+            bool: True if the job completed successfully, False otherwise.
+        """
+        loop = asyncio.get_event_loop()
+        start_time = loop.time()
+        status = None
+
+        if self._callback_server is not None:
+            wait = min(self._callback_server.fallback_after, timeout)
+            status = await self._callback_server.wait_for(job_id, wait)
+            if status is None:
+                logger.info(
+                    f"No callback received for job {job_id}, falling back to polling"
+                )
 
-        logger.info("Job completion timeout exceeded")
-        return False
+        if status is not None:
+            if status == "faulted":
+                logger.error("Error occurred: Job faulted")
+            job_completed = status == "done"
+        else:
+            job_completed = await self._poll_job_status(
+                job_id,
+                poll_interval,
+                user_session,
+                max(timeout - (loop.time() - start_time), poll_interval),
+                source,
+            )
+
+        if job_completed:
+            self._poll_policy.record(source, loop.time() - start_time)
+        return job_completed
 
     async def _get_http_resp(
-        self, job_id: str, user_session: aiohttp.ClientSession
+        self,
+        job_id: str,
+        user_session: aiohttp.ClientSession,
+        outcome: Optional[RequestOutcome] = None,
+        request_timeout: Optional[float] = None,
+        typed_source: Optional[str] = None,
     ) -> dict:
         """
         Retrieves the HTTP response for a given job ID.
@@ -183,55 +1515,449 @@ class AsyncClient(BaseClient):
             job_id (str): The ID of the job.
             user_session (aiohttp.ClientSession): The client session used for
             making the request.
+            outcome (Optional[RequestOutcome]): Collects the number of
+            retries and the final failure reason.
+            request_timeout (Optional[float]): The timeout for each attempt
+            in seconds.
+            typed_source (Optional[str]): Decodes the results into the typed
+            structs of this source. Defaults to the source the job was
+            registered with when submitted, if any.
 
         Returns:
-            dict: The JSON response data.
+            dict: The JSON response data, or None if an error occurred.
+        """
+        if typed_source is None:
+            typed_source = self._typed_jobs.pop(job_id, None)
+        try:
+            return await self._request_json(
+                "GET",
+                f"{self._base_url}/{job_id}/results",
+                f"{self._base_url}/{{job_id}}/results",
+                user_session,
+                request_timeout,
+                outcome=outcome,
+                typed_source=typed_source,
+            )
+        except Exception as e:
+            logger.error(f"An error occurred: {e}")
+        return None
+
+    async def _execute_with_timeout(
+        self,
+        payload: dict,
+        config: dict,
+        user_session: aiohttp.ClientSession,
+        outcome: Optional[RequestOutcome] = None,
+    ) -> dict:
+        """
+        Submits a job, waits for it to complete and fetches its results.
+
+        If the config has a deadline, the whole call, including waiting for
+        the rate limiter, is bounded by it, and every request is given at
+        most the time left.
+
+        Args:
+            payload (dict): The payload of the job.
+            config (dict): The configuration for the request.
+            user_session (aiohttp.ClientSession): The client session used for
+            making the requests.
+            outcome (Optional[RequestOutcome]): Collects the number of
+            retries and the final failure reason.
+
+        Returns:
+            dict: The JSON response data, or None if the job failed.
+        """
+        outcome = outcome if outcome is not None else RequestOutcome()
+        config = self._start_deadline(config)
+        return await self._run_until_deadline(
+            self._execute_job(payload, config, user_session, outcome),
+            config,
+            outcome,
+        )
+
+    async def _execute_job(
+        self,
+        payload: dict,
+        config: dict,
+        user_session: aiohttp.ClientSession,
+        outcome: RequestOutcome,
+    ) -> dict:
+        original = payload
+        payload = self._prepare_payload(payload)
+        source = payload.get("source")
+
+        async with self._rate_limiter.limit_async(source):
+            job_id = None
+            if self._journal is not None:
+                # Await the job submitted before a restart, if any.
+                job_id = self._journal.pending_job(original)
+                if job_id is not None:
+                    self._register_typed(job_id, payload)
+            if job_id is None:
+                job_id = await self._submit_job(
+                    payload,
+                    user_session,
+                    self._time_left(config, config["request_timeout"]),
+                    outcome,
+                )
+                if job_id:
+                    await self._record_submitted([(job_id, original)])
+            if not job_id:
+                logger.error("Failed to get job ID")
+                outcome.error = outcome.error or "Failed to get job ID"
+                return None
+
+            return await self._get_job_result(
+                job_id, config, user_session, source, outcome
+            )
+
+    async def _stream_job(
+        self,
+        payload: dict,
+        config: dict,
+        spill_threshold: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Runs the job of a payload and yields the items of its results array
+        as they arrive, without buffering the whole body.
+
+        The results request is not retried, as items may have been yielded
+        before a failure.
+
+        Args:
+            payload (dict): The payload of the job.
+            config (dict): The configuration for the request.
+            spill_threshold (Optional[int]): The size in bytes above which
+            `content` values are written to temporary files. Defaults to
+            the client's.
+            spill_dir (Optional[str]): The directory of the spill files.
+            Defaults to the client's.
+
+        Yields:
+            dict: Each item of the results array.
 
         Raises:
-            aiohttp.ClientResponseError: If a client response error occurs.
-            aiohttp.ClientConnectionError: If a client connection error occurs.
-            asyncio.TimeoutError: If the request times out.
-            Exception: If any other error occurs.
+            Exception: If the job failed or its results could not be
+            fetched.
+            ValueError: If the body ended early.
         """
-        result_url = f"{self._base_url}/{job_id}/results"
+        payload = self._prepare_payload(payload)
+        source = payload.get("source")
+        session = await self._acquire_session()
+        stream = None
+
         try:
-            async with user_session.get(
-                result_url, headers=self._headers
+            async with self._rate_limiter.limit_async(source):
+                job_id = await self._submit_job(
+                    payload, session, config["request_timeout"]
+                )
+                if not job_id:
+                    raise Exception("Failed to get job ID")
+                # Streamed items are plain dicts, never typed structs.
+                self._typed_jobs.pop(job_id, None)
+                try:
+                    job_completed = await self._wait_for_job(
+                        job_id,
+                        config["poll_interval"],
+                        session,
+                        config["job_completion_timeout"],
+                        source,
+                    )
+                except asyncio.CancelledError:
+                    self._cancel_in_background(job_id)
+                    raise
+                if not job_completed:
+                    raise Exception("Job did not complete successfully")
+
+            stream = ResultStream(
+                (
+                    spill_threshold
+                    if spill_threshold is not None
+                    else self._spill_threshold
+                ),
+                spill_dir or self._spill_dir,
+            )
+            async with session.request(
+                "GET",
+                f"{self._base_url}/{job_id}/results",
+                headers=self._headers,
+                timeout=config["request_timeout"],
             ) as response:
-                data = await response.json()
                 response.raise_for_status()
-                return data
-        except aiohttp.ClientResponseError as e:
-            logger.error(
-                f"HTTP error occurred: {e.status} - {e.message} - {data['message']}"
-            )
-        except aiohttp.ClientConnectionError as e:
-            logger.error(f"Connection error occurred: {e}")
+                async for chunk in response.content.iter_chunked(
+                    DEFAULT_STREAM_CHUNK_SIZE
+                ):
+                    for item in stream.feed(chunk):
+                        yield item
+            stream.close()
+        finally:
+            if stream is not None:
+                stream.abort()
+            await self._release_session()
+
+    @staticmethod
+    def _start_deadline(config: dict) -> dict:
+        """
+        Starts the clock of the config's deadline, if it has one.
+
+        Returns:
+            dict: The config with the absolute deadline in "deadline_at".
+        """
+        if config.get("deadline") is None or "deadline_at" in config:
+            return config
+        loop = asyncio.get_running_loop()
+        return {**config, "deadline_at": loop.time() + config["deadline"]}
+
+    @staticmethod
+    def _time_left(
+        config: dict, limit: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Returns the seconds left until the config's deadline, capped by
+        `limit`, or `limit` if the config has no deadline.
+        """
+        deadline_at = config.get("deadline_at")
+        if deadline_at is None:
+            return limit
+        left = deadline_at - asyncio.get_running_loop().time()
+        return left if limit is None else min(limit, left)
+
+    async def _run_until_deadline(
+        self, awaitable: Awaitable, config: dict, outcome: RequestOutcome
+    ):
+        """
+        Awaits `awaitable`, giving up once the config's deadline passes.
+
+        Returns:
+            The result of the awaitable, or None if the deadline passed.
+        """
+        left = self._time_left(config)
+        if left is None:
+            return await awaitable
+        try:
+            if left <= 0:
+                awaitable.close()
+                raise asyncio.TimeoutError
+            return await asyncio.wait_for(awaitable, left)
         except asyncio.TimeoutError:
-            logger.error(
-                f"Timeout error. The request to {result_url} has timed out."
+            logger.error("Deadline exceeded")
+            outcome.error = "Deadline exceeded"
+        return None
+
+    async def cancel_job(
+        self, job_id: str, request_timeout: Optional[int] = None
+    ) -> bool:
+        """
+        Asks the API to cancel a job that is still pending, freeing its
+        slot. This is best effort, jobs that already started may not be
+        cancelled.
+
+        Args:
+            job_id (str): The ID of the job.
+            request_timeout (Optional[int]): The timeout for the request in
+            seconds.
+
+        Returns:
+            bool: True if the API accepted the cancellation, False otherwise.
+        """
+        await self._record_finished(job_id, "cancelled")
+        session = await self._acquire_session()
+        try:
+            await self._request_json(
+                "POST",
+                f"{self._base_url}/{job_id}/cancel",
+                f"{self._base_url}/{{job_id}}/cancel",
+                session,
+                request_timeout or DEFAULT_REQUEST_TIMEOUT_ASYNC,
             )
+            return True
         except Exception as e:
-            logger.error(f"An error occurred: {e} - {data['message']}")
-        return None
+            logger.error(f"Failed to cancel job {job_id}: {e}")
+            return False
+        finally:
+            await self._release_session()
 
-    async def _execute_with_timeout(
-        self, payload: dict, config: dict, user_session: aiohttp.ClientSession
-    ) -> dict:
+    async def _submit_job(
+        self,
+        payload: dict,
+        user_session: aiohttp.ClientSession,
+        request_timeout: float,
+        outcome: Optional[RequestOutcome] = None,
+    ) -> Optional[str]:
+        """
+        Submits a job like `_get_job_id`, but when the caller is cancelled
+        while the submission is in flight, lets it finish in the background
+        and cancels the job it created, so that it does not run unawaited.
+        """
+
+        submission = asyncio.ensure_future(
+            self._get_job_id(payload, user_session, request_timeout, outcome)
+        )
+        try:
+            return await asyncio.shield(submission)
+        except asyncio.CancelledError:
+            # Keep the shared session open until the submission finished,
+            # even once the caller released it.
+            await self._acquire_session()
+            asyncio.ensure_future(self._cancel_submitted(submission))
+            raise
 
-        request_timeout = config["request_timeout"]
-        job_completion_timeout = config["job_completion_timeout"]
-        poll_interval = config["poll_interval"]
+    async def _cancel_submitted(self, submission: asyncio.Future) -> None:
+        """
+        Awaits a submission whose caller was cancelled and cancels the job
+        it created, if any. Releases the session held for the submission.
+        """
+        try:
+            job_id = await submission
+        except Exception:
+            job_id = None
+        try:
+            if job_id:
+                self._typed_jobs.pop(job_id, None)
+                await self.cancel_job(job_id)
+        finally:
+            await self._release_session()
 
-        job_id = await self._get_job_id(payload, user_session, request_timeout)
-        if not job_id:
-            logger.error("Failed to get job ID")
+    def _cancel_in_background(self, job_id: str) -> None:
+        """
+        Cancels a job without waiting for the API to answer, so that the
+        caller can give up right away.
+        """
+        if job_id in self._cancellations:
+            return
+        task = asyncio.get_running_loop().create_task(self.cancel_job(job_id))
+        self._cancellations[job_id] = task
+        task.add_done_callback(lambda _: self._cancellations.pop(job_id, None))
+
+    async def _record_submitted(self, jobs: List[tuple]) -> None:
+        """
+        Records submitted jobs in the journal, if the client has one. The
+        journal is written on a worker thread so that its file I/O does not
+        block the event loop.
 
-        job_completed = await self._poll_job_status(
-            job_id, poll_interval, user_session, job_completion_timeout
+        Args:
+            jobs (List[tuple]): (job ID, payload) pairs.
+        """
+        if self._journal is None or not jobs:
+            return
+
+        def record() -> None:
+            for job_id, payload in jobs:
+                self._journal.record_submitted(job_id, payload)
+
+        await asyncio.get_running_loop().run_in_executor(None, record)
+
+    async def _record_finished(
+        self, job_id: str, status: str = "done"
+    ) -> None:
+        """
+        Records a finished job in the journal, if the client has one, on a
+        worker thread.
+        """
+        if self._journal is None:
+            return
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._journal.record_finished, job_id, status
         )
+
+    async def _journal_faulted(
+        self,
+        job_id: str,
+        user_session: aiohttp.ClientSession,
+        config: dict,
+    ) -> None:
+        """
+        Marks a job that did not complete as finished in the journal if it
+        faulted or the API no longer knows it, so that it is resubmitted
+        instead of awaited again. Jobs that merely timed out stay pending
+        until they expire.
+        """
+        try:
+            status = await self._get_job_status(
+                job_id, user_session, config["request_timeout"]
+            )
+        except APIError as e:
+            logger.error(f"Error occurred: {str(e)}")
+            if e.status in (404, 410):
+                await self._record_finished(job_id, "expired")
+            return
+        except Exception as e:
+            logger.error(f"Error occurred: {str(e)}")
+            return
+        if status == "faulted":
+            await self._record_finished(job_id, status)
+
+    async def _get_job_result(
+        self,
+        job_id: str,
+        config: dict,
+        user_session: aiohttp.ClientSession,
+        source: Optional[str] = None,
+        outcome: Optional[RequestOutcome] = None,
+    ) -> dict:
+        """
+        Waits for a submitted job to complete and fetches its results.
+
+        Args:
+            job_id (str): The ID of the job.
+            config (dict): The configuration for the request.
+            user_session (aiohttp.ClientSession): The client session used for
+            making the requests.
+            source (Optional[str]): The source of the job.
+            outcome (Optional[RequestOutcome]): Collects the number of
+            retries and the final failure reason.
+
+        Returns:
+            dict: The JSON response data, or None if the job has no ID or
+            the deadline passed.
+        """
+        outcome = outcome if outcome is not None else RequestOutcome()
+        if job_id is None:
+            outcome.error = outcome.error or "Failed to get job ID"
+            return None
+
+        # Taken right away, so that the entry does not outlive the job on
+        # any path below.
+        typed_source = self._typed_jobs.pop(job_id, None)
+        config = self._start_deadline(config)
+        try:
+            job_completed = await self._run_until_deadline(
+                self._wait_for_job(
+                    job_id,
+                    config["poll_interval"],
+                    user_session,
+                    self._time_left(config, config["job_completion_timeout"]),
+                    source,
+                ),
+                config,
+                outcome,
+            )
+        except asyncio.CancelledError:
+            # Nobody is waiting for the job anymore, stop it server-side.
+            self._cancel_in_background(job_id)
+            raise
+        if job_completed is None:
+            # The deadline passed, the results cannot arrive in time.
+            self._cancel_in_background(job_id)
+            return None
         if not job_completed:
             logger.error("Job did not complete successfully")
+            outcome.error = "Job did not complete successfully"
+            if self._journal is not None:
+                await self._journal_faulted(job_id, user_session, config)
 
-        result = await self._get_http_resp(job_id, user_session)
+        result = await self._run_until_deadline(
+            self._get_http_resp(
+                job_id,
+                user_session,
+                outcome,
+                self._time_left(config, config["request_timeout"]),
+                typed_source,
+            ),
+            config,
+            outcome,
+        )
+        if job_completed and result is not None:
+            await self._record_finished(job_id)
         return result
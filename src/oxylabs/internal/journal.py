@@ -0,0 +1,199 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from oxylabs.internal.cache import payload_key
+from oxylabs.utils.defaults import DEFAULT_JOURNAL_MAX_AGE
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class JobJournal:
+    def __init__(
+        self,
+        path: str,
+        fsync: bool = False,
+        max_age: float = DEFAULT_JOURNAL_MAX_AGE,
+    ) -> None:
+        """
+        Initializes an append-only journal of push-pull jobs.
+
+        Every submitted job is recorded with its payload before it is
+        awaited, and again once its results were fetched. After a crash the
+        journal tells which jobs are still pending, so they can be awaited
+        again instead of being resubmitted and billed twice.
+
+        The journal is a JSON Lines file. Records of finished jobs are
+        dropped when the journal is opened. Jobs pending for longer than
+        `max_age` are considered expired, as the API no longer keeps their
+        results, and are dropped as well.
+
+        Args:
+            path (str): The path of the journal file.
+            fsync (bool): Whether to flush every record to disk before
+            moving on. Safer on power loss, slower with many jobs.
+            max_age (float): Seconds after their submission pending jobs
+            expire.
+        """
+        self._path = path
+        self._fsync = fsync
+        self._max_age = max_age
+        self._pending = {}
+        self._jobs_by_key = {}
+        self._lock = threading.Lock()
+        self._load()
+        self._file = open(self._path, "a", encoding="utf-8")
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def pending(self) -> List[Tuple[str, dict]]:
+        """
+        Returns the jobs that were submitted but not finished.
+
+        Returns:
+            List[Tuple[str, dict]]: (job ID, payload) pairs in submission
+            order.
+        """
+        with self._lock:
+            self._expire()
+            return [
+                (job_id, payload)
+                for job_id, (_, payload, _) in self._pending.items()
+            ]
+
+    def pending_job(self, payload: dict) -> Optional[str]:
+        """
+        Returns the ID of a pending job submitted for the payload, if any.
+        """
+        with self._lock:
+            self._expire()
+            return self._jobs_by_key.get(payload_key(payload))
+
+    def record_submitted(self, job_id: str, payload: dict) -> None:
+        """
+        Records that a job was submitted for the payload.
+        """
+        key = payload_key(payload)
+        submitted = time.time()
+        with self._lock:
+            self._add(job_id, key, payload, submitted)
+            self._append(
+                {
+                    "event": "submitted",
+                    "job_id": job_id,
+                    "key": key,
+                    "payload": payload,
+                    "time": submitted,
+                }
+            )
+
+    def record_finished(self, job_id: str, status: str = "done") -> None:
+        """
+        Records that a job finished and no longer needs to be awaited.
+
+        Args:
+            job_id (str): The ID of the job.
+            status (str): How the job ended, e.g. "done" or "faulted".
+        """
+        with self._lock:
+            if not self._remove(job_id):
+                return
+            self._append(
+                {
+                    "event": "finished",
+                    "job_id": job_id,
+                    "status": status,
+                    "time": time.time(),
+                }
+            )
+
+    def close(self) -> None:
+        """
+        Closes the journal file.
+        """
+        with self._lock:
+            self._file.close()
+
+    def _add(
+        self, job_id: str, key: str, payload: dict, submitted: float
+    ) -> None:
+        self._pending[job_id] = (key, payload, submitted)
+        self._jobs_by_key[key] = job_id
+
+    def _remove(self, job_id: str) -> bool:
+        entry = self._pending.pop(job_id, None)
+        if entry is None:
+            return False
+        if self._jobs_by_key.get(entry[0]) == job_id:
+            del self._jobs_by_key[entry[0]]
+        return True
+
+    def _expire(self) -> None:
+        """
+        Drops the pending jobs older than the maximum age. Their records
+        stay in the file until the journal is opened again, when they are
+        dropped by age.
+        """
+        expires = time.time() - self._max_age
+        # Jobs are kept in submission order.
+        expired = []
+        for job_id, (_, _, submitted) in self._pending.items():
+            if submitted > expires:
+                break
+            expired.append(job_id)
+        for job_id in expired:
+            logger.warning(f"Job {job_id} expired in the journal")
+            self._remove(job_id)
+
+    def _append(self, record: dict) -> None:
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+
+    def _load(self) -> None:
+        """
+        Replays the journal file and rewrites it with the pending jobs only.
+        """
+        if not os.path.exists(self._path):
+            return
+
+        with open(self._path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A record torn by a crash while it was written.
+                    logger.warning(f"Skipping a corrupt line in {self._path}")
+                    continue
+                if record.get("event") == "submitted":
+                    self._add(
+                        record["job_id"],
+                        record["key"],
+                        record["payload"],
+                        record.get("time", time.time()),
+                    )
+                elif record.get("event") == "finished":
+                    self._remove(record["job_id"])
+
+        self._expire()
+        temporary = f"{self._path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            for job_id, (key, payload, submitted) in self._pending.items():
+                record = {
+                    "event": "submitted",
+                    "job_id": job_id,
+                    "key": key,
+                    "payload": payload,
+                    "time": submitted,
+                }
+                file.write(json.dumps(record, separators=(",", ":")) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self._path)
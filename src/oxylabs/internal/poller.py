@@ -0,0 +1,198 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import Optional
+
+import aiohttp
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class _PendingJob:
+    def __init__(
+        self,
+        job_id: str,
+        poll_interval: int,
+        user_session: aiohttp.ClientSession,
+        deadline: float,
+        source: Optional[str],
+        started: float,
+        future: asyncio.Future,
+    ) -> None:
+        self.job_id = job_id
+        self.poll_interval = poll_interval
+        self.user_session = user_session
+        self.deadline = deadline
+        self.source = source
+        self.started = started
+        self.future = future
+        self.attempt = 0
+
+
+class JobPoller:
+    def __init__(self, client, rate: float) -> None:
+        """
+        Initializes a poller multiplexing the status checks of every pending
+        job of a client.
+
+        Pending jobs are kept in a heap ordered by when they are next due.
+        A single background task pops due jobs and issues their status
+        checks at no more than `rate` checks per second, so the poll load
+        stays bounded no matter how many jobs are outstanding. The task
+        exits once no jobs are left and is restarted on demand.
+
+        Args:
+            client: The AsyncClient the jobs belong to.
+            rate (float): The maximum number of status checks per second.
+        """
+        self._client = client
+        self._rate = rate
+        self._heap = []
+        self._counter = itertools.count()
+        self._task = None
+        self._wakeup = None
+        self._next_slot = 0.0
+
+    @property
+    def pending(self) -> int:
+        """
+        Returns the number of jobs waiting for a status check.
+        """
+        return len(self._heap)
+
+    async def wait(
+        self,
+        job_id: str,
+        poll_interval: int,
+        user_session: aiohttp.ClientSession,
+        timeout: float,
+        source: Optional[str] = None,
+    ) -> bool:
+        """
+        Waits until the given job completes.
+
+        Args:
+            job_id (str): The ID of the job.
+            poll_interval (int): The poll interval configured for the call.
+            user_session (aiohttp.ClientSession): The session used for the
+            status checks of this job.
+            timeout (float): The job completion timeout in seconds.
+            source (Optional[str]): The source of the job.
+
+        Returns:
+            bool: True if the job completed successfully, False otherwise.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        job = _PendingJob(
+            job_id,
+            poll_interval,
+            user_session,
+            now + timeout,
+            source,
+            now,
+            loop.create_future(),
+        )
+        self._schedule(job, now)
+        return await job.future
+
+    def _schedule(self, job: _PendingJob, now: float) -> None:
+        """
+        Pushes a job back on the heap at its next due time.
+        """
+        delay = self._client._poll_policy.next_delay(
+            job.source, job.attempt, now - job.started, job.poll_interval
+        )
+        due = min(now + delay, job.deadline)
+        heapq.heappush(self._heap, (due, next(self._counter), job))
+
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        else:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        """
+        Issues status checks for due jobs until no jobs are left.
+        """
+        loop = asyncio.get_running_loop()
+        checks = set()
+
+        while self._heap or checks:
+            if not self._heap:
+                # Checks in flight may reschedule their jobs.
+                self._wakeup.clear()
+                wakeup = loop.create_task(self._wakeup.wait())
+                await asyncio.wait(
+                    {wakeup, *checks}, return_when=asyncio.FIRST_COMPLETED
+                )
+                wakeup.cancel()
+                continue
+
+            due = self._heap[0][0]
+            delay = due - loop.time()
+            if delay > 0:
+                # Sleep until the earliest job is due or a new one arrives.
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, job = heapq.heappop(self._heap)
+            if job.future.done():
+                # The waiter was cancelled.
+                continue
+
+            await self._throttle(loop)
+            check = loop.create_task(self._check(job))
+            checks.add(check)
+            check.add_done_callback(checks.discard)
+
+    async def _throttle(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Paces status checks to the configured rate.
+        """
+        now = loop.time()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + 1 / self._rate
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def _check(self, job: _PendingJob) -> None:
+        """
+        Checks the status of a job and resolves or reschedules it.
+        """
+        job.attempt += 1
+        try:
+            status = await self._client._get_job_status(
+                job.job_id, job.user_session, job.poll_interval
+            )
+            if status == "faulted":
+                raise Exception("Job faulted")
+        except Exception as e:
+            logger.error(f"Error occurred: {str(e)}")
+            self._resolve(job, False)
+            return
+
+        if status == "done":
+            self._resolve(job, True)
+            return
+
+        now = asyncio.get_running_loop().time()
+        if now >= job.deadline:
+            logger.info("Job completion timeout exceeded")
+            self._resolve(job, False)
+            return
+
+        self._schedule(job, now)
+
+    @staticmethod
+    def _resolve(job: _PendingJob, result: bool) -> None:
+        if not job.future.done():
+            job.future.set_result(result)
@@ -0,0 +1,153 @@
+import random
+import threading
+from collections import deque
+from typing import Optional
+
+from oxylabs.utils.defaults import (
+    DEFAULT_POLL_FIRST_CHECK,
+    DEFAULT_POLL_JITTER,
+    DEFAULT_POLL_MIN_SAMPLES,
+    DEFAULT_POLL_MULTIPLIER,
+    DEFAULT_POLL_PERCENTILE,
+    DEFAULT_POLL_WINDOW,
+)
+
+
+class PollPolicy:
+    """
+    Decides how long to wait before each job status check.
+
+    Subclass it and override `next_delay` (and optionally `record`) to plug
+    a custom schedule into AsyncClient.
+    """
+
+    def next_delay(
+        self,
+        source: Optional[str],
+        attempt: int,
+        elapsed: float,
+        poll_interval: float,
+    ) -> float:
+        """
+        Returns the delay before the next status check.
+
+        Args:
+            source (Optional[str]): The source of the job.
+            attempt (int): The number of status checks made so far.
+            elapsed (float): Seconds since polling started.
+            poll_interval (float): The poll interval configured for the call.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        raise NotImplementedError
+
+    def record(self, source: Optional[str], duration: float) -> None:
+        """
+        Records how long a job of the given source took to complete.
+
+        Args:
+            source (Optional[str]): The source of the job.
+            duration (float): The completion time in seconds.
+        """
+
+
+class FixedPollPolicy(PollPolicy):
+    """
+    Checks immediately, then every `poll_interval` seconds.
+    """
+
+    def next_delay(
+        self,
+        source: Optional[str],
+        attempt: int,
+        elapsed: float,
+        poll_interval: float,
+    ) -> float:
+        return 0 if attempt == 0 else poll_interval
+
+
+class AdaptivePollPolicy(PollPolicy):
+    """
+    Schedules the first check early and backs off exponentially with jitter.
+
+    Once enough jobs of a source have completed, the first check is moved to
+    the configured percentile of their observed completion times, skipping
+    checks that would almost certainly find the job still running. The
+    backoff never exceeds the `poll_interval` configured for the call.
+    """
+
+    def __init__(
+        self,
+        first_check: float = DEFAULT_POLL_FIRST_CHECK,
+        multiplier: float = DEFAULT_POLL_MULTIPLIER,
+        jitter: float = DEFAULT_POLL_JITTER,
+        percentile: float = DEFAULT_POLL_PERCENTILE,
+        window: int = DEFAULT_POLL_WINDOW,
+        min_samples: int = DEFAULT_POLL_MIN_SAMPLES,
+    ) -> None:
+        """
+        Initializes an instance of AdaptivePollPolicy.
+
+        Args:
+            first_check (float): Seconds before the first check while no
+            completion times are known, and the base of the backoff.
+            multiplier (float): The backoff multiplier between checks.
+            jitter (float): The maximum relative jitter applied to delays.
+            percentile (float): The completion time percentile, between 0
+            and 1, the first check is scheduled at.
+            window (int): How many completion times are kept per source.
+            min_samples (int): Completion times needed before they are used.
+        """
+        self._first_check = first_check
+        self._multiplier = multiplier
+        self._jitter = jitter
+        self._percentile = percentile
+        self._window = window
+        self._min_samples = min_samples
+        self._durations = {}
+        self._lock = threading.Lock()
+
+    def next_delay(
+        self,
+        source: Optional[str],
+        attempt: int,
+        elapsed: float,
+        poll_interval: float,
+    ) -> float:
+        if attempt == 0:
+            delay = min(self._first_check, poll_interval)
+            expected = self.completion_time(source)
+            if expected is not None:
+                # The seeded check is not capped: checking earlier would
+                # almost certainly find the job still running.
+                delay = max(delay, expected - elapsed)
+        else:
+            delay = self._first_check * self._multiplier**attempt
+            delay = min(delay, poll_interval)
+
+        return delay * random.uniform(1 - self._jitter, 1 + self._jitter)
+
+    def record(self, source: Optional[str], duration: float) -> None:
+        with self._lock:
+            durations = self._durations.setdefault(
+                source, deque(maxlen=self._window)
+            )
+            durations.append(duration)
+
+    def completion_time(self, source: Optional[str]) -> Optional[float]:
+        """
+        Returns the configured percentile of observed completion times.
+
+        Args:
+            source (Optional[str]): The source of the jobs.
+
+        Returns:
+            Optional[float]: The completion time in seconds, or None if not
+            enough jobs of the source have completed yet.
+        """
+        with self._lock:
+            durations = sorted(self._durations.get(source, ()))
+        if len(durations) < self._min_samples:
+            return None
+        return durations[int(self._percentile * (len(durations) - 1))]
@@ -0,0 +1,183 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        """
+        Initializes a token bucket refilling at `rate` tokens per second.
+
+        Callers reserve tokens ahead of time and are told how long to wait
+        for them, so excess work queues up in order instead of retrying.
+
+        Args:
+            rate (float): The number of tokens added per second.
+            burst (Optional[float]): The bucket capacity. Defaults to `rate`,
+            i.e. at most one second worth of requests at once.
+        """
+        self._rate = rate
+        self._capacity = burst if burst is not None else max(rate, 1)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Reserves tokens from the bucket.
+
+        Args:
+            tokens (float): The number of tokens to reserve.
+
+        Returns:
+            float: Seconds to wait before the reserved tokens are available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._updated) * self._rate,
+            )
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0
+            return -self._tokens / self._rate
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        source_rates: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """
+        Initializes a client-side rate limiter matching the account limits.
+
+        Requests are paced to `rate` requests per second and, for the given
+        sources, to their own rate as well. At most `max_concurrency`
+        requests (realtime) or jobs (push-pull) run at the same time. Work
+        above the limits waits locally instead of being rejected with 429.
+
+        Args:
+            rate (Optional[float]): The overall requests per second. None
+            means no overall rate limit.
+            burst (Optional[float]): The number of requests allowed at once
+            before pacing kicks in. Defaults to `rate`.
+            max_concurrency (Optional[int]): The maximum number of requests
+            or jobs in flight. None means no concurrency limit.
+            source_rates (Optional[Dict[str, float]]): Requests per second
+            for individual sources, on top of the overall rate.
+        """
+        self._bucket = TokenBucket(rate, burst) if rate else None
+        self._source_buckets = {
+            source: TokenBucket(source_rate)
+            for source, source_rate in (source_rates or {}).items()
+        }
+        self._max_concurrency = max_concurrency
+        self._semaphore = (
+            threading.BoundedSemaphore(max_concurrency)
+            if max_concurrency
+            else None
+        )
+        self._async_semaphore = None
+
+    @property
+    def max_concurrency(self) -> Optional[int]:
+        """
+        Returns the maximum number of requests or jobs in flight, or None
+        if there is no limit.
+        """
+        return self._max_concurrency
+
+    def async_slots(self) -> Optional[asyncio.Semaphore]:
+        """
+        Returns the semaphore holding the concurrency slots of asynchronous
+        jobs, or None if there is no concurrency limit.
+        """
+        if self._max_concurrency and self._async_semaphore is None:
+            self._async_semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._async_semaphore
+
+    def pacing_only(self) -> "RateLimiter":
+        """
+        Returns a limiter sharing the rate buckets of this one but without
+        its concurrency limit, for callers that hold a concurrency slot of
+        this limiter themselves.
+        """
+        limiter = RateLimiter()
+        limiter._bucket = self._bucket
+        limiter._source_buckets = self._source_buckets
+        return limiter
+
+    def _reserve(self, source: Optional[str], tokens: float) -> float:
+        """
+        Reserves tokens from the overall and source buckets.
+
+        Returns:
+            float: Seconds to wait before the request may be sent.
+        """
+        wait = 0
+        if self._bucket is not None:
+            wait = self._bucket.reserve(tokens)
+        source_bucket = self._source_buckets.get(source)
+        if source_bucket is not None:
+            wait = max(wait, source_bucket.reserve(tokens))
+        return wait
+
+    def wait(self, source: Optional[str] = None, tokens: float = 1) -> None:
+        """
+        Blocks until `tokens` requests of the source may be sent.
+        """
+        delay = self._reserve(source, tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(
+        self, source: Optional[str] = None, tokens: float = 1
+    ) -> None:
+        """
+        Waits until `tokens` requests of the source may be sent.
+        """
+        delay = self._reserve(source, tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @contextmanager
+    def limit(self, source: Optional[str] = None):
+        """
+        Holds a concurrency slot and a rate token for a blocking request.
+
+        Args:
+            source (Optional[str]): The source of the request.
+        """
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+        try:
+            self.wait(source)
+            yield
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    @asynccontextmanager
+    async def limit_async(self, source: Optional[str] = None):
+        """
+        Holds a concurrency slot and a rate token for an asynchronous job.
+
+        Args:
+            source (Optional[str]): The source of the job.
+        """
+        semaphore = self.async_slots()
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            await self.wait_async(source)
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
@@ -0,0 +1,348 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+from oxylabs.utils.defaults import (
+    DEFAULT_BACKOFF_BASE,
+    DEFAULT_BACKOFF_MAX,
+    DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+    DEFAULT_CIRCUIT_RECOVERY_TIMEOUT,
+    DEFAULT_MAX_RETRIES,
+    RETRYABLE_STATUS_CODES,
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class RetryableError(Exception):
+    def __init__(
+        self,
+        reason: str,
+        status: Optional[int] = None,
+        retry_after: Optional[float] = None,
+        retry: bool = True,
+    ) -> None:
+        """
+        Raised by a transport attempt that failed transiently.
+
+        Args:
+            reason (str): A description of the failure.
+            status (Optional[int]): The HTTP status code, if any.
+            retry_after (Optional[float]): Seconds the server asked to wait
+            before retrying.
+            retry (bool): Whether the attempt may be repeated. False for
+            requests that are not idempotent and may have reached the
+            server, e.g. a POST that timed out while awaiting the response.
+        """
+        super().__init__(reason)
+        self.status = status
+        self.retry_after = retry_after
+        self.retry = retry
+
+
+class APIError(Exception):
+    def __init__(self, reason: str, status: int) -> None:
+        """
+        Raised when the API answered with an error status that is not
+        retried.
+
+        Args:
+            reason (str): A description of the error.
+            status (int): The HTTP status code.
+        """
+        super().__init__(reason)
+        self.status = status
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised when a request is shed because its endpoint's circuit is open.
+    """
+
+
+class RequestOutcome:
+    def __init__(self) -> None:
+        """
+        Collects how a request went, to be exposed on the response object.
+
+        `transient` tells whether the final failure was transient, e.g. a
+        timeout or an open circuit, so the request may succeed elsewhere.
+        """
+        self.retries = 0
+        self.error = None
+        self.transient = False
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a Retry-After header value.
+
+    Args:
+        value (Optional[str]): Either a number of seconds or an HTTP date.
+
+    Returns:
+        Optional[float]: The number of seconds to wait, or None if the value
+        is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0)
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        retry_statuses: tuple = RETRYABLE_STATUS_CODES,
+        respect_retry_after: bool = True,
+    ) -> None:
+        """
+        Initializes an instance of RetryPolicy.
+
+        Args:
+            max_retries (int): How many times a failed call is retried.
+            backoff_base (float): The base delay in seconds of the
+            exponential backoff.
+            backoff_max (float): The maximum delay between retries.
+            retry_statuses (tuple): The HTTP status codes that are retried.
+            respect_retry_after (bool): Whether to wait as long as the
+            server's Retry-After header asks, up to `backoff_max`.
+        """
+        self.max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._retry_statuses = retry_statuses
+        self._respect_retry_after = respect_retry_after
+
+    def is_retryable_status(self, status: int) -> bool:
+        """
+        Returns whether a response with the given status should be retried.
+        """
+        return status in self._retry_statuses
+
+    def backoff(
+        self, retry: int, retry_after: Optional[float] = None
+    ) -> float:
+        """
+        Returns the delay before the given retry.
+
+        Uses exponential backoff with full jitter, unless the server sent a
+        Retry-After value and the policy respects it. Retry-After values are
+        capped by `backoff_max`, so that a server asking for an hour does
+        not stall the caller for that long.
+
+        Args:
+            retry (int): The number of retries made so far.
+            retry_after (Optional[float]): The server's Retry-After value.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        if retry_after is not None and self._respect_retry_after:
+            return min(retry_after, self._backoff_max)
+        cap = min(self._backoff_max, self._backoff_base * 2**retry)
+        return random.uniform(0, cap)
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_CIRCUIT_RECOVERY_TIMEOUT,
+    ) -> None:
+        """
+        Initializes a per-endpoint circuit breaker.
+
+        After `failure_threshold` consecutive transient failures of an
+        endpoint its circuit opens and calls to it fail immediately for
+        `recovery_timeout` seconds. A single probe call is then let
+        through: its success closes the circuit, its failure reopens it.
+        Other calls are shed meanwhile, unless the probe has not reported
+        back within `recovery_timeout`, in which case another probe is let
+        through. Rate limiting (429) does not count as a failure.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open a
+            circuit.
+            recovery_timeout (float): Seconds a circuit stays open.
+        """
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._failures = {}
+        self._opened_at = {}
+        self._probed_at = {}
+        self._lock = threading.Lock()
+
+    def allow(self, endpoint: str) -> bool:
+        """
+        Returns whether a call to the endpoint may be made. A call allowed
+        through an open circuit is its probe.
+        """
+        with self._lock:
+            opened_at = self._opened_at.get(endpoint)
+            if opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - opened_at < self._recovery_timeout:
+                return False
+            probed_at = self._probed_at.get(endpoint)
+            if (
+                probed_at is not None
+                and now - probed_at < self._recovery_timeout
+            ):
+                return False
+            self._probed_at[endpoint] = now
+            return True
+
+    def record_success(self, endpoint: str) -> None:
+        with self._lock:
+            self._failures.pop(endpoint, None)
+            self._opened_at.pop(endpoint, None)
+            self._probed_at.pop(endpoint, None)
+
+    def record_failure(self, endpoint: str) -> None:
+        with self._lock:
+            self._probed_at.pop(endpoint, None)
+            failures = self._failures.get(endpoint, 0) + 1
+            self._failures[endpoint] = failures
+            if failures >= self._failure_threshold:
+                if endpoint not in self._opened_at:
+                    logger.error(f"Circuit opened for {endpoint}")
+                self._opened_at[endpoint] = time.monotonic()
+
+
+class RetryEngine:
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        """
+        Runs transport calls with retries and a circuit breaker.
+
+        Attempts signal transient failures by raising RetryableError. Any
+        other exception is treated as final and propagated right away.
+
+        Args:
+            policy (Optional[RetryPolicy]): The retry policy.
+            breaker (Optional[CircuitBreaker]): The circuit breaker.
+        """
+        self.policy = policy if policy is not None else RetryPolicy()
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+
+    def call(
+        self,
+        endpoint: str,
+        attempt: Callable,
+        outcome: Optional[RequestOutcome] = None,
+    ):
+        """
+        Calls `attempt` until it succeeds or retries are exhausted.
+
+        Args:
+            endpoint (str): The endpoint the circuit is tracked for.
+            attempt (Callable): Makes a single attempt.
+            outcome (Optional[RequestOutcome]): Collects retries and the
+            final failure reason.
+
+        Returns:
+            The result of the first successful attempt.
+        """
+        outcome = outcome if outcome is not None else RequestOutcome()
+        retries = 0
+        while True:
+            try:
+                self._check_circuit(endpoint, outcome)
+                result = attempt()
+            except RetryableError as e:
+                delay = self._on_retryable(endpoint, e, retries, outcome)
+                retries += 1
+                time.sleep(delay)
+                continue
+            except Exception as e:
+                outcome.error = str(e)
+                raise
+            self.breaker.record_success(endpoint)
+            return result
+
+    async def call_async(
+        self,
+        endpoint: str,
+        attempt: Callable,
+        outcome: Optional[RequestOutcome] = None,
+    ):
+        """
+        Awaits `attempt()` until it succeeds or retries are exhausted.
+
+        Args:
+            endpoint (str): The endpoint the circuit is tracked for.
+            attempt (Callable): Returns an awaitable making a single
+            attempt.
+            outcome (Optional[RequestOutcome]): Collects retries and the
+            final failure reason.
+
+        Returns:
+            The result of the first successful attempt.
+        """
+        outcome = outcome if outcome is not None else RequestOutcome()
+        retries = 0
+        while True:
+            try:
+                self._check_circuit(endpoint, outcome)
+                result = await attempt()
+            except RetryableError as e:
+                delay = self._on_retryable(endpoint, e, retries, outcome)
+                retries += 1
+                await asyncio.sleep(delay)
+                continue
+            except Exception as e:
+                outcome.error = str(e)
+                raise
+            self.breaker.record_success(endpoint)
+            return result
+
+    def _check_circuit(self, endpoint: str, outcome: RequestOutcome) -> None:
+        if not self.breaker.allow(endpoint):
+            outcome.transient = True
+            raise CircuitOpenError(
+                f"Circuit open for {endpoint}, request was not sent"
+            )
+
+    def _on_retryable(
+        self,
+        endpoint: str,
+        error: RetryableError,
+        retries: int,
+        outcome: RequestOutcome,
+    ) -> float:
+        """
+        Records a transient failure and returns the delay before retrying,
+        or re-raises the error if it may not be retried or no retries are
+        left.
+        """
+        if error.status != 429:
+            self.breaker.record_failure(endpoint)
+        if not error.retry or retries >= self.policy.max_retries:
+            outcome.error = str(error)
+            outcome.transient = True
+            raise error
+        delay = self.policy.backoff(retries, error.retry_after)
+        outcome.retries += 1
+        logger.info(f"{error}. Retrying in {delay:.2f} seconds.")
+        return delay
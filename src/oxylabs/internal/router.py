@@ -0,0 +1,239 @@
+import asyncio
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import aiohttp
+
+from oxylabs.internal.internal import AsyncClient, RealtimeClient
+from oxylabs.internal.retry import RequestOutcome
+from oxylabs.utils.defaults import (
+    DEFAULT_ROUTER_LATENCY_PERCENTILE,
+    DEFAULT_ROUTER_LATENCY_WINDOW,
+    DEFAULT_ROUTER_REALTIME_CONCURRENCY,
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class RouterClient(AsyncClient):
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        realtime_concurrency: int = DEFAULT_ROUTER_REALTIME_CONCURRENCY,
+        latency_budget: Optional[float] = None,
+        latency_percentile: float = DEFAULT_ROUTER_LATENCY_PERCENTILE,
+        latency_window: int = DEFAULT_ROUTER_LATENCY_WINDOW,
+        **kwargs,
+    ) -> None:
+        """
+        Initializes an asynchronous client that sends each request either
+        through the Realtime or the Push-Pull integration.
+
+        Requests go to Realtime while it has free slots and its recent
+        latency for the source fits the latency budget, and to Push-Pull
+        otherwise. Realtime requests that fail transiently, e.g. time out,
+        are retried through Push-Pull with the time left.
+
+        The client exposes the same `serp` and `ecommerce` verticals as
+        AsyncClient.
+
+        Args:
+            username (str): The username for API authentication.
+            password (str): The password for API authentication.
+            realtime_concurrency (int): The maximum number of Realtime
+            requests in flight.
+            latency_budget (Optional[float]): Seconds a request may take for
+            Realtime to be used, combined with the call's deadline if it
+            has one. None uses Realtime whenever it has free slots.
+            latency_percentile (float): The percentile, between 0 and 1, of
+            recent Realtime latencies compared with the budget.
+            latency_window (int): How many Realtime latencies are kept per
+            source.
+            **kwargs: Passed on to AsyncClient. The rate limiter, retry
+            policy and circuit breaker apply to both integrations, and the
+            rate limiter's `max_concurrency` bounds Realtime requests and
+            Push-Pull jobs together.
+        """
+        super().__init__(username, password, **kwargs)
+        self._realtime = RealtimeClient(
+            username,
+            password,
+            pool_maxsize=realtime_concurrency,
+            # Realtime requests take their concurrency slot from the same
+            # budget as Push-Pull jobs, see _send_realtime.
+            rate_limiter=self._rate_limiter.pacing_only(),
+            retry_policy=self._retry.policy,
+            circuit_breaker=self._retry.breaker,
+            coalesce=False,
+            codec=self._codec,
+            typed=self._structs is not None,
+        )
+        self._realtime_concurrency = realtime_concurrency
+        self._latency_budget = latency_budget
+        self._latency_percentile = latency_percentile
+        self._latency_window = latency_window
+        self._latencies = {}
+        self._executor = None
+        self._realtime_in_flight = 0
+        self._lock = threading.Lock()
+        self.routed = {"realtime": 0, "push_pull": 0, "fallback": 0}
+
+    async def close(self) -> None:
+        """
+        Closes the shared HTTP sessions of both integrations and the
+        Realtime worker threads.
+
+        Unlike the Push-Pull session, which is closed whenever the client
+        is idle, these are kept until the client is closed, so Realtime
+        connections stay pooled between bursts of requests.
+        """
+        await super().close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._realtime.close()
+
+    @property
+    def stats(self) -> dict:
+        """
+        Returns the live routing statistics: requests sent to each
+        integration, Realtime requests in flight and Push-Pull jobs
+        waiting for a status check.
+        """
+        return {
+            **self.routed,
+            "realtime_in_flight": self._realtime_in_flight,
+            "push_pull_pending": self._poller.pending,
+        }
+
+    def realtime_latency(self, source: Optional[str]) -> Optional[float]:
+        """
+        Returns the configured percentile of recent Realtime latencies of
+        the source, or None if none were observed yet.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies.get(source, ()))
+        if not latencies:
+            return None
+        return latencies[int(self._latency_percentile * (len(latencies) - 1))]
+
+    async def _execute_with_timeout(
+        self,
+        payload: dict,
+        config: dict,
+        user_session: aiohttp.ClientSession,
+        outcome: Optional[RequestOutcome] = None,
+    ) -> dict:
+        outcome = outcome if outcome is not None else RequestOutcome()
+        config = self._start_deadline(config)
+
+        if not self._reserve_realtime(payload, config):
+            self._count("push_pull")
+            return await super()._execute_with_timeout(
+                payload, config, user_session, outcome
+            )
+
+        self._count("realtime")
+        result = await self._run_until_deadline(
+            self._send_realtime(payload, config, outcome), config, outcome
+        )
+        if result is not None or not outcome.transient:
+            return result
+
+        left = self._time_left(config)
+        if left is not None and left <= 0:
+            return None
+        logger.info("Realtime request failed, falling back to Push-Pull")
+        self._count("fallback")
+        outcome.error = None
+        outcome.transient = False
+        return await super()._execute_with_timeout(
+            payload, config, user_session, outcome
+        )
+
+    def _count(self, route: str) -> None:
+        """
+        Counts a request sent through the given route.
+        """
+        with self._lock:
+            self.routed[route] += 1
+
+    def _reserve_realtime(self, payload: dict, config: dict) -> bool:
+        """
+        Decides whether a request is sent through Realtime and, if so,
+        takes a Realtime slot for it.
+        """
+        if "callback_url" in payload:
+            # Only Push-Pull jobs call back.
+            return False
+        budget = self._time_left(config, self._latency_budget)
+        if budget is not None:
+            if budget <= 0:
+                return False
+            expected = self.realtime_latency(payload.get("source"))
+            if expected is not None and expected > budget:
+                return False
+        with self._lock:
+            if self._realtime_in_flight >= self._realtime_concurrency:
+                return False
+            self._realtime_in_flight += 1
+        return True
+
+    async def _send_realtime(
+        self, payload: dict, config: dict, outcome: RequestOutcome
+    ) -> dict:
+        """
+        Sends a request through Realtime on a worker thread. The request
+        must have taken a Realtime slot.
+
+        The request also holds a concurrency slot of the rate limiter, like
+        a Push-Pull job, until the worker thread is done with it.
+        """
+        source = payload.get("source")
+        realtime_config = {
+            "request_timeout": self._time_left(
+                config, config["request_timeout"]
+            )
+        }
+        loop = asyncio.get_running_loop()
+        slots = self._rate_limiter.async_slots()
+        if slots is not None:
+            try:
+                await slots.acquire()
+            except BaseException:
+                with self._lock:
+                    self._realtime_in_flight -= 1
+                raise
+
+        def send() -> dict:
+            started = loop.time()
+            result = None
+            try:
+                result = self._realtime._req(
+                    payload, "POST", realtime_config, outcome
+                )
+                return result
+            finally:
+                with self._lock:
+                    self._realtime_in_flight -= 1
+                    # Failures that are not transient say nothing about
+                    # how fast Realtime is.
+                    if result is not None or outcome.transient:
+                        self._latencies.setdefault(
+                            source, deque(maxlen=self._latency_window)
+                        ).append(loop.time() - started)
+                if slots is not None:
+                    loop.call_soon_threadsafe(slots.release)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._realtime_concurrency,
+                thread_name_prefix="oxylabs-router",
+            )
+        return await loop.run_in_executor(self._executor, send)
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+from typing import Awaitable, Callable
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        """
+        Coalesces identical blocking calls made concurrently from several
+        threads.
+
+        The first caller of a key runs the call, later callers of the same
+        key block until it finishes and share its result or exception.
+        """
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable):
+        """
+        Runs `fn` unless a call with the same key is already in flight.
+
+        Args:
+            key (str): Identifies calls that can share a result.
+            fn (Callable): Makes the call.
+
+        Returns:
+            The result of the call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class _AsyncCall:
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    def __init__(self) -> None:
+        """
+        Coalesces identical calls made concurrently by several coroutines.
+
+        The first caller of a key starts the call as a task, later callers
+        of the same key await the same task. Cancelling a caller does not
+        cancel the call for the others; the call is only cancelled once
+        every caller gave up on it.
+        """
+        self._calls = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable]):
+        """
+        Awaits `fn()` unless a call with the same key is already in flight.
+
+        Args:
+            key (str): Identifies calls that can share a result.
+            fn (Callable[[], Awaitable]): Starts the call.
+
+        Returns:
+            The result of the call.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = _AsyncCall(asyncio.ensure_future(fn()))
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                self._forget(key, call)
+                call.task.cancel()
+            raise
+
+    def _forget(self, key: str, call: _AsyncCall) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
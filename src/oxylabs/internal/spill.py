@@ -0,0 +1,152 @@
+import mmap
+import os
+import tempfile
+import weakref
+from typing import Optional
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def spill_file(spill_dir: Optional[str] = None):
+    """
+    Creates a file to spill a `content` value to, kept after closing.
+    """
+    return tempfile.NamedTemporaryFile(
+        dir=spill_dir, prefix="oxylabs-", suffix=".content", delete=False
+    )
+
+
+class SpilledContent:
+    def __init__(self, path: str, size: int) -> None:
+        """
+        A `content` value written to a scratch file instead of being kept
+        in memory.
+
+        The file holds the UTF-8 encoded value and is only read when asked
+        for, as a string, bytes, a memory-mapped view or a file object. It
+        is deleted once the object is garbage collected, or with `delete`.
+
+        Args:
+            path (str): The path of the file.
+            size (int): The size of the file in bytes.
+        """
+        self.path = path
+        self.size = size
+        self._finalizer = weakref.finalize(self, _remove, path)
+
+    def __repr__(self) -> str:
+        return f"SpilledContent(path={self.path!r}, size={self.size})"
+
+    def __len__(self) -> int:
+        return self.size
+
+    def read(self) -> str:
+        """
+        Returns the whole value as a string.
+        """
+        with open(self.path, encoding="utf-8") as file:
+            return file.read()
+
+    def read_bytes(self) -> bytes:
+        """
+        Returns the whole value as UTF-8 encoded bytes.
+        """
+        with open(self.path, "rb") as file:
+            return file.read()
+
+    def view(self) -> memoryview:
+        """
+        Returns a read-only view of the UTF-8 encoded value, backed by a
+        memory map of the file, so the pages are loaded by the OS as they
+        are accessed and can be evicted under memory pressure.
+        """
+        if self.size == 0:
+            return memoryview(b"")
+        with open(self.path, "rb") as file:
+            return memoryview(
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            )
+
+    def open(self, mode: str = "rb"):
+        """
+        Opens the file holding the value, in binary mode by default.
+        """
+        if "b" in mode:
+            return open(self.path, mode)
+        return open(self.path, mode, encoding="utf-8")
+
+    def delete(self) -> None:
+        """
+        Deletes the file.
+        """
+        self._finalizer()
+
+    @classmethod
+    def from_text(
+        cls, text: str, spill_dir: Optional[str] = None
+    ) -> "SpilledContent":
+        """
+        Writes a value to a scratch file.
+
+        Args:
+            text (str): The value.
+            spill_dir (Optional[str]): The directory of the file. Defaults
+            to the system's temporary directory.
+
+        Returns:
+            SpilledContent: The handle of the written value.
+        """
+        encoded = text.encode("utf-8", "replace")
+        with spill_file(spill_dir) as file:
+            file.write(encoded)
+        return cls(file.name, len(encoded))
+
+
+def _utf8_size(text: str, threshold: int) -> int:
+    """
+    Returns the UTF-8 encoded size of `text`, or its length if that alone
+    exceeds `threshold`, as every character takes at least one byte.
+    """
+    if len(text) > threshold:
+        return len(text)
+    return len(text.encode("utf-8", "replace"))
+
+
+def spill_results(
+    result: dict, threshold: int, spill_dir: Optional[str] = None
+) -> dict:
+    """
+    Writes the `content` values of a results document larger than
+    `threshold` bytes, UTF-8 encoded, to scratch files.
+
+    The document is not modified: a copy is returned, sharing everything
+    but the results items holding spilled values.
+
+    Args:
+        result (dict): The results document.
+        threshold (int): The size in bytes above which values are spilled.
+        spill_dir (Optional[str]): The directory of the files.
+
+    Returns:
+        dict: The document with the large values replaced by
+        SpilledContent.
+    """
+    items = result.get("results")
+    if not isinstance(items, list):
+        return result
+    spilled = []
+    for item in items:
+        content = item.get("content") if isinstance(item, dict) else None
+        if (
+            isinstance(content, str)
+            and _utf8_size(content, threshold) > threshold
+        ):
+            content = SpilledContent.from_text(content, spill_dir)
+            item = {**item, "content": content}
+        spilled.append(item)
+    return {**result, "results": spilled}
@@ -0,0 +1,313 @@
+import json
+import os
+import re
+from typing import List, Optional
+
+from oxylabs.internal.spill import SpilledContent, spill_file
+
+# Structural characters outside strings.
+_STRUCTURE = re.compile(rb'["{}\[\]:,]')
+_HIGH_SURROGATE = re.compile(rb"\\u[dD][89abAB][0-9a-fA-F]{2}")
+
+
+def _backslashes(data: bytes, start: int, end: int) -> int:
+    """
+    Returns the number of consecutive backslashes ending at `end`, not
+    looking before `start`.
+    """
+    index = end
+    while index > start and data[index - 1] == 0x5C:
+        index -= 1
+    return end - index
+
+
+class _Unescaper:
+    def __init__(self, file) -> None:
+        """
+        Decodes the raw bytes of a JSON string chunk by chunk into a file.
+        """
+        self._file = file
+        self._pending = b""
+        self.size = 0
+
+    def feed(self, raw: bytes) -> None:
+        pending = self._pending + raw
+        cut = len(pending)
+        last = pending.rfind(b"\\")
+        if last != -1 and _backslashes(pending, 0, last) % 2 == 0:
+            # An escape sequence split across chunks.
+            length = 6 if pending[last + 1 : last + 2] == b"u" else 2
+            if last + length > cut:
+                cut = last
+        start = cut - 6
+        if (
+            start >= 0
+            and _HIGH_SURROGATE.fullmatch(pending, start, cut)
+            and _backslashes(pending, 0, start) % 2 == 0
+        ):
+            # Wait for the low half of a surrogate pair.
+            cut = start
+        cut = self._utf8_boundary(pending, cut)
+        self._write(pending[:cut])
+        self._pending = pending[cut:]
+
+    def close(self) -> None:
+        self._write(self._pending)
+        self._pending = b""
+
+    def _write(self, raw: bytes) -> None:
+        if not raw:
+            return
+        text = json.loads(b'"' + raw + b'"', strict=False)
+        encoded = text.encode("utf-8", "replace")
+        self._file.write(encoded)
+        self.size += len(encoded)
+
+    @staticmethod
+    def _utf8_boundary(data: bytes, cut: int) -> int:
+        """
+        Moves `cut` back so it does not split a multi-byte character.
+        """
+        for back in range(1, min(4, cut) + 1):
+            byte = data[cut - back]
+            if byte & 0xC0 == 0x80:
+                continue
+            if byte >= 0xF0:
+                length = 4
+            elif byte >= 0xE0:
+                length = 3
+            elif byte >= 0xC0:
+                length = 2
+            else:
+                length = 1
+            return cut - back if back < length else cut
+        return cut
+
+
+class ResultStream:
+    def __init__(
+        self,
+        spill_threshold: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+    ) -> None:
+        """
+        Incrementally parses a results document fed in chunks, e.g. as it
+        arrives from the socket.
+
+        Each item of the document's `results` array is returned as soon as
+        its last byte was fed, so only one item is held in memory at a
+        time. Item `content` strings longer than `spill_threshold` bytes
+        are written to temporary files while they arrive and returned as
+        SpilledContent, so a single large page does not need to fit in
+        memory either.
+
+        Args:
+            spill_threshold (Optional[int]): The encoded size in bytes above
+            which `content` values are spilled. None keeps them in memory.
+            spill_dir (Optional[str]): The directory of the spill files.
+            Defaults to the system's temporary directory.
+        """
+        self._spill_threshold = spill_threshold
+        self._spill_dir = spill_dir
+        # Open containers, b"{" or b"[", and the last key of each object.
+        self._stack = []
+        self._keys = {}
+        self._after_colon = False
+        self._in_string = False
+        self._escaped = False
+        self._string_kind = None
+        self._key = bytearray()
+        self._in_results = False
+        self._results_seen = False
+        self._item = None
+        self._content = None
+        self._spill = None
+        self._spilled = None
+
+    def feed(self, chunk: bytes) -> List[dict]:
+        """
+        Parses the next chunk of the document.
+
+        Args:
+            chunk (bytes): The next bytes of the document.
+
+        Returns:
+            List[dict]: The results items completed by this chunk.
+        """
+        items = []
+        pos = 0
+        size = len(chunk)
+        while pos < size:
+            if self._in_string:
+                pos = self._scan_string(chunk, pos)
+                continue
+            match = _STRUCTURE.search(chunk, pos)
+            if match is None:
+                self._capture(chunk[pos:])
+                break
+            index = match.start()
+            self._capture(chunk[pos:index])
+            pos = index + 1
+            char = chunk[index : index + 1]
+            if char == b'"':
+                self._start_string()
+            elif char in b"{[":
+                self._open(char)
+            elif char in b"}]":
+                item = self._close_container(char)
+                if item is not None:
+                    items.append(item)
+            elif char == b":":
+                self._after_colon = True
+                self._capture(char)
+            else:
+                self._after_colon = False
+                self._capture(char)
+        return items
+
+    def close(self) -> None:
+        """
+        Checks that the whole document was fed.
+
+        Raises:
+            ValueError: If the document ended early.
+        """
+        if self._stack or self._in_string or not self._results_seen:
+            raise ValueError("Incomplete results document")
+
+    def abort(self) -> None:
+        """
+        Deletes the spill file of a `content` value not returned yet, e.g.
+        when the document is abandoned partway. Does nothing once every
+        item was returned, so it can be called after `close`.
+        """
+        if self._spill is not None:
+            file = self._spill._file
+            file.close()
+            try:
+                os.remove(file.name)
+            except OSError:
+                pass
+            self._spill = None
+        if self._spilled is not None:
+            self._spilled.delete()
+            self._spilled = None
+
+    def _capture(self, data: bytes) -> None:
+        if self._item is not None and data:
+            self._item.extend(data)
+
+    def _open(self, char: bytes) -> None:
+        depth = len(self._stack)
+        if (
+            char == b"["
+            and depth == 1
+            and self._after_colon
+            and self._keys.get(1) == b"results"
+        ):
+            self._in_results = True
+            self._results_seen = True
+        elif char == b"{" and depth == 2 and self._in_results:
+            self._item = bytearray()
+            self._spilled = None
+        self._capture(char)
+        self._stack.append(char)
+        self._after_colon = False
+
+    def _close_container(self, char: bytes) -> Optional[dict]:
+        self._capture(char)
+        if self._stack:
+            self._stack.pop()
+        depth = len(self._stack)
+        self._after_colon = False
+        if depth == 1 and self._in_results:
+            self._in_results = False
+        if depth != 2 or self._item is None:
+            return None
+        item = json.loads(bytes(self._item))
+        self._item = None
+        if self._spilled is not None:
+            item["content"] = self._spilled
+            self._spilled = None
+        return item
+
+    def _start_string(self) -> None:
+        self._in_string = True
+        depth = len(self._stack)
+        if self._stack and self._stack[-1] == b"{" and not self._after_colon:
+            self._string_kind = "key"
+            self._key = bytearray()
+        elif (
+            self._spill_threshold is not None
+            and self._item is not None
+            and depth == 3
+            and self._after_colon
+            and self._keys.get(3) == b"content"
+        ):
+            # The opening quote is written once the value is complete.
+            self._string_kind = "content"
+            self._content = bytearray()
+            return
+        else:
+            self._string_kind = None
+        self._capture(b'"')
+
+    def _scan_string(self, chunk: bytes, pos: int) -> int:
+        """
+        Consumes string bytes from `pos` and returns the position after
+        them.
+        """
+        size = len(chunk)
+        if self._escaped:
+            # The escaped character of a backslash ending the last chunk.
+            self._string_data(chunk[pos : pos + 1])
+            self._escaped = False
+            pos += 1
+        quote = chunk.find(b'"', pos)
+        while quote != -1 and _backslashes(chunk, pos, quote) % 2:
+            quote = chunk.find(b'"', quote + 1)
+        if quote == -1:
+            self._string_data(chunk[pos:])
+            # A backslash ending the chunk escapes the next one's first byte.
+            self._escaped = _backslashes(chunk, pos, size) % 2 == 1
+            return size
+        self._string_data(chunk[pos:quote])
+        self._end_string()
+        return quote + 1
+
+    def _string_data(self, data: bytes) -> None:
+        if self._string_kind == "content":
+            self._content_data(data)
+            return
+        if self._string_kind == "key":
+            self._key.extend(data)
+        self._capture(data)
+
+    def _end_string(self) -> None:
+        self._in_string = False
+        if self._string_kind == "key":
+            self._keys[len(self._stack)] = bytes(self._key)
+        elif self._string_kind == "content":
+            if self._spill is None:
+                self._capture(b'"' + bytes(self._content) + b'"')
+            else:
+                self._spill.close()
+                file = self._spill._file
+                file.close()
+                self._spilled = SpilledContent(file.name, self._spill.size)
+                self._spill = None
+                self._capture(b"null")
+            self._content = None
+            return
+        self._capture(b'"')
+
+    def _content_data(self, data: bytes) -> None:
+        if self._spill is not None:
+            self._spill.feed(data)
+            return
+        self._content.extend(data)
+        if len(self._content) > self._spill_threshold:
+            file = spill_file(self._spill_dir)
+            self._spill = _Unescaper(file)
+            self._spill.feed(bytes(self._content))
+            self._content = bytearray()
@@ -472,6 +472,7 @@ class AmazonAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> EcommerceResponse:
         """
@@ -497,6 +498,9 @@ class AmazonAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             EcommerceResponse: The response containing the scraped results.
@@ -506,6 +510,7 @@ class AmazonAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -540,6 +545,7 @@ class AmazonAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> EcommerceResponse:
         """
@@ -561,6 +567,9 @@ class AmazonAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             EcommerceResponse: The response containing the scraped results.
@@ -570,6 +579,7 @@ class AmazonAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -602,6 +612,7 @@ class AmazonAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> EcommerceResponse:
         """
@@ -625,6 +636,9 @@ class AmazonAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             EcommerceResponse: The response containing the scraped results.
@@ -634,6 +648,7 @@ class AmazonAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -670,6 +685,7 @@ class AmazonAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> EcommerceResponse:
         """
@@ -694,6 +710,9 @@ class AmazonAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             EcommerceResponse: The response containing the scraped results.
@@ -703,6 +722,7 @@ class AmazonAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -740,6 +760,7 @@ class AmazonAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> EcommerceResponse:
         """
@@ -764,6 +785,9 @@ class AmazonAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             EcommerceResponse: The response containing the scraped results.
@@ -773,6 +797,7 @@ class AmazonAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -808,6 +833,7 @@ class AmazonAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> EcommerceResponse:
         """
@@ -830,6 +856,9 @@ class AmazonAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             EcommerceResponse: The response containing the scraped results.
@@ -839,6 +868,7 @@ class AmazonAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -874,6 +904,7 @@ class AmazonAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> EcommerceResponse:
         """
@@ -898,6 +929,9 @@ class AmazonAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             EcommerceResponse: The response containing the scraped results.
@@ -907,6 +941,7 @@ class AmazonAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -942,6 +977,7 @@ class AmazonAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> EcommerceResponse:
         """
@@ -964,6 +1000,9 @@ class AmazonAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             EcommerceResponse: The response containing the scraped results.
@@ -973,6 +1012,7 @@ class AmazonAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -1,13 +1,18 @@
+import asyncio
+import copy
 import logging
+from typing import AsyncIterator, Iterator, List, Optional
 
-import oxylabs.utils.utils as utils
+from oxylabs.internal.retry import RequestOutcome
+from oxylabs.internal.spill import spill_results
+from oxylabs.utils import utils
 
 from .amazon.amazon import Amazon, AmazonAsync
 from .google_shopping.google_shopping import (
     GoogleShopping,
     GoogleShoppingAsync,
 )
-from .response import EcommerceResponse
+from .response import EcommerceResponse, Results
 from .universal.universal import Universal, UniversalAsync
 from .wayfair.wayfair import Wayfair, WayfairAsync
 
@@ -25,6 +30,35 @@ class Ecommerce:
         self.universal = Universal(self)
         self.wayfair = Wayfair(self)
 
+    def _response(
+        self,
+        result: dict,
+        outcome: Optional[RequestOutcome] = None,
+        spill: bool = True,
+    ) -> EcommerceResponse:
+        """
+        Wraps a result in a response object, spilling large content values
+        and dropping its raw data if the client is configured to. Results
+        already decoded into typed structs are returned as they are.
+
+        Cached results are passed with `spill` False, so that a cache hit
+        does not write its content to yet another scratch file.
+        """
+        if result is not None and not isinstance(result, dict):
+            if outcome is not None:
+                # The struct may be shared with coalesced callers or held
+                # by the cache.
+                result = copy.copy(result)
+                result.retries = outcome.retries
+                result.error = outcome.error
+            return result
+        threshold = self._client._spill_threshold
+        if spill and result is not None and threshold is not None:
+            result = spill_results(result, threshold, self._client._spill_dir)
+        return EcommerceResponse(
+            result, outcome, keep_raw=self._client._keep_raw
+        )
+
     def _get_resp(self, payload: dict, config: dict) -> dict:
         """
         Processes the payload synchronously and fetches API response.
@@ -39,7 +73,70 @@ class Ecommerce:
         # Remove empty or null values from the payload
         payload = {k: v for k, v in payload.items() if v is not None}
 
-        return EcommerceResponse(self._client._req(payload, "POST", config))
+        cache = self._client._cache
+        if cache is not None:
+            result = cache.get(payload)
+            if result is not None:
+                return self._response(result, spill=False)
+
+        # Identical requests made meanwhile from other threads share one
+        # round trip.
+        result, outcome = self._client._coalesce(
+            payload, config, lambda: self._fetch(payload, config)
+        )
+        return self._response(result, outcome)
+
+    def _fetch(self, payload: dict, config: dict) -> tuple:
+        """
+        Fetches the result of a payload and caches it.
+
+        Returns:
+            tuple: The result, or None on failure, and the RequestOutcome.
+        """
+        outcome = RequestOutcome()
+        result = self._client._req(payload, "POST", config, outcome)
+        cache = self._client._cache
+        if cache is not None and result is not None:
+            cache.set(payload, result)
+        return result, outcome
+
+    def stream_results(
+        self,
+        payload: dict,
+        request_timeout: Optional[int] = None,
+        spill_threshold: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+    ) -> Iterator[Results]:
+        """
+        Scrapes a payload and yields each page of its results as soon as
+        its bytes arrive, so only one page is held in memory at a time.
+
+        Results are neither cached nor retried.
+
+        Args:
+            payload (dict): The payload to scrape, e.g.
+            {"source": "amazon_search", "query": "nike", "pages": 10}.
+            request_timeout (Optional[int]): The timeout in seconds for the
+            request.
+            spill_threshold (Optional[int]): The size in bytes above which
+            `content` values are written to temporary files and returned as
+            SpilledContent. Defaults to the client's `spill_threshold`.
+            spill_dir (Optional[str]): The directory of the spill files.
+            Defaults to the client's `spill_dir`.
+
+        Yields:
+            Results: Each page of the results.
+
+        Raises:
+            requests.exceptions.RequestException: If the request failed.
+            ValueError: If the response ended early.
+        """
+        config = utils.prepare_config(request_timeout=request_timeout)
+        payload = {k: v for k, v in payload.items() if v is not None}
+        for item in self._client._stream_req(
+            payload, config, spill_threshold, spill_dir
+        ):
+            yield Results(item)
 
 
 class EcommerceAsync:
@@ -50,8 +147,43 @@ class EcommerceAsync:
         self.google_shopping = GoogleShoppingAsync(self)
         self.universal = UniversalAsync(self)
         self.wayfair = WayfairAsync(self)
-        self._session = None
-        self._requests = 0
+
+    async def _response(
+        self,
+        result: dict,
+        outcome: Optional[RequestOutcome] = None,
+        spill: bool = True,
+    ) -> EcommerceResponse:
+        """
+        Wraps a result in a response object, spilling large content values
+        and dropping its raw data if the client is configured to. Results
+        already decoded into typed structs are returned as they are.
+
+        Content values are spilled on a worker thread so that writing the
+        files does not block the event loop. Cached results are passed with
+        `spill` False, so that a cache hit does not write its content to
+        yet another scratch file.
+        """
+        if result is not None and not isinstance(result, dict):
+            if outcome is not None:
+                # The struct may be shared with coalesced callers or held
+                # by the cache.
+                result = copy.copy(result)
+                result.retries = outcome.retries
+                result.error = outcome.error
+            return result
+        threshold = self._client._spill_threshold
+        if spill and result is not None and threshold is not None:
+            result = await asyncio.get_running_loop().run_in_executor(
+                None,
+                spill_results,
+                result,
+                threshold,
+                self._client._spill_dir,
+            )
+        return EcommerceResponse(
+            result, outcome, keep_raw=self._client._keep_raw
+        )
 
     async def _get_resp(self, payload: dict, config: dict) -> dict:
         """
@@ -67,23 +199,167 @@ class EcommerceAsync:
         # Remove empty or null values from the payload
         payload = {k: v for k, v in payload.items() if v is not None}
 
-        result = None
-        self._requests += 1
+        result = await self._client._cache_get(payload)
+        if result is not None:
+            return await self._response(result, spill=False)
 
-        try:
+        # Identical requests made meanwhile by other coroutines share one
+        # job.
+        result, outcome = await self._client._coalesce(
+            payload, config, lambda: self._fetch(payload, config)
+        )
+        return await self._response(result, outcome)
 
-            self._session = await utils.ensure_session(self._session)
+    async def _fetch(self, payload: dict, config: dict) -> tuple:
+        """
+        Runs the job of a payload and caches its result.
 
+        Returns:
+            tuple: The result, or None on failure, and the RequestOutcome.
+        """
+        outcome = RequestOutcome()
+        session = await self._client._acquire_session()
+
+        try:
             result = await self._client._execute_with_timeout(
-                payload, config, self._session
+                payload, config, session, outcome
             )
-            return EcommerceResponse(result)
+            if result is not None:
+                await self._client._cache_set(payload, result)
+            return result, outcome
 
         except Exception as e:
             logger.error(f"An error occurred: {e}")
+            outcome.error = str(e)
 
         finally:
-            self._requests -= 1
-            if self._requests == 0:
-                await utils.close(self._session)
-        return EcommerceResponse(None)
+            await self._client._release_session()
+        return None, outcome
+
+    async def stream_results(
+        self,
+        payload: dict,
+        request_timeout: Optional[int] = None,
+        job_completion_timeout: Optional[int] = None,
+        poll_interval: Optional[int] = None,
+        spill_threshold: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+    ) -> AsyncIterator[Results]:
+        """
+        Runs the job of a payload and yields each page of its results as
+        soon as its bytes arrive, so only one page is held in memory at a
+        time.
+
+        Results are neither cached nor retried.
+
+        Args:
+            payload (dict): The payload to scrape, e.g.
+            {"source": "amazon_search", "query": "nike", "pages": 10}.
+            request_timeout (Optional[int]): The timeout in seconds for the
+            requests.
+            job_completion_timeout (Optional[int]): The interval in seconds
+            for the job to time out if it does not complete.
+            poll_interval (Optional[int]): The interval in seconds to poll
+            the server for job status.
+            spill_threshold (Optional[int]): The size in bytes above which
+            `content` values are written to temporary files and returned as
+            SpilledContent. Defaults to the client's `spill_threshold`.
+            spill_dir (Optional[str]): The directory of the spill files.
+            Defaults to the client's `spill_dir`.
+
+        Yields:
+            Results: Each page of the results.
+
+        Raises:
+            Exception: If the job failed or its results could not be
+            fetched.
+            ValueError: If the response ended early.
+        """
+        config = utils.prepare_config(
+            request_timeout=request_timeout,
+            poll_interval=poll_interval,
+            job_completion_timeout=job_completion_timeout,
+            async_integration=True,
+        )
+        payload = {k: v for k, v in payload.items() if v is not None}
+        async for item in self._client._stream_job(
+            payload, config, spill_threshold, spill_dir
+        ):
+            yield Results(item)
+
+    async def scrape_batch(
+        self,
+        payloads: List[dict],
+        request_timeout: Optional[int] = None,
+        job_completion_timeout: Optional[int] = None,
+        poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> List[EcommerceResponse]:
+        """
+        Submits many payloads through the batch endpoint and waits for
+        all of them to complete.
+
+        Payloads with a cached result are not submitted again.
+
+        Args:
+            payloads (List[dict]): The payloads to scrape, e.g.
+            {"source": "...", "query": "...", "parse": True}.
+            request_timeout (Optional[int]): The timeout in seconds for each
+            batch submission.
+            job_completion_timeout (Optional[int]): The interval in seconds
+            for each job to time out if it does not complete.
+            poll_interval (Optional[int]): The interval in seconds to poll
+            the server for job status.
+            deadline (Optional[float]): The total time in seconds the batch
+            may take. Jobs not done by then are returned with an error.
+
+        Returns:
+            List[EcommerceResponse]: The responses in the same order as the payloads.
+        """
+        config = utils.prepare_config(
+            request_timeout=request_timeout,
+            poll_interval=poll_interval,
+            job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
+            async_integration=True,
+        )
+        # Remove empty or null values from the payloads
+        payloads = [
+            {k: v for k, v in payload.items() if v is not None}
+            for payload in payloads
+        ]
+
+        # Only submit the payloads that are not cached.
+        responses: List[Optional[EcommerceResponse]] = [None] * len(payloads)
+        for index, payload in enumerate(payloads):
+            result = await self._client._cache_get(payload)
+            if result is not None:
+                responses[index] = await self._response(result, spill=False)
+        missing = [
+            index
+            for index, response in enumerate(responses)
+            if response is None
+        ]
+        if not missing:
+            return responses
+        missing_payloads = [payloads[index] for index in missing]
+
+        config = self._client._start_deadline(config)
+        outcomes = [RequestOutcome() for _ in missing]
+        session = await self._client._acquire_session()
+
+        try:
+            results = await self._client._run_batch(
+                missing_payloads, config, session, outcomes
+            )
+
+        finally:
+            await self._client._release_session()
+
+        for index, payload, result, outcome in zip(
+            missing, missing_payloads, results, outcomes
+        ):
+            if result is not None:
+                await self._client._cache_set(payload, result)
+            responses[index] = await self._response(result, outcome)
+        return responses
@@ -281,6 +281,7 @@ class GoogleShoppingAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> EcommerceResponse:
         """
@@ -306,6 +307,9 @@ class GoogleShoppingAsync:
             Defaults to 165.
             poll_interval (int, optional): The interval in seconds for the
             request to poll the server for a response. Defaults to 5.
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             EcommerceResponse: The response from the server after the job is completed.
@@ -315,6 +319,7 @@ class GoogleShoppingAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -352,6 +357,7 @@ class GoogleShoppingAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> EcommerceResponse:
         """
@@ -370,6 +376,9 @@ class GoogleShoppingAsync:
             Defaults to 165.
             poll_interval (int, optional): The interval in seconds for the
             request to poll the server for a response. Defaults to 5.
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
         Returns:
             EcommerceResponse: The response from the server after the job is completed.
         """
@@ -378,6 +387,7 @@ class GoogleShoppingAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -412,6 +422,7 @@ class GoogleShoppingAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> EcommerceResponse:
         """
@@ -434,6 +445,9 @@ class GoogleShoppingAsync:
             Defaults to 165.
             poll_interval (int, optional): The interval in seconds for the
             request to poll the server for a response. Defaults to 5.
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
         Returns:
             EcommerceResponse: The response from the server after the job is completed.
         """
@@ -442,6 +456,7 @@ class GoogleShoppingAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -481,6 +496,7 @@ class GoogleShoppingAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> EcommerceResponse:
         """
@@ -505,6 +521,9 @@ class GoogleShoppingAsync:
             Defaults to 165.
             poll_interval (int, optional): The interval in seconds for the
             request to poll the server for a response. Defaults to 5.
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
         Returns:
             EcommerceResponse: The response from the server after the job is completed.
         """
@@ -513,6 +532,7 @@ class GoogleShoppingAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
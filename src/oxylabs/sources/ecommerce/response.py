@@ -1,18 +1,47 @@
-class EcommerceResponse:
-    def __init__(self, data):
+from oxylabs.sources.lazy import Model, Nested, NestedList
+from oxylabs.utils import utils
+from oxylabs.utils.defaults import DEFAULT_DECODE_CHUNK_SIZE
+
+
+class EcommerceResponse(Model):
+    __slots__ = ("_data", "_results", "_job", "raw", "retries", "error")
+
+    results = NestedList("Results", "results")
+    job = Nested("Job", "job")
+
+    def __init__(self, data, outcome=None, keep_raw=True):
         if data is None:
             data = {}
+        self._data = data
         self.raw = data
-        self.results = [Results(item) for item in data.get("results", [])]
-        self.job = Job(data.get("job", {}))
+        self.retries = outcome.retries if outcome is not None else 0
+        self.error = outcome.error if outcome is not None else None
+        if not keep_raw:
+            self.drop_raw()
+
+
+class Results(Model):
+    __slots__ = (
+        "_data",
+        "_content_parsed",
+        "custom_content_parsed",
+        "content",
+        "created_at",
+        "updated_at",
+        "page",
+        "url",
+        "job_id",
+        "status_code",
+        "parser_type",
+    )
+
+    content_parsed = Nested("Content", "content_parsed")
 
-
-class Results:
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.custom_content_parsed = data.get("custom_content_parsed", {})
-        self.content_parsed = Content(data.get("content_parsed", {}))
         self.content = data.get("content")
         self.created_at = data.get("created_at")
         self.updated_at = data.get("updated_at")
@@ -22,48 +51,165 @@ class Results:
         self.status_code = data.get("status_code")
         self.parser_type = data.get("parser_type")
 
+    def decode_content(
+        self,
+        target=None,
+        chunk_size=DEFAULT_DECODE_CHUNK_SIZE,
+        release=False,
+    ):
+        """
+        Decodes base64 content, e.g. of `render="png"` or
+        `content_encoding="base64"` results, chunk by chunk.
+
+        Args:
+            target: A path, or a binary file or buffer with a `write`
+            method, to write the decoded bytes to. None returns them.
+            chunk_size (int): The number of encoded characters decoded at a
+            time.
+            release (bool): Whether to drop the encoded content from the
+            results once decoded, so the encoded and decoded copies are not
+            both kept alive. The raw data is left untouched, as the cache
+            and coalesced calls may share it; build the client with
+            `keep_raw=False` to not keep it.
+
+        Returns:
+            Union[bytearray, int]: The decoded bytes, or the number of bytes
+            written to `target`.
+
+        Raises:
+            ValueError: If the results hold no encoded content or it is not
+            valid base64.
+        """
+        if self.content is None or isinstance(self.content, (dict, list)):
+            raise ValueError("Results hold no encoded content")
+        decoded = utils.decode_base64(self.content, target, chunk_size)
+        if release:
+            self.content = None
+        return decoded
+
+
+class Content(Model):
+    __slots__ = (
+        "_data",
+        "_variants",
+        "_related_items",
+        "_specifications",
+        "_results",
+        "_pricing",
+        "_ads",
+        "_category",
+        "_delivery",
+        "_sales_rank",
+        "_product_details",
+        "_refurbished_product",
+        "_rating_star_distribution",
+        "_reviews",
+        "_questions",
+        "_recent_feedback",
+        "_feedback_summary_table",
+        "raw",
+        "url",
+        "title",
+        "pages",
+        "query",
+        "images",
+        "highlights",
+        "description",
+        "page",
+        "errors",
+        "rating",
+        "asin",
+        "price",
+        "stock",
+        "coupon",
+        "currency",
+        "warnings",
+        "deal_type",
+        "page_type",
+        "price_sns",
+        "variation",
+        "has_videos",
+        "top_review",
+        "asin_in_url",
+        "price_upper",
+        "pricing_str",
+        "pricing_url",
+        "discount_end",
+        "manufacturer",
+        "max_quantity",
+        "price_buybox",
+        "product_name",
+        "bullet_points",
+        "is_addon_item",
+        "price_initial",
+        "pricing_count",
+        "reviews_count",
+        "sns_discounts",
+        "developer_info",
+        "lightning_deal",
+        "price_shipping",
+        "is_prime_pantry",
+        "featured_merchant",
+        "is_prime_eligible",
+        "product_dimensions",
+        "answered_questions_count",
+        "questions_total",
+        "business_name",
+        "business_address",
+        "review_count",
+        "last_visible_page",
+        "parse_status_code",
+    )
+
+    variants = Nested("Variants", "variants")
+    related_items = Nested("RelatedItems", "related_items")
+    specifications = Nested("Specifications", "specifications")
+    results = Nested("Result", "results")
+    pricing = NestedList("Pricing", "pricing")
+    ads = NestedList("AmazonProductAds", "ads")
+    category = NestedList("AmazonProductCategory", "category")
+    delivery = NestedList("AmazonProductDelivery", "delivery")
+    sales_rank = NestedList("AmazonProductSalesRank", "sales_rank")
+    product_details = Nested("ProductDetails", "product_details")
+    refurbished_product = Nested(
+        "AmazonRefurbishedProduct", "refurbished_product"
+    )
+    rating_star_distribution = NestedList(
+        "AmazonRatingStarDistribution", "rating_star_distribution"
+    )
+    reviews = NestedList("AmazonReviews", "reviews")
+    questions = Nested("AmazonQuestions", "questions")
+    recent_feedback = NestedList("RecentFeedback", "recent_feedback")
+    feedback_summary_table = Nested(
+        "FeedbackSummaryTable", "feedback_summary_table"
+    )
 
-class Content:
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.raw = data
         self.url = data.get("url")
         self.title = data.get("title")
         self.pages = data.get("pages")
         self.query = data.get("query")
         self.images = data.get("images")
-        self.variants = Variants(data.get("variants", {}))
         self.highlights = data.get("highlights", [])
         self.description = data.get("description")
-        self.related_items = RelatedItems(data.get("related_items", {}))
-        self.specifications = Specifications(data.get("specifications", {}))
         self.page = data.get("page")
         self.errors = data.get("_errors")
-        self.results = Result(data.get("results", {}))
         self.rating = data.get("rating")
-        self.pricing = [Pricing(item) for item in data.get("pricing", [])]
-        self.ads = [AmazonProductAds(item) for item in data.get("ads", [])]
         self.asin = data.get("asin")
         self.price = data.get("price")
         self.stock = data.get("stock")
         self.coupon = data.get("coupon")
-        self.category = [
-            AmazonProductCategory(item) for item in data.get("category", [])
-        ]
         self.currency = data.get("currency")
-        self.delivery = [
-            AmazonProductDelivery(item) for item in data.get("delivery", [])
-        ]
         self.warnings = data.get("_warnings", [])
         self.deal_type = data.get("deal_type")
         self.page_type = data.get("page_type")
         self.price_sns = data.get("price_sns")
         self.variation = data.get("variation")
         self.has_videos = data.get("has_videos")
-        self.sales_rank = [
-            AmazonProductSalesRank(item) for item in data.get("sales_rank", [])
-        ]
         self.top_review = data.get("top_review")
         self.asin_in_url = data.get("asin_in_url")
         self.price_upper = data.get("price_upper")
@@ -84,57 +230,57 @@ class Content:
         self.lightning_deal = data.get("lightning_deal")
         self.price_shipping = data.get("price_shipping")
         self.is_prime_pantry = data.get("is_prime_pantry")
-        self.product_details = ProductDetails(data.get("product_details", {}))
         self.featured_merchant = data.get("featured_merchant", [])
         self.is_prime_eligible = data.get("is_prime_eligible")
         self.product_dimensions = data.get("product_dimensions")
-        self.refurbished_product = AmazonRefurbishedProduct(
-            data.get("refurbished_product", {})
-        )
         self.answered_questions_count = data.get("answered_questions_count")
-        self.rating_star_distribution = [
-            AmazonRatingStarDistribution(item)
-            for item in data.get("rating_star_distribution", [])
-        ]
-        self.reviews = [
-            AmazonReviews(item) for item in data.get("reviews", [])
-        ]
-        self.questions = AmazonQuestions(data.get("questions", {}))
         self.questions_total = data.get("questions_total")
         self.business_name = data.get("business_name")
-        self.recent_feedback = [
-            RecentFeedback(item) for item in data.get("recent_feedback", [])
-        ]
         self.business_address = data.get("business_address")
-        self.feedback_summary_table = FeedbackSummaryTable(
-            data.get("feedback_summary_table", {})
-        )
         self.review_count = data.get("review_count")
         self.last_visible_page = data.get("last_visible_page")
         self.parse_status_code = data.get("parse_status_code")
 
 
-class Result:
+class Result(Model):
+    __slots__ = (
+        "_data",
+        "_paid",
+        "_filters",
+        "_organic",
+        "_search_information",
+        "_suggested",
+        "_amazon_choices",
+        "_instant_recommendations",
+        "raw",
+        "pos",
+        "url",
+        "asin",
+        "price",
+        "title",
+        "rating",
+        "currency",
+        "is_prime",
+        "price_str",
+        "price_upper",
+        "ratings_count",
+    )
+
+    paid = NestedList("Paid", "paid")
+    filters = NestedList("Filters", "filters")
+    organic = NestedList("Organic", "organic")
+    search_information = Nested("SearchInformation", "search_information")
+    suggested = NestedList("SuggestedAmazonSearch", "suggested")
+    amazon_choices = NestedList("AmazonChoices", "amazon_choices")
+    instant_recommendations = NestedList(
+        "InstantRecommendations", "instant_recommendations"
+    )
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.raw = data
-        self.paid = [Paid(item) for item in data.get("paid", [])]
-        self.filters = [Filters(item) for item in data.get("filters", [])]
-        self.organic = [Organic(item) for item in data.get("organic", [])]
-        self.search_information = SearchInformation(
-            data.get("search_information")
-        )
-        self.suggested = [
-            SuggestedAmazonSearch(item) for item in data.get("suggested", [])
-        ]
-        self.amazon_choices = [
-            AmazonChoices(item) for item in data.get("amazon_choices", [])
-        ]
-        self.instant_recommendations = [
-            InstantRecommendations(item)
-            for item in data.get("instant_recommendations", [])
-        ]
         self.pos = data.get("pos")
         self.url = data.get("url")
         self.asin = data.get("asin")
@@ -148,10 +294,44 @@ class Result:
         self.ratings_count = data.get("ratings_count")
 
 
-class Paid:
+class Paid(Model):
+    __slots__ = (
+        "_data",
+        "_sitelinks",
+        "raw",
+        "pos",
+        "url",
+        "desc",
+        "title",
+        "data_rw",
+        "data_pcu",
+        "url_shown",
+        "asin",
+        "price",
+        "rating",
+        "rel_pos",
+        "currency",
+        "url_image",
+        "best_seller",
+        "price_upper",
+        "is_sponsored",
+        "manufacturer",
+        "pricing_count",
+        "reviews_count",
+        "is_amazons_choice",
+        "no_price_reason",
+        "sales_volume",
+        "is_prime",
+        "shipping_information",
+        "pos_overall",
+    )
+
+    sitelinks = Nested("PaidSitelinks", "sitelinks")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.raw = data
         self.pos = data.get("pos")
         self.url = data.get("url")
@@ -159,7 +339,6 @@ class Paid:
         self.title = data.get("title")
         self.data_rw = data.get("data_rw")
         self.data_pcu = data.get("data_pcu")
-        self.sitelinks = PaidSitelinks(data.get("sitelinks", {}))
         self.url_shown = data.get("url_shown")
         self.asin = data.get("asin")
         self.price = data.get("price")
@@ -181,16 +360,22 @@ class Paid:
         self.pos_overall = data.get("pos_overall")
 
 
-class PaidSitelinks:
+class PaidSitelinks(Model):
+    __slots__ = ("_data", "_expanded", "_inline", "raw")
+
+    expanded = NestedList("Expanded", "expanded")
+    inline = NestedList("Inline", "inline")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.raw = data
-        self.expanded = [Expanded(item) for item in data.get("expanded", [])]
-        self.inline = [Inline(item) for item in data.get("inline", [])]
 
 
-class Expanded:
+class Expanded(Model):
+    __slots__ = ("raw", "url", "desc", "title")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -200,7 +385,9 @@ class Expanded:
         self.title = data.get("title")
 
 
-class Inline:
+class Inline(Model):
+    __slots__ = ("raw", "url", "desc", "title")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -210,16 +397,22 @@ class Inline:
         self.title = data.get("title")
 
 
-class Filters:
+class Filters(Model):
+    __slots__ = ("_data", "_values", "raw", "name")
+
+    values = NestedList("FilterValues", "values")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.raw = data
         self.name = data.get("name")
-        self.values = [FilterValues(item) for item in data.get("values", [])]
 
 
-class FilterValues:
+class FilterValues(Model):
+    __slots__ = ("raw", "url", "value")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -228,10 +421,43 @@ class FilterValues:
         self.value = data.get("value")
 
 
-class Organic:
+class Organic(Model):
+    __slots__ = (
+        "_data",
+        "_merchant",
+        "_variations",
+        "raw",
+        "pos",
+        "url",
+        "type",
+        "price",
+        "title",
+        "currency",
+        "price_str",
+        "product_id",
+        "asin",
+        "rating",
+        "url_image",
+        "best_seller",
+        "price_upper",
+        "is_sponsored",
+        "manufacturer",
+        "pricing_count",
+        "reviews_count",
+        "is_amazons_choice",
+        "no_price_reason",
+        "is_prime",
+        "sales_volume",
+        "pos_overall",
+    )
+
+    merchant = Nested("Merchant", "merchant")
+    variations = NestedList("Variations", "variations")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.raw = data
         self.pos = data.get("pos")
         self.url = data.get("url")
@@ -239,7 +465,6 @@ class Organic:
         self.price = data.get("price")
         self.title = data.get("title")
         self.currency = data.get("currency")
-        self.merchant = Merchant(data.get("merchant", {}))
         self.price_str = data.get("price_str")
         self.product_id = data.get("product_id")
         self.asin = data.get("asin")
@@ -255,13 +480,12 @@ class Organic:
         self.no_price_reason = data.get("no_price_reason")
         self.is_prime = data.get("is_prime")
         self.sales_volume = data.get("sales_volume")
-        self.variations = [
-            Variations(item) for item in data.get("variations", [])
-        ]
         self.pos_overall = data.get("pos_overall")
 
 
-class Merchant:
+class Merchant(Model):
+    __slots__ = ("raw", "url", "name")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -270,7 +494,16 @@ class Merchant:
         self.name = data.get("name")
 
 
-class Variations:
+class Variations(Model):
+    __slots__ = (
+        "raw",
+        "asin",
+        "title",
+        "price",
+        "price_strikethrough",
+        "not_available",
+    )
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -282,7 +515,9 @@ class Variations:
         self.not_available = data.get("not_available")
 
 
-class SearchInformation:
+class SearchInformation(Model):
+    __slots__ = ("raw", "query", "showing_results_for")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -291,16 +526,22 @@ class SearchInformation:
         self.showing_results_for = data.get("showing_results_for")
 
 
-class Variants:
+class Variants(Model):
+    __slots__ = ("_data", "_items", "raw", "type")
+
+    items = NestedList("VariantItem", "items")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.raw = data
         self.type = data.get("type")
-        self.items = [VariantItem(item) for item in data.get("items", [])]
 
 
-class VariantItem:
+class VariantItem(Model):
+    __slots__ = ("raw", "value", "selected", "available", "product_id")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -311,15 +552,29 @@ class VariantItem:
         self.product_id = data.get("product_id")
 
 
-class RelatedItems:
+class RelatedItems(Model):
+    __slots__ = ("_data", "_items", "raw")
+
+    items = NestedList("RelatedItem", "items")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.raw = data
-        self.items = [RelatedItem(item) for item in data.get("items", [])]
 
 
-class RelatedItem:
+class RelatedItem(Model):
+    __slots__ = (
+        "raw",
+        "url",
+        "price",
+        "title",
+        "rating",
+        "currency",
+        "reviews_count",
+    )
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -332,18 +587,22 @@ class RelatedItem:
         self.reviews_count = data.get("reviews_count")
 
 
-class Specifications:
+class Specifications(Model):
+    __slots__ = ("_data", "_items", "raw", "section_title")
+
+    items = NestedList("SpecificationItem", "items")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.raw = data
-        self.items = [
-            SpecificationItem(item) for item in data.get("items", [])
-        ]
         self.section_title = data.get("section_title")
 
 
-class SpecificationItem:
+class SpecificationItem(Model):
+    __slots__ = ("raw", "title", "value")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -352,7 +611,24 @@ class SpecificationItem:
         self.value = data.get("value")
 
 
-class Pricing:
+class Pricing(Model):
+    __slots__ = (
+        "raw",
+        "price",
+        "seller",
+        "details",
+        "currency",
+        "condition",
+        "price_tax",
+        "price_total",
+        "seller_link",
+        "price_shipping",
+        "delivery",
+        "seller_id",
+        "rating_count",
+        "delivery_options",
+    )
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -372,7 +648,30 @@ class Pricing:
         self.delivery_options = data.get("delivery_options")
 
 
-class SuggestedAmazonSearch:
+class SuggestedAmazonSearch(Model):
+    __slots__ = (
+        "raw",
+        "url",
+        "asin",
+        "price",
+        "title",
+        "rating",
+        "currency",
+        "url_image",
+        "best_seller",
+        "price_upper",
+        "is_sponsored",
+        "manufacturer",
+        "pricing_count",
+        "reviews_count",
+        "is_amazons_choice",
+        "pos",
+        "shipping_information",
+        "sales_volume",
+        "no_price_reason",
+        "suggested_query",
+    )
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -398,10 +697,38 @@ class SuggestedAmazonSearch:
         self.suggested_query = data.get("suggested_query")
 
 
-class AmazonChoices:
+class AmazonChoices(Model):
+    __slots__ = (
+        "_data",
+        "_variations",
+        "raw",
+        "url",
+        "asin",
+        "price",
+        "title",
+        "rating",
+        "currency",
+        "url_image",
+        "best_seller",
+        "price_upper",
+        "is_sponsored",
+        "manufacturer",
+        "pricing_count",
+        "reviews_count",
+        "is_amazons_choice",
+        "pos",
+        "is_prime",
+        "shipping_information",
+        "sales_volume",
+        "no_price_reason",
+    )
+
+    variations = NestedList("Variations", "variations")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.raw = data
         self.url = data.get("url")
         self.asin = data.get("asin")
@@ -422,12 +749,30 @@ class AmazonChoices:
         self.shipping_information = data.get("shipping_information")
         self.sales_volume = data.get("sales_volume")
         self.no_price_reason = data.get("no_price_reason")
-        self.variations = [
-            Variations(item) for item in data.get("variations", [])
-        ]
 
 
-class InstantRecommendations:
+class InstantRecommendations(Model):
+    __slots__ = (
+        "raw",
+        "url",
+        "asin",
+        "price",
+        "title",
+        "rating",
+        "currency",
+        "url_image",
+        "best_seller",
+        "price_upper",
+        "is_sponsored",
+        "manufacturer",
+        "pricing_count",
+        "reviews_count",
+        "is_amazons_choice",
+        "pos",
+        "sales_volume",
+        "no_price_reason",
+    )
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -451,7 +796,22 @@ class InstantRecommendations:
         self.no_price_reason = data.get("no_price_reason")
 
 
-class AmazonProductAds:
+class AmazonProductAds(Model):
+    __slots__ = (
+        "raw",
+        "pos",
+        "asin",
+        "type",
+        "price",
+        "title",
+        "images",
+        "rating",
+        "location",
+        "price_upper",
+        "reviews_count",
+        "is_prime_eligible",
+    )
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -469,7 +829,9 @@ class AmazonProductAds:
         self.is_prime_eligible = data.get("is_prime_eligible")
 
 
-class AmazonProductCategory:
+class AmazonProductCategory(Model):
+    __slots__ = ("raw", "ladder")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -480,16 +842,22 @@ class AmazonProductCategory:
         ]
 
 
-class AmazonProductDelivery:
+class AmazonProductDelivery(Model):
+    __slots__ = ("_data", "_date", "raw", "type")
+
+    date = Nested("Date", "date")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.raw = data
-        self.date = Date(data.get("date", {}))
         self.type = data.get("type")
 
 
-class Date:
+class Date(Model):
+    __slots__ = ("raw", "by", "from_date")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -498,7 +866,9 @@ class Date:
         self.from_date = data.get("from")
 
 
-class AmazonProductSalesRank:
+class AmazonProductSalesRank(Model):
+    __slots__ = ("raw", "rank", "ladder")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -510,7 +880,22 @@ class AmazonProductSalesRank:
         ]
 
 
-class ProductDetails:
+class ProductDetails(Model):
+    __slots__ = (
+        "raw",
+        "asin",
+        "batteries",
+        "item_weight",
+        "manufacturer",
+        "customer_reviews",
+        "best_sellers_rank",
+        "country_of_origin",
+        "item_model_number",
+        "product_dimensions",
+        "date_first_available",
+        "is_discontinued_by_manufacturer",
+    )
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -530,16 +915,22 @@ class ProductDetails:
         )
 
 
-class AmazonRefurbishedProduct:
+class AmazonRefurbishedProduct(Model):
+    __slots__ = ("_data", "_link", "raw", "condition_title")
+
+    link = Nested("Link", "link")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.raw = data
-        self.link = Link(data.get("link", {}))
         self.condition_title = data.get("condition_title")
 
 
-class Link:
+class Link(Model):
+    __slots__ = ("raw", "url", "title")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -548,7 +939,9 @@ class Link:
         self.title = data.get("title")
 
 
-class AmazonRatingStarDistribution:
+class AmazonRatingStarDistribution(Model):
+    __slots__ = ("raw", "rating", "percentage")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -557,7 +950,19 @@ class AmazonRatingStarDistribution:
         self.percentage = data.get("percentage")
 
 
-class AmazonReviews:
+class AmazonReviews(Model):
+    __slots__ = (
+        "raw",
+        "id",
+        "title",
+        "author",
+        "rating",
+        "content",
+        "timestamp",
+        "is_verified",
+        "product_attributes",
+    )
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -572,17 +977,23 @@ class AmazonReviews:
         self.product_attributes = data.get("product_attributes")
 
 
-class AmazonQuestions:
+class AmazonQuestions(Model):
+    __slots__ = ("_data", "_answers", "raw", "title", "votes")
+
+    answers = NestedList("Answer", "answers")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.raw = data
         self.title = data.get("title")
         self.votes = data.get("votes")
-        self.answers = [Answer(item) for item in data.get("answers", [])]
 
 
-class Answer:
+class Answer(Model):
+    __slots__ = ("raw", "author", "content", "timestamp")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -592,7 +1003,9 @@ class Answer:
         self.timestamp = data.get("timestamp")
 
 
-class RecentFeedback:
+class RecentFeedback(Model):
+    __slots__ = ("raw", "feedback", "rated_by", "rating_stars")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -602,18 +1015,37 @@ class RecentFeedback:
         self.rating_stars = data.get("rating_stars")
 
 
-class FeedbackSummaryTable:
+class FeedbackSummaryTable(Model):
+    __slots__ = (
+        "_data",
+        "_counts",
+        "_neutral",
+        "_negative",
+        "_positive",
+        "raw",
+    )
+
+    counts = Nested("Counts", "counts")
+    neutral = Nested("Counts", "neutral")
+    negative = Nested("Counts", "negative")
+    positive = Nested("Counts", "positive")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.raw = data
-        self.counts = Counts(data.get("counts", {}))
-        self.neutral = Counts(data.get("neutral", {}))
-        self.negative = Counts(data.get("negative", {}))
-        self.positive = Counts(data.get("positive", {}))
 
 
-class Counts:
+class Counts(Model):
+    __slots__ = (
+        "raw",
+        "thirty_days",
+        "ninety_days",
+        "all_time",
+        "twelve_months",
+    )
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -624,14 +1056,52 @@ class Counts:
         self.twelve_months = data.get("12_months")
 
 
-class Job:
+class Job(Model):
+    __slots__ = (
+        "_data",
+        "_context",
+        "_links",
+        "raw",
+        "callback_url",
+        "client_id",
+        "created_at",
+        "domain",
+        "geo_location",
+        "id",
+        "limit",
+        "locale",
+        "pages",
+        "parse",
+        "parser_type",
+        "parsing_instructions",
+        "browser_instructions",
+        "render",
+        "url",
+        "query",
+        "source",
+        "start_page",
+        "status",
+        "storage_type",
+        "storage_url",
+        "subdomain",
+        "content_encoding",
+        "updated_at",
+        "user_agent_type",
+        "session_info",
+        "statuses",
+        "client_notes",
+    )
+
+    context = NestedList("Context", "context")
+    links = NestedList("JobLink", "_links")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.raw = data
         self.callback_url = data.get("callback_url")
         self.client_id = data.get("client_id")
-        self.context = [Context(item) for item in data.get("context", [])]
         self.created_at = data.get("created_at")
         self.domain = data.get("domain")
         self.geo_location = data.get("geo_location")
@@ -658,10 +1128,11 @@ class Job:
         self.session_info = data.get("session_info")
         self.statuses = data.get("statuses")
         self.client_notes = data.get("client_notes")
-        self.links = [JobLink(item) for item in data.get("_links", [])]
 
 
-class Context:
+class Context(Model):
+    __slots__ = ("raw", "key", "value")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -670,7 +1141,9 @@ class Context:
         self.value = data.get("value")
 
 
-class JobLink:
+class JobLink(Model):
+    __slots__ = ("raw", "rel", "href", "method")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -105,6 +105,7 @@ class UniversalAsync:
         request_timeout: int = None,
         job_completion_timeout: int = None,
         poll_interval: int = None,
+        deadline: float = None,
         **kwargs
     ) -> EcommerceResponse:
         """
@@ -131,6 +132,9 @@ class UniversalAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50.
+            deadline (float): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             EcommerceResponse: The response from the server after the job is completed.
@@ -140,6 +144,7 @@ class UniversalAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
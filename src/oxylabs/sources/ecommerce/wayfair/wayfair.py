@@ -118,6 +118,7 @@ class WayfairAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> EcommerceResponse:
         """
@@ -139,6 +140,9 @@ class WayfairAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             EcommerceResponse: The response from the server after the job is completed.
@@ -148,6 +152,7 @@ class WayfairAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -173,6 +178,7 @@ class WayfairAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> EcommerceResponse:
         """
@@ -191,6 +197,9 @@ class WayfairAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             EcommerceResponse: The response from the server after the job is completed.
@@ -200,6 +209,7 @@ class WayfairAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
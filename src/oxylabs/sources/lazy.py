@@ -0,0 +1,97 @@
+import sys
+
+
+class Nested:
+    def __init__(self, model: str, key: str) -> None:
+        """
+        Declares an attribute holding the model built from a nested object
+        of the response data.
+
+        The model is only built when the attribute is first read, from the
+        `_data` of the instance, and then kept. Most callers only read a
+        few attributes of a response, so the rest of the tree is never
+        built.
+
+        Args:
+            model (str): The name of the model class, looked up in the
+            module of the class declaring the attribute.
+            key (str): The key of the nested object in the response data.
+        """
+        self._model_name = model
+        self._model = None
+        self._key = key
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._module = owner.__module__
+        self._slot = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self._slot)
+        except AttributeError:
+            pass
+        value = self._build(instance._data.get(self._key))
+        setattr(instance, self._slot, value)
+        return value
+
+    def __set__(self, instance, value) -> None:
+        setattr(instance, self._slot, value)
+
+    @property
+    def model(self) -> type:
+        if self._model is None:
+            module = sys.modules[self._module]
+            self._model = getattr(module, self._model_name)
+        return self._model
+
+    def _build(self, data):
+        return self.model(data)
+
+
+class NestedList(Nested):
+    """
+    Declares an attribute holding the list of models built from a nested
+    array of the response data, built on first read like `Nested`.
+    """
+
+    def _build(self, data):
+        model = self.model
+        return [model(item) for item in data or ()]
+
+
+class Model:
+    """
+    Base class of the response models.
+
+    Models declare `__slots__`, so they carry no per-instance `__dict__`.
+    A model with `Nested` attributes keeps the response data they are built
+    from in the `_data` slot, and the value of each in a slot named after
+    it with a leading underscore.
+    """
+
+    __slots__ = ()
+
+    _nested = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._nested = tuple(
+            value for value in vars(cls).values() if isinstance(value, Nested)
+        )
+
+    def drop_raw(self) -> None:
+        """
+        Builds every nested model and drops the response data they were
+        built from, so only the models are kept in memory. Afterwards `raw`
+        is None.
+        """
+        for nested in self._nested:
+            value = nested.__get__(self)
+            for model in value if isinstance(value, list) else (value,):
+                model.drop_raw()
+        if self._nested:
+            self._data = None
+        if "raw" in self.__slots__:
+            self.raw = None
@@ -158,6 +158,7 @@ class BingAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs,
     ) -> SERPResponse:
         """
@@ -185,6 +186,9 @@ class BingAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             SERPResponse: The response containing the scraped results.
@@ -194,6 +198,7 @@ class BingAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
 
@@ -229,6 +234,7 @@ class BingAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs,
     ) -> SERPResponse:
         """
@@ -252,6 +258,9 @@ class BingAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             SERPResponse: The response containing the scraped results.
@@ -261,6 +270,7 @@ class BingAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
 
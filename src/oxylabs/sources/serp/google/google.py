@@ -501,6 +501,7 @@ class GoogleAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs,
     ) -> SERPResponse:
         """
@@ -530,6 +531,9 @@ class GoogleAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             SERPResponse: The response from the server after the job is completed.
@@ -539,6 +543,7 @@ class GoogleAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -568,6 +573,7 @@ class GoogleAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         user_agent_type: Optional[str] = None,
         render: Optional[str] = None,
         callback_url: Optional[str] = None,
@@ -595,6 +601,9 @@ class GoogleAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             SERPResponse: The response from the server after the job is completed.
@@ -604,6 +613,7 @@ class GoogleAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -639,6 +649,7 @@ class GoogleAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs,
     ) -> SERPResponse:
         """
@@ -666,6 +677,9 @@ class GoogleAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             SERPResponse: The response from the server after the job is completed.
@@ -675,6 +689,7 @@ class GoogleAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -708,6 +723,7 @@ class GoogleAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs,
     ) -> SERPResponse:
         """
@@ -730,6 +746,9 @@ class GoogleAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             SERPResponse: The response from the server after the job is completed.
@@ -739,6 +758,7 @@ class GoogleAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -770,6 +790,7 @@ class GoogleAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs,
     ) -> SERPResponse:
         """
@@ -797,6 +818,9 @@ class GoogleAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             SERPResponse: The response from the server after the job is completed.
@@ -806,6 +830,7 @@ class GoogleAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -840,6 +865,7 @@ class GoogleAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs,
     ) -> SERPResponse:
         """
@@ -870,6 +896,9 @@ class GoogleAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             SERPResponse: The response from the server after the job is completed.
@@ -879,6 +908,7 @@ class GoogleAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -914,6 +944,7 @@ class GoogleAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs,
     ) -> SERPResponse:
         """
@@ -941,6 +972,9 @@ class GoogleAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             SERPResponse: The response from the server after the job is completed.
@@ -950,6 +984,7 @@ class GoogleAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
@@ -991,6 +1026,7 @@ class GoogleAsync:
         request_timeout: Optional[int] = 165,
         job_completion_timeout: Optional[int] = None,
         poll_interval: Optional[int] = None,
+        deadline: Optional[float] = None,
         **kwargs,
     ) -> SERPResponse:
         """
@@ -1010,6 +1046,9 @@ class GoogleAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50
+            deadline (Optional[float]): The total time in seconds the call may
+            take, across submitting the job, polling it and fetching its
+            results. Defaults to no deadline.
 
         Returns:
             SERPResponse: The response from the server after the job is completed.
@@ -1019,6 +1058,7 @@ class GoogleAsync:
             request_timeout=request_timeout,
             poll_interval=poll_interval,
             job_completion_timeout=job_completion_timeout,
+            deadline=deadline,
             async_integration=True,
         )
         payload = {
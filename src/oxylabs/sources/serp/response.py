@@ -1,18 +1,47 @@
-class SERPResponse:
-    def __init__(self, data):
+from oxylabs.sources.lazy import Model, Nested, NestedList
+from oxylabs.utils import utils
+from oxylabs.utils.defaults import DEFAULT_DECODE_CHUNK_SIZE
+
+
+class SERPResponse(Model):
+    __slots__ = ("_data", "_results", "_job", "raw", "retries", "error")
+
+    results = NestedList("Results", "results")
+    job = Nested("Job", "job")
+
+    def __init__(self, data, outcome=None, keep_raw=True):
         if data is None:
             data = {}
+        self._data = data
         self.raw = data
-        self.results = [Results(item) for item in data.get("results", [])]
-        self.job = Job(data.get("job", {}))
+        self.retries = outcome.retries if outcome is not None else 0
+        self.error = outcome.error if outcome is not None else None
+        if not keep_raw:
+            self.drop_raw()
+
+
+class Results(Model):
+    __slots__ = (
+        "_data",
+        "_content_parsed",
+        "custom_content_parsed",
+        "content",
+        "created_at",
+        "updated_at",
+        "page",
+        "url",
+        "job_id",
+        "status_code",
+        "parser_type",
+    )
 
+    content_parsed = Nested("Content", "content_parsed")
 
-class Results:
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.custom_content_parsed = data.get("custom_content_parsed", {})
-        self.content_parsed = Content(data.get("content_parsed", {}))
         self.content = data.get("content")
         self.created_at = data.get("created_at")
         self.updated_at = data.get("updated_at")
@@ -22,80 +51,156 @@ class Results:
         self.status_code = data.get("status_code")
         self.parser_type = data.get("parser_type")
 
-
-class Content:
-    def __init__(self, data):
-        if data is None:
-            data = {}
+    def decode_content(
+        self,
+        target=None,
+        chunk_size=DEFAULT_DECODE_CHUNK_SIZE,
+        release=False,
+    ):
+        """
+        Decodes base64 content, e.g. of `render="png"` or
+        `content_encoding="base64"` results, chunk by chunk.
+
+        Args:
+            target: A path, or a binary file or buffer with a `write`
+            method, to write the decoded bytes to. None returns them.
+            chunk_size (int): The number of encoded characters decoded at a
+            time.
+            release (bool): Whether to drop the encoded content from the
+            results once decoded, so the encoded and decoded copies are not
+            both kept alive. The raw data is left untouched, as the cache
+            and coalesced calls may share it; build the client with
+            `keep_raw=False` to not keep it.
+
+        Returns:
+            Union[bytearray, int]: The decoded bytes, or the number of bytes
+            written to `target`.
+
+        Raises:
+            ValueError: If the results hold no encoded content or it is not
+            valid base64.
+        """
+        if self.content is None or isinstance(self.content, (dict, list)):
+            raise ValueError("Results hold no encoded content")
+        decoded = utils.decode_base64(self.content, target, chunk_size)
+        if release:
+            self.content = None
+        return decoded
+
+
+class Content(Model):
+    __slots__ = (
+        "_data",
+        "_results",
+        "url",
+        "page",
+        "errors",
+        "last_visible_page",
+        "parse_status_code",
+    )
+
+    results = Nested("Result", "results")
+
+    def __init__(self, data):
+        if data is None:
+            data = {}
+        self._data = data
         self.url = data.get("url")
         self.page = data.get("page")
         self.errors = data.get("_errors")
-        self.results = Result(data.get("results", {}))
         self.last_visible_page = data.get("last_visible_page")
         self.parse_status_code = data.get("parse_status_code")
 
 
-class Result:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.pla = Pla(data.get("pla", {}))
-        self.paid = [Paid(item) for item in data.get("paid", [])]
-        self.images = Image(data.get("images", {}))
-        self.organic = [Organic(item) for item in data.get("organic", [])]
-        self.twitter = Twitter(data.get("twitter", {}))
-        self.knowledge = Knowledge(data.get("knowledge", {}))
-        self.local_pack = LocalPack(data.get("local_pack", {}))
-        self.top_stories = TopStory(data.get("top_stories", {}))
-        self.popular_products = [
-            PopularProducts(item) for item in data.get("popular_products", [])
-        ]
-        self.related_searches = RelatedSearches(
-            data.get("related_searches", {})
-        )
-        self.related_questions = RelatedQuestions(
-            data.get("related_questions", {})
-        )
-        self.search_information = SearchInformation(
-            data.get("search_information", {})
-        )
-        self.item_carousel = ItemCarousel(data.get("item_carousel", {}))
-        self.recipes = Recipes(data.get("recipes", {}))
-        self.videos = Videos(data.get("videos", {}))
-        self.featured_snippet = [
-            FeaturedSnippet(item) for item in data.get("featured_snippet", [])
-        ]
-        self.related_searches_categorized = [
-            RelatedSearchesCategorized(item)
-            for item in data.get("related_searches_categorized", [])
-        ]
-        self.hotels = Hotels(data.get("hotels", {}))
-        self.flights = Flights(data.get("flights", {}))
-        self.video_box = VideoBox(data.get("video_box", {}))
-        self.local_service_ads = LocalServiceAds(
-            data.get("local_service_ads", {})
-        )
-        self.navigation = [
-            Navigation(item) for item in data.get("navigation", [])
-        ]
-        self.instant_answers = [
-            InstantAnswers(item) for item in data.get("instant_answers", [])
-        ]
-        self.visually_similar_images = VisuallySimilarImages(
-            data.get("visually_similar_images", {})
-        )
+class Result(Model):
+    __slots__ = (
+        "_data",
+        "_pla",
+        "_paid",
+        "_images",
+        "_organic",
+        "_twitter",
+        "_knowledge",
+        "_local_pack",
+        "_top_stories",
+        "_popular_products",
+        "_related_searches",
+        "_related_questions",
+        "_search_information",
+        "_item_carousel",
+        "_recipes",
+        "_videos",
+        "_featured_snippet",
+        "_related_searches_categorized",
+        "_hotels",
+        "_flights",
+        "_video_box",
+        "_local_service_ads",
+        "_navigation",
+        "_instant_answers",
+        "_visually_similar_images",
+        "total_results_count",
+    )
+
+    pla = Nested("Pla", "pla")
+    paid = NestedList("Paid", "paid")
+    images = Nested("Image", "images")
+    organic = NestedList("Organic", "organic")
+    twitter = Nested("Twitter", "twitter")
+    knowledge = Nested("Knowledge", "knowledge")
+    local_pack = Nested("LocalPack", "local_pack")
+    top_stories = Nested("TopStory", "top_stories")
+    popular_products = NestedList("PopularProducts", "popular_products")
+    related_searches = Nested("RelatedSearches", "related_searches")
+    related_questions = Nested("RelatedQuestions", "related_questions")
+    search_information = Nested("SearchInformation", "search_information")
+    item_carousel = Nested("ItemCarousel", "item_carousel")
+    recipes = Nested("Recipes", "recipes")
+    videos = Nested("Videos", "videos")
+    featured_snippet = NestedList("FeaturedSnippet", "featured_snippet")
+    related_searches_categorized = NestedList(
+        "RelatedSearchesCategorized", "related_searches_categorized"
+    )
+    hotels = Nested("Hotels", "hotels")
+    flights = Nested("Flights", "flights")
+    video_box = Nested("VideoBox", "video_box")
+    local_service_ads = Nested("LocalServiceAds", "local_service_ads")
+    navigation = NestedList("Navigation", "navigation")
+    instant_answers = NestedList("InstantAnswers", "instant_answers")
+    visually_similar_images = Nested(
+        "VisuallySimilarImages", "visually_similar_images"
+    )
+
+    def __init__(self, data):
+        if data is None:
+            data = {}
+        self._data = data
         self.total_results_count = data.get("total_results_count")
 
 
-class Pla:
+class Pla(Model):
+    __slots__ = ("_data", "_items", "pos_overall")
+
+    items = NestedList("PlaItem", "items")
+
     def __init__(self, data):
         if data is None:
             data = {}
-        self.items = [PlaItem(item) for item in data.get("items", [])]
+        self._data = data
         self.pos_overall = data.get("pos_overall")
 
 
-class PlaItem:
+class PlaItem(Model):
+    __slots__ = (
+        "pos",
+        "url",
+        "price",
+        "title",
+        "seller",
+        "url_image",
+        "image_data",
+    )
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -108,30 +213,51 @@ class PlaItem:
         self.image_data = data.get("image_data")
 
 
-class Paid:
+class Paid(Model):
+    __slots__ = (
+        "_data",
+        "_sitelinks",
+        "pos",
+        "url",
+        "desc",
+        "title",
+        "data_rw",
+        "data_pcu",
+        "url_shown",
+        "pos_overall",
+    )
+
+    sitelinks = Nested("PaidSitelinks", "sitelinks")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.pos = data.get("pos")
         self.url = data.get("url")
         self.desc = data.get("desc")
         self.title = data.get("title")
         self.data_rw = data.get("data_rw")
         self.data_pcu = data.get("data_pcu", [])
-        self.sitelinks = PaidSitelinks(data.get("sitelinks", {}))
         self.url_shown = data.get("url_shown")
         self.pos_overall = data.get("pos_overall")
 
 
-class PaidSitelinks:
+class PaidSitelinks(Model):
+    __slots__ = ("_data", "_expanded", "_inline")
+
+    expanded = NestedList("Expanded", "expanded")
+    inline = NestedList("Inline", "inline")
+
     def __init__(self, data):
         if data is None:
             data = {}
-        self.expanded = [Expanded(item) for item in data.get("expanded", [])]
-        self.inline = [Inline(item) for item in data.get("inline", [])]
+        self._data = data
+
 
+class Expanded(Model):
+    __slots__ = ("url", "desc", "title")
 
-class Expanded:
     def __init__(self, data):
         if data is None:
             data = {}
@@ -140,7 +266,9 @@ class Expanded:
         self.title = data.get("title")
 
 
-class Inline:
+class Inline(Model):
+    __slots__ = ("url", "desc", "title")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -149,15 +277,21 @@ class Inline:
         self.title = data.get("title")
 
 
-class Image:
+class Image(Model):
+    __slots__ = ("_data", "_items", "pos_overall")
+
+    items = NestedList("ImageItem", "items")
+
     def __init__(self, data):
         if data is None:
             data = {}
-        self.items = [ImageItem(item) for item in data.get("items", [])]
+        self._data = data
         self.pos_overall = data.get("pos_overall")
 
 
-class ImageItem:
+class ImageItem(Model):
+    __slots__ = ("alt", "pos", "url", "data", "source")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -168,40 +302,64 @@ class ImageItem:
         self.source = data.get("source")
 
 
-class Organic:
+class Organic(Model):
+    __slots__ = (
+        "_data",
+        "_site_links",
+        "pos",
+        "url",
+        "desc",
+        "title",
+        "images",
+        "url_shown",
+        "pos_overall",
+    )
+
+    site_links = Nested("OrganicSitelinks", "sitelinks")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.pos = data.get("pos")
         self.url = data.get("url")
         self.desc = data.get("desc")
         self.title = data.get("title")
         self.images = [item for item in data.get("images", [])]
-        self.site_links = OrganicSitelinks(data.get("sitelinks", {}))
         self.url_shown = data.get("url_shown")
         self.pos_overall = data.get("pos_overall")
 
 
-class OrganicSitelinks:
+class OrganicSitelinks(Model):
+    __slots__ = ("_data", "_expanded", "_inline")
+
+    expanded = NestedList("Expanded", "expanded")
+    inline = NestedList("Inline", "inline")
+
     def __init__(self, data):
         if data is None:
             data = {}
-        self.expanded = [Expanded(item) for item in data.get("expanded", [])]
-        self.inline = [Inline(item) for item in data.get("inline", [])]
+        self._data = data
 
 
-class Twitter:
+class Twitter(Model):
+    __slots__ = ("_data", "_items", "pos", "url", "title", "pos_overall")
+
+    items = NestedList("TwitterItem", "items")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.pos = data.get("pos")
         self.url = data.get("url")
-        self.items = [TwitterItem(item) for item in data.get("items", [])]
         self.title = data.get("title")
         self.pos_overall = data.get("pos_overall")
 
 
-class TwitterItem:
+class TwitterItem(Model):
+    __slots__ = ("pos", "url", "content", "time_frame")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -211,31 +369,48 @@ class TwitterItem:
         self.time_frame = data.get("time_frame")
 
 
-class Knowledge:
+class Knowledge(Model):
+    __slots__ = (
+        "_data",
+        "_factoids",
+        "_profiles",
+        "_related_searches",
+        "title",
+        "images",
+        "subtitle",
+        "description",
+    )
+
+    factoids = NestedList("Factoid", "factoids")
+    profiles = NestedList("Profile", "profiles")
+    related_searches = NestedList("RelatedSearches", "related_searches")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.title = data.get("title")
         self.images = [item for item in data.get("images", [])]
-        self.factoids = [Factoid(item) for item in data.get("factoids", [])]
-        self.profiles = [Profile(item) for item in data.get("profiles", [])]
         self.subtitle = data.get("subtitle")
         self.description = data.get("description")
-        self.related_searches = [
-            RelatedSearches(item) for item in data.get("related_searches", [])
-        ]
 
 
-class Factoid:
+class Factoid(Model):
+    __slots__ = ("_data", "_links", "title", "content")
+
+    links = NestedList("LinkElement", "links")
+
     def __init__(self, data):
         if data is None:
             data = {}
-        self.links = [LinkElement(item) for item in data.get("links", [])]
+        self._data = data
         self.title = data.get("title")
         self.content = data.get("content")
 
 
-class LinkElement:
+class LinkElement(Model):
+    __slots__ = ("href", "title")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -243,7 +418,9 @@ class LinkElement:
         self.title = data.get("title")
 
 
-class Profile:
+class Profile(Model):
+    __slots__ = ("url", "title")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -251,7 +428,9 @@ class Profile:
         self.title = data.get("title")
 
 
-class RelatedSearches:
+class RelatedSearches(Model):
+    __slots__ = ("url", "title", "section_title")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -260,21 +439,40 @@ class RelatedSearches:
         self.section_title = data.get("section_title")
 
 
-class LocalPack:
+class LocalPack(Model):
+    __slots__ = ("_data", "_items", "pos_overall")
+
+    items = NestedList("LocalPackItem", "items")
+
     def __init__(self, data):
         if data is None:
             data = {}
-        self.items = [LocalPackItem(item) for item in data.get("items", [])]
+        self._data = data
         self.pos_overall = data.get("pos_overall")
 
 
-class LocalPackItem:
+class LocalPackItem(Model):
+    __slots__ = (
+        "_data",
+        "_links",
+        "cid",
+        "pos",
+        "phone",
+        "title",
+        "rating",
+        "address",
+        "subtitle",
+        "rating_count",
+    )
+
+    links = NestedList("LocalPackLink", "links")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.cid = data.get("cid")
         self.pos = data.get("pos")
-        self.links = [LocalPackLink(item) for item in data.get("links", [])]
         self.phone = data.get("phone")
         self.title = data.get("title")
         self.rating = data.get("rating")
@@ -283,7 +481,9 @@ class LocalPackItem:
         self.rating_count = data.get("rating_count")
 
 
-class LocalPackLink:
+class LocalPackLink(Model):
+    __slots__ = ("href", "title")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -291,15 +491,21 @@ class LocalPackLink:
         self.title = data.get("title")
 
 
-class TopStory:
+class TopStory(Model):
+    __slots__ = ("_data", "_items", "pos_overall")
+
+    items = NestedList("TopStoryItem", "items")
+
     def __init__(self, data):
         if data is None:
             data = {}
-        self.items = [TopStoryItem(item) for item in data.get("items", [])]
+        self._data = data
         self.pos_overall = data.get("pos_overall")
 
 
-class TopStoryItem:
+class TopStoryItem(Model):
+    __slots__ = ("pos", "url", "title", "source", "time_frame")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -310,7 +516,9 @@ class TopStoryItem:
         self.time_frame = data.get("time_frame")
 
 
-class PopularProducts:
+class PopularProducts(Model):
+    __slots__ = ("pos", "price", "rating", "seller", "title", "image_data")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -322,7 +530,9 @@ class PopularProducts:
         self.image_data = data.get("image_data")
 
 
-class RelatedSearches:
+class RelatedSearches(Model):
+    __slots__ = ("pos_overall", "related_searches")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -332,18 +542,21 @@ class RelatedSearches:
         ]
 
 
-class RelatedQuestions:
+class RelatedQuestions(Model):
+    __slots__ = ("_data", "_related_questions", "pos_overall")
+
+    related_questions = NestedList("RelatedQuestionsItem", "related_questions")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.pos_overall = data.get("pos_overall")
-        self.related_questions = [
-            RelatedQuestionsItem(item)
-            for item in data.get("related_questions", [])
-        ]
 
 
-class RelatedQuestionsItem:
+class RelatedQuestionsItem(Model):
+    __slots__ = ("pos", "answer", "source", "question")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -353,7 +566,9 @@ class RelatedQuestionsItem:
         self.question = data.get("question")
 
 
-class Source:
+class Source(Model):
+    __slots__ = ("url", "title", "url_shown")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -362,17 +577,29 @@ class Source:
         self.url_shown = data.get("url_shown")
 
 
-class SearchInformation:
+class SearchInformation(Model):
+    __slots__ = (
+        "_data",
+        "_image",
+        "query",
+        "showing_results_for",
+        "total_results_count",
+    )
+
+    image = Nested("SearchInformationImage", "image")
+
     def __init__(self, data):
         if data is None:
             data = {}
-        self.image = SearchInformationImage(data.get("image", {}))
+        self._data = data
         self.query = data.get("query")
         self.showing_results_for = data.get("showing_results_for")
         self.total_results_count = data.get("total_results_count")
 
 
-class SearchInformationImage:
+class SearchInformationImage(Model):
+    __slots__ = ("url", "width", "height", "other_sizes")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -382,16 +609,22 @@ class SearchInformationImage:
         self.other_sizes = data.get("other_sizes")
 
 
-class ItemCarousel:
+class ItemCarousel(Model):
+    __slots__ = ("_data", "_items", "pos_overall", "title")
+
+    items = NestedList("ItemCarouselItem", "items")
+
     def __init__(self, data):
         if data is None:
             data = {}
-        self.items = [ItemCarouselItem(item) for item in data.get("items", [])]
+        self._data = data
         self.pos_overall = data.get("pos_overall")
         self.title = data.get("title")
 
 
-class ItemCarouselItem:
+class ItemCarouselItem(Model):
+    __slots__ = ("pos", "href", "title", "subtitle")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -401,15 +634,21 @@ class ItemCarouselItem:
         self.subtitle = data.get("subtitle")
 
 
-class Recipes:
+class Recipes(Model):
+    __slots__ = ("_data", "_items", "pos_overall")
+
+    items = NestedList("RecipesItem", "items")
+
     def __init__(self, data):
         if data is None:
             data = {}
-        self.items = [RecipesItem(item) for item in data.get("items", [])]
+        self._data = data
         self.pos_overall = data.get("pos_overall")
 
 
-class RecipesItem:
+class RecipesItem(Model):
+    __slots__ = ("pos", "url", "title", "rating", "source", "duration")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -421,15 +660,21 @@ class RecipesItem:
         self.duration = data.get("duration")
 
 
-class Videos:
+class Videos(Model):
+    __slots__ = ("_data", "_items", "pos_overall")
+
+    items = NestedList("VideosItem", "items")
+
     def __init__(self, data):
         if data is None:
             data = {}
-        self.items = [VideosItem(item) for item in data.get("items", [])]
+        self._data = data
         self.pos_overall = data.get("pos_overall")
 
 
-class VideosItem:
+class VideosItem(Model):
+    __slots__ = ("pos", "url", "title", "author", "source")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -440,7 +685,9 @@ class VideosItem:
         self.source = data.get("source")
 
 
-class FeaturedSnippet:
+class FeaturedSnippet(Model):
+    __slots__ = ("url", "desc", "title", "url_shown", "pos_overall")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -451,19 +698,22 @@ class FeaturedSnippet:
         self.pos_overall = data.get("pos_overall")
 
 
-class RelatedSearchesCategorized:
+class RelatedSearchesCategorized(Model):
+    __slots__ = ("_data", "_items", "category", "pos_overall")
+
+    items = NestedList("RelatedSearchesCategorizedItem", "items")
+
     def __init__(self, data):
         if data is None:
             data = {}
-        self.items = [
-            RelatedSearchesCategorizedItem(item)
-            for item in data.get("items", [])
-        ]
+        self._data = data
         self.category = data.get("category")
         self.pos_overall = data.get("pos_overall")
 
 
-class RelatedSearchesCategorizedItem:
+class RelatedSearchesCategorizedItem(Model):
+    __slots__ = ("url", "title")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -471,7 +721,9 @@ class RelatedSearchesCategorizedItem:
         self.title = data.get("title")
 
 
-class Category:
+class Category(Model):
+    __slots__ = ("name", "type")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -479,17 +731,23 @@ class Category:
         self.type = data.get("type")
 
 
-class Hotels:
+class Hotels(Model):
+    __slots__ = ("_data", "_results", "date_to", "date_from", "pos_overall")
+
+    results = NestedList("HotelsResult", "results")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.date_to = data.get("date_to")
-        self.results = [HotelsResult(item) for item in data.get("results", [])]
         self.date_from = data.get("date_from")
         self.pos_overall = data.get("pos_overall")
 
 
-class HotelsResult:
+class HotelsResult(Model):
+    __slots__ = ("price", "title", "from_location")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -498,20 +756,31 @@ class HotelsResult:
         self.from_location = data.get("from")
 
 
-class Flights:
+class Flights(Model):
+    __slots__ = (
+        "_data",
+        "_results",
+        "to",
+        "from_location",
+        "date_from",
+        "pos_overall",
+    )
+
+    results = NestedList("FlightsResult", "results")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.to = data.get("to")
         self.from_location = data.get("from")
-        self.results = [
-            FlightsResult(item) for item in data.get("results", [])
-        ]
         self.date_from = data.get("date_from")
         self.pos_overall = data.get("pos_overall")
 
 
-class FlightsResult:
+class FlightsResult(Model):
+    __slots__ = ("url", "type", "price", "airline", "duration")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -522,7 +791,9 @@ class FlightsResult:
         self.duration = data.get("duration")
 
 
-class VideoBox:
+class VideoBox(Model):
+    __slots__ = ("url", "title", "pos_overall")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -531,17 +802,28 @@ class VideoBox:
         self.pos_overall = data.get("pos_overall")
 
 
-class LocalServiceAds:
+class LocalServiceAds(Model):
+    __slots__ = ("_data", "_items", "pos_overall")
+
+    items = NestedList("LocalServiceAdsItem", "items")
+
     def __init__(self, data):
         if data is None:
             data = {}
+        self._data = data
         self.pos_overall = data.get("pos_overall")
-        self.items = [
-            LocalServiceAdsItem(item) for item in data.get("items", [])
-        ]
 
 
-class LocalServiceAdsItem:
+class LocalServiceAdsItem(Model):
+    __slots__ = (
+        "pos",
+        "url",
+        "title",
+        "rating",
+        "reviews_count",
+        "google_gauranteed",
+    )
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -553,7 +835,9 @@ class LocalServiceAdsItem:
         self.google_gauranteed = data.get("google_gauranteed")
 
 
-class Navigation:
+class Navigation(Model):
+    __slots__ = ("url", "title", "pos")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -562,7 +846,9 @@ class Navigation:
         self.pos = data.get("pos")
 
 
-class InstantAnswers:
+class InstantAnswers(Model):
+    __slots__ = ("type", "parsed", "pos_overall")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -571,7 +857,9 @@ class InstantAnswers:
         self.pos_overall = data.get("pos_overall")
 
 
-class VisuallySimilarImages:
+class VisuallySimilarImages(Model):
+    __slots__ = ("all_images_url", "featured_images")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -579,13 +867,50 @@ class VisuallySimilarImages:
         self.featured_images = data.get("featured_images")
 
 
-class Job:
-    def __init__(self, data):
-        if data is None:
-            data = {}
+class Job(Model):
+    __slots__ = (
+        "_data",
+        "_context",
+        "_links",
+        "callback_url",
+        "client_id",
+        "created_at",
+        "domain",
+        "geo_location",
+        "id",
+        "limit",
+        "locale",
+        "pages",
+        "parse",
+        "parser_type",
+        "parsing_instructions",
+        "browser_instructions",
+        "render",
+        "url",
+        "query",
+        "source",
+        "start_page",
+        "status",
+        "storage_type",
+        "storage_url",
+        "subdomain",
+        "content_encoding",
+        "updated_at",
+        "user_agent_type",
+        "session_info",
+        "statuses",
+        "client_notes",
+    )
+
+    context = NestedList("Context", "context")
+    links = NestedList("JobLink", "links")
+
+    def __init__(self, data):
+        if data is None:
+            data = {}
+        self._data = data
         self.callback_url = data.get("callback_url")
         self.client_id = data.get("client_id")
-        self.context = [Context(item) for item in data.get("context", [])]
         self.created_at = data.get("created_at")
         self.domain = data.get("domain")
         self.geo_location = data.get("geo_location")
@@ -612,10 +937,11 @@ class Job:
         self.session_info = data.get("session_info")
         self.statuses = data.get("statuses")
         self.client_notes = data.get("client_notes")
-        self.links = [JobLink(item) for item in data.get("links", [])]
 
 
-class Context:
+class Context(Model):
+    __slots__ = ("key", "value")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -623,7 +949,9 @@ class Context:
         self.value = data.get("value")
 
 
-class JobLink:
+class JobLink(Model):
+    __slots__ = ("rel", "href", "method")
+
     def __init__(self, data):
         if data is None:
             data = {}
@@ -0,0 +1,312 @@
+from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
+
+import msgspec
+
+# Typed decoding of the known parser outputs. The results document is
+# decoded straight from the response bytes into the structs below, without
+# building the intermediate dict tree first, and fields not declared here
+# are skipped by the decoder. Requires msgspec.
+
+ValidationError = msgspec.ValidationError
+
+T = TypeVar("T")
+
+
+class Sitelink(msgspec.Struct):
+    url: Optional[str] = None
+    desc: Optional[str] = None
+    title: Optional[str] = None
+
+
+class Sitelinks(msgspec.Struct):
+    expanded: List[Sitelink] = []
+    inline: List[Sitelink] = []
+
+
+class GoogleOrganic(msgspec.Struct):
+    pos: Optional[int] = None
+    url: Optional[str] = None
+    desc: Optional[str] = None
+    title: Optional[str] = None
+    images: List[Any] = []
+    site_links: Optional[Sitelinks] = msgspec.field(
+        default=None, name="sitelinks"
+    )
+    url_shown: Optional[str] = None
+    pos_overall: Optional[int] = None
+
+
+class GooglePaid(msgspec.Struct):
+    pos: Optional[int] = None
+    url: Optional[str] = None
+    desc: Optional[str] = None
+    title: Optional[str] = None
+    data_rw: Optional[str] = None
+    data_pcu: List[str] = []
+    sitelinks: Optional[Sitelinks] = None
+    url_shown: Optional[str] = None
+    pos_overall: Optional[int] = None
+
+
+class RelatedSearches(msgspec.Struct):
+    pos_overall: Optional[int] = None
+    related_searches: List[str] = []
+
+
+class SearchInformation(msgspec.Struct):
+    query: Optional[str] = None
+    showing_results_for: Optional[str] = None
+    total_results_count: Optional[int] = None
+
+
+class GoogleSearchResults(msgspec.Struct):
+    paid: List[GooglePaid] = []
+    organic: List[GoogleOrganic] = []
+    related_searches: Optional[RelatedSearches] = None
+    search_information: Optional[SearchInformation] = None
+    total_results_count: Optional[int] = None
+
+
+class GoogleSearch(msgspec.Struct):
+    url: Optional[str] = None
+    page: Optional[int] = None
+    results: Optional[GoogleSearchResults] = None
+    errors: List[Any] = msgspec.field(default_factory=list, name="_errors")
+    last_visible_page: Optional[int] = None
+    parse_status_code: Optional[int] = None
+
+
+class Ladder(msgspec.Struct):
+    url: Optional[str] = None
+    name: Optional[str] = None
+
+
+class AmazonCategory(msgspec.Struct):
+    ladder: List[Ladder] = []
+
+
+class AmazonSalesRank(msgspec.Struct):
+    rank: Optional[int] = None
+    ladder: List[Ladder] = []
+
+
+class AmazonReview(msgspec.Struct):
+    id: Optional[str] = None
+    title: Optional[str] = None
+    author: Optional[str] = None
+    rating: Optional[float] = None
+    content: Optional[str] = None
+    timestamp: Optional[str] = None
+    is_verified: Optional[bool] = None
+
+
+class AmazonProduct(msgspec.Struct):
+    url: Optional[str] = None
+    asin: Optional[str] = None
+    title: Optional[str] = None
+    price: Optional[float] = None
+    stock: Optional[str] = None
+    rating: Optional[float] = None
+    images: List[str] = []
+    currency: Optional[str] = None
+    category: List[AmazonCategory] = []
+    delivery: List[Any] = []
+    deal_type: Optional[str] = None
+    page_type: Optional[str] = None
+    sales_rank: List[AmazonSalesRank] = []
+    price_upper: Optional[float] = None
+    description: Optional[str] = None
+    manufacturer: Optional[str] = None
+    product_name: Optional[str] = None
+    bullet_points: Optional[str] = None
+    price_initial: Optional[float] = None
+    pricing_count: Optional[int] = None
+    reviews_count: Optional[int] = None
+    price_shipping: Optional[float] = None
+    product_details: Dict[str, Any] = {}
+    is_prime_eligible: Optional[bool] = None
+    reviews: List[AmazonReview] = []
+    errors: List[Any] = msgspec.field(default_factory=list, name="_errors")
+    parse_status_code: Optional[int] = None
+
+
+class AmazonSearchItem(msgspec.Struct):
+    pos: Optional[int] = None
+    url: Optional[str] = None
+    asin: Optional[str] = None
+    price: Optional[float] = None
+    title: Optional[str] = None
+    rating: Optional[float] = None
+    currency: Optional[str] = None
+    is_prime: Optional[bool] = None
+    url_image: Optional[str] = None
+    best_seller: Optional[bool] = None
+    price_upper: Optional[float] = None
+    is_sponsored: Optional[bool] = None
+    manufacturer: Optional[str] = None
+    sales_volume: Optional[str] = None
+    pricing_count: Optional[int] = None
+    reviews_count: Optional[int] = None
+    is_amazons_choice: Optional[bool] = None
+    no_price_reason: Optional[str] = None
+    shipping_information: Optional[str] = None
+
+
+class AmazonSearchResults(msgspec.Struct):
+    paid: List[AmazonSearchItem] = []
+    organic: List[AmazonSearchItem] = []
+    suggested: List[AmazonSearchItem] = []
+    amazon_choices: List[AmazonSearchItem] = []
+    instant_recommendations: List[AmazonSearchItem] = []
+
+
+class AmazonSearch(msgspec.Struct):
+    url: Optional[str] = None
+    page: Optional[int] = None
+    query: Optional[str] = None
+    results: Optional[AmazonSearchResults] = None
+    errors: List[Any] = msgspec.field(default_factory=list, name="_errors")
+    last_visible_page: Optional[int] = None
+    total_results_count: Optional[int] = None
+    parse_status_code: Optional[int] = None
+
+
+class AmazonOffer(msgspec.Struct):
+    price: Optional[float] = None
+    seller: Optional[str] = None
+    details: Optional[str] = None
+    delivery: Optional[str] = None
+    currency: Optional[str] = None
+    condition: Optional[str] = None
+    seller_id: Optional[str] = None
+    price_total: Optional[float] = None
+    seller_link: Optional[str] = None
+    rating_count: Optional[int] = None
+    price_shipping: Optional[float] = None
+
+
+class AmazonPricing(msgspec.Struct):
+    url: Optional[str] = None
+    asin: Optional[str] = None
+    page: Optional[int] = None
+    title: Optional[str] = None
+    rating: Optional[float] = None
+    pricing: List[AmazonOffer] = []
+    review_count: Optional[int] = None
+    pricing_count: Optional[int] = None
+    errors: List[Any] = msgspec.field(default_factory=list, name="_errors")
+    last_visible_page: Optional[int] = None
+    parse_status_code: Optional[int] = None
+
+
+class Merchant(msgspec.Struct):
+    url: Optional[str] = None
+    name: Optional[str] = None
+
+
+class GoogleShoppingItem(msgspec.Struct):
+    pos: Optional[int] = None
+    url: Optional[str] = None
+    type: Optional[str] = None
+    price: Optional[float] = None
+    title: Optional[str] = None
+    rating: Optional[float] = None
+    currency: Optional[str] = None
+    merchant: Optional[Merchant] = None
+    price_str: Optional[str] = None
+    product_id: Optional[str] = None
+    reviews_count: Optional[int] = None
+    pos_overall: Optional[int] = None
+
+
+class FilterValue(msgspec.Struct):
+    url: Optional[str] = None
+    value: Optional[str] = None
+
+
+class Filter(msgspec.Struct):
+    name: Optional[str] = None
+    values: List[FilterValue] = []
+
+
+class GoogleShoppingSearchResults(msgspec.Struct):
+    pla: Optional[Dict[str, Any]] = None
+    paid: List[GoogleShoppingItem] = []
+    organic: List[GoogleShoppingItem] = []
+    filters: List[Filter] = []
+    search_information: Optional[SearchInformation] = None
+
+
+class GoogleShoppingSearch(msgspec.Struct):
+    url: Optional[str] = None
+    page: Optional[int] = None
+    query: Optional[str] = None
+    results: Optional[GoogleShoppingSearchResults] = None
+    errors: List[Any] = msgspec.field(default_factory=list, name="_errors")
+    last_visible_page: Optional[int] = None
+    parse_status_code: Optional[int] = None
+
+
+class Job(msgspec.Struct):
+    id: Optional[str] = None
+    query: Optional[str] = None
+    source: Optional[str] = None
+    status: Optional[str] = None
+    domain: Optional[str] = None
+    parse: Optional[bool] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    callback_url: Optional[str] = None
+
+
+class Results(msgspec.Struct, Generic[T]):
+    # The parsed document is in "content" for realtime requests and in
+    # "content_parsed" for some push-pull results.
+    content: Union[T, str, None] = None
+    content_parsed: Optional[T] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    page: Optional[int] = None
+    url: Optional[str] = None
+    job_id: Optional[str] = None
+    status_code: Optional[int] = None
+    parser_type: Optional[str] = None
+
+
+class TypedResponse(msgspec.Struct, Generic[T]):
+    results: List[Results[T]] = []
+    job: Optional[Job] = None
+    retries: int = 0
+    error: Optional[str] = None
+
+
+PARSERS = {
+    "google_search": GoogleSearch,
+    "amazon_product": AmazonProduct,
+    "amazon_search": AmazonSearch,
+    "amazon_pricing": AmazonPricing,
+    "google_shopping_search": GoogleShoppingSearch,
+}
+
+_decoders = {
+    source: msgspec.json.Decoder(TypedResponse[parser])
+    for source, parser in PARSERS.items()
+}
+
+
+def decode(body: Union[bytes, str], source: str) -> TypedResponse:
+    """
+    Decodes a results document of a source with a typed parser output.
+
+    Args:
+        body (Union[bytes, str]): The JSON results document.
+        source (str): The source of the job, one of `PARSERS`.
+
+    Returns:
+        TypedResponse: The results, with the parsed content as the source's
+        struct.
+
+    Raises:
+        ValidationError: If the document does not match the structs.
+    """
+    return _decoders[source].decode(body)
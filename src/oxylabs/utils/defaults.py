@@ -1,5 +1,6 @@
 SYNC_BASE_URL = "https://realtime.oxylabs.io/v1/queries"
 ASYNC_BASE_URL = "https://data.oxylabs.io/v1/queries"
+ASYNC_BATCH_URL = "https://data.oxylabs.io/v1/queries/batch"
 
 PROXY_BASE_URL = "realtime.oxylabs.io"
 PROXY_PORT = 60000
@@ -10,3 +11,56 @@ DEFAULT_REQUEST_TIMEOUT = 165
 DEFAULT_POLL_INTERVAL = 5
 DEFAULT_REQUEST_TIMEOUT_ASYNC = 105
 DEFAULT_JOB_COMPLETION_TIMEOUT = 50
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_CONNECT_RETRIES = 3
+
+BATCH_MAX_QUERIES = 5000
+
+DEFAULT_CALLBACK_HOST = "127.0.0.1"
+DEFAULT_CALLBACK_PORT = 8080
+DEFAULT_CALLBACK_PATH = "/callback"
+DEFAULT_CALLBACK_FALLBACK_AFTER = 30
+
+DEFAULT_POLL_FIRST_CHECK = 1
+DEFAULT_POLL_MULTIPLIER = 1.5
+DEFAULT_POLL_JITTER = 0.2
+DEFAULT_POLL_PERCENTILE = 0.5
+DEFAULT_POLL_WINDOW = 200
+DEFAULT_POLL_MIN_SAMPLES = 5
+DEFAULT_POLL_RATE = 50
+
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 0
+DEFAULT_DNS_CACHE_TTL = 300
+DEFAULT_KEEPALIVE_TIMEOUT = 30
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 30
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 5
+DEFAULT_CIRCUIT_RECOVERY_TIMEOUT = 30
+
+DEFAULT_BULK_CONCURRENCY = 10
+DEFAULT_BULK_WORKERS = 10
+
+DEFAULT_CACHE_MAX_ENTRIES = 1000
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_CACHE_TTL = 300
+DEFAULT_DISK_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+DEFAULT_JOURNAL_MAX_AGE = 24 * 60 * 60
+
+DEFAULT_HEDGE_PERCENTILE = 0.95
+DEFAULT_HEDGE_MAX_RATIO = 0.05
+DEFAULT_HEDGE_WINDOW = 200
+DEFAULT_HEDGE_MIN_SAMPLES = 20
+
+DEFAULT_ROUTER_REALTIME_CONCURRENCY = 10
+DEFAULT_ROUTER_LATENCY_PERCENTILE = 0.9
+DEFAULT_ROUTER_LATENCY_WINDOW = 200
+
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+DEFAULT_DECODE_CHUNK_SIZE = 1024 * 1024
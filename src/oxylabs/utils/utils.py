@@ -1,11 +1,20 @@
-from typing import Any, List
+import base64
+import os
+from typing import Any, Iterator, List, Optional, Union
 from urllib.parse import urlparse
 
 import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .defaults import (
+    DEFAULT_CONNECT_RETRIES,
+    DEFAULT_DECODE_CHUNK_SIZE,
     DEFAULT_JOB_COMPLETION_TIMEOUT,
     DEFAULT_POLL_INTERVAL,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
     DEFAULT_REQUEST_TIMEOUT,
     DEFAULT_REQUEST_TIMEOUT_ASYNC,
 )
@@ -43,6 +52,8 @@ def prepare_config(**kwargs):
         Defaults to None.
         job_completion_timeout (int, optional): The job completion timeout
         value in seconds. Defaults to None.
+        deadline (float, optional): The total time budget of the call in
+        seconds, across all of its requests. Defaults to None.
 
     Returns:
         dict: The prepared configuration dictionary.
@@ -68,6 +79,7 @@ def prepare_config(**kwargs):
         if kwargs.get("job_completion_timeout") is not None
         else DEFAULT_JOB_COMPLETION_TIMEOUT
     )
+    config["deadline"] = kwargs.get("deadline")
 
     return config
 
@@ -109,19 +121,66 @@ def validate_url(input_url: str, host: str) -> None:
     return None
 
 
-async def ensure_session(session) -> aiohttp.ClientSession:
+async def ensure_session(
+    session, connector_options: Optional[dict] = None
+) -> aiohttp.ClientSession:
     """
     Ensure the provided session is valid and return a valid session.
 
     Args:
         session: The session to ensure.
+        connector_options (Optional[dict]): Keyword arguments for the
+        aiohttp.TCPConnector of a newly created session, e.g. `limit`,
+        `limit_per_host`, `ttl_dns_cache` or `keepalive_timeout`.
 
     Returns:
         A valid aiohttp.ClientSession object.
 
     """
     if session is None or session.closed:
-        session = aiohttp.ClientSession()
+        connector = aiohttp.TCPConnector(**(connector_options or {}))
+        session = aiohttp.ClientSession(connector=connector)
+    return session
+
+
+def create_http_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    connect_retries: int = DEFAULT_CONNECT_RETRIES,
+) -> requests.Session:
+    """
+    Creates a pooled keep-alive requests session.
+
+    Only connection establishment failures are retried by the transport,
+    since at that point the request has not reached the server and it is
+    safe to resend it, even for POST requests.
+
+    Args:
+        pool_connections (int): The number of host pools to cache.
+        pool_maxsize (int): The maximum number of connections kept alive per
+        host. Should be at least the number of threads sharing the session.
+        connect_retries (int): How many times to retry failed connection
+        attempts.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    retries = Retry(
+        total=connect_retries,
+        connect=connect_retries,
+        read=False,
+        status=0,
+        other=0,
+        backoff_factor=0.1,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retries,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     return session
 
 
@@ -360,3 +419,93 @@ def validate_list_string_optional_int(args: list) -> None:
         raise ValueError(
             "_args second argument must be a non-zero integer when present"
         )
+
+
+def _encoded_pieces(content: Any, chunk_size: int) -> Iterator[bytes]:
+    """
+    Yields the encoded content in pieces of at most `chunk_size` bytes.
+    """
+    if isinstance(content, str):
+        for start in range(0, len(content), chunk_size):
+            yield content[start : start + chunk_size].encode("ascii")
+    elif isinstance(content, (bytes, bytearray, memoryview)):
+        view = memoryview(content)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start : start + chunk_size])
+    else:
+        # Content spilled to a file.
+        with content.open("rb") as file:
+            while True:
+                piece = file.read(chunk_size)
+                if not piece:
+                    return
+                yield piece
+
+
+def iter_base64_chunks(
+    content: Any, chunk_size: int = DEFAULT_DECODE_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Decodes base64 content chunk by chunk, so the decoded bytes never need
+    to be held at once.
+
+    Args:
+        content (Any): The encoded content, as a string, bytes or a
+        SpilledContent. Whitespace is ignored.
+        chunk_size (int): The number of encoded characters decoded at a
+        time.
+
+    Yields:
+        bytes: The decoded chunks.
+
+    Raises:
+        binascii.Error: If the content is not valid base64.
+    """
+    pending = b""
+    for piece in _encoded_pieces(content, chunk_size):
+        piece = pending + b"".join(piece.split())
+        usable = len(piece) - len(piece) % 4
+        pending = piece[usable:]
+        if usable:
+            yield base64.b64decode(piece[:usable], validate=True)
+    if pending:
+        yield base64.b64decode(pending + b"=" * (-len(pending) % 4))
+
+
+def decode_base64(
+    content: Any,
+    target: Optional[Any] = None,
+    chunk_size: int = DEFAULT_DECODE_CHUNK_SIZE,
+) -> Union[bytearray, int]:
+    """
+    Decodes base64 content chunk by chunk into a file, a writable buffer or
+    a new bytearray.
+
+    Args:
+        content (Any): The encoded content, as a string, bytes or a
+        SpilledContent.
+        target (Optional[Any]): A path, or a binary file or buffer with a
+        `write` method, to write the decoded bytes to. None returns them.
+        chunk_size (int): The number of encoded characters decoded at a
+        time.
+
+    Returns:
+        Union[bytearray, int]: The decoded bytes, or the number of bytes
+        written to `target`.
+
+    Raises:
+        binascii.Error: If the content is not valid base64.
+    """
+    if target is None:
+        decoded = bytearray()
+        for chunk in iter_base64_chunks(content, chunk_size):
+            decoded += chunk
+        return decoded
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb") as file:
+            return decode_base64(content, file, chunk_size)
+    written = 0
+    for chunk in iter_base64_chunks(content, chunk_size):
+        target.write(chunk)
+        written += len(chunk)
+    return written
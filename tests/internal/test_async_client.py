@@ -0,0 +1,49 @@
+import unittest
+from unittest.mock import patch
+
+from oxylabs.internal import AsyncClient
+
+
+class TestAsyncClientSession(unittest.IsolatedAsyncioTestCase):
+    async def test_verticals_share_session_until_exit(self):
+        """
+        Tests that SERP and Ecommerce requests share one session which is
+        only closed when the client's context exits.
+        """
+        sessions = []
+
+        async def mock_execute(payload, config, session, outcome):
+            sessions.append(session)
+            return {"results": []}
+
+        async with AsyncClient("user", "pass", connection_limit=5) as client:
+            with patch.object(
+                client, "_execute_with_timeout", side_effect=mock_execute
+            ):
+                await client.serp.bing.scrape_search("nike")
+                await client.ecommerce.wayfair.scrape_search("sofa")
+
+            self.assertIs(sessions[0], sessions[1])
+            self.assertFalse(sessions[0].closed)
+            self.assertEqual(sessions[0].connector.limit, 5)
+
+        self.assertTrue(sessions[0].closed)
+
+    async def test_unmanaged_session_closes_when_idle(self):
+        """
+        Tests that without a context manager the session is closed once no
+        request is running.
+        """
+        client = AsyncClient("user", "pass")
+        sessions = []
+
+        async def mock_execute(payload, config, session, outcome):
+            sessions.append(session)
+            return {"results": []}
+
+        with patch.object(
+            client, "_execute_with_timeout", side_effect=mock_execute
+        ):
+            await client.serp.bing.scrape_search("nike")
+
+        self.assertTrue(sessions[0].closed)
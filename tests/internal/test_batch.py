@@ -0,0 +1,125 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from oxylabs.internal import AsyncClient, RateLimiter
+
+
+class TestSubmitBatch(unittest.IsolatedAsyncioTestCase):
+    async def test_submit_batch_groups_and_chunks(self):
+        """
+        Tests that payloads sharing parameters are packed into the same
+        batch, batches are chunked to the size limit and job IDs come back
+        in input order.
+        """
+        client = AsyncClient("user", "pass")
+        calls = []
+
+        async def mock_submit_chunk(field, shared, values, session, timeout):
+            calls.append((field, shared, values))
+            return [f"{shared['source']}-{value}" for value in values]
+
+        payloads = [
+            {"source": "google_search", "query": "a"},
+            {"source": "amazon_search", "query": "b"},
+            {"source": "google_search", "query": "c"},
+            {"source": "google_search", "query": "d"},
+            {"source": "universal_ecommerce", "url": "https://e.com"},
+        ]
+
+        with patch(
+            "oxylabs.internal.internal.BATCH_MAX_QUERIES", 2
+        ), patch.object(
+            client, "_submit_batch_chunk", side_effect=mock_submit_chunk
+        ):
+            job_ids = await client.submit_batch(payloads)
+
+        self.assertEqual(
+            job_ids,
+            [
+                "google_search-a",
+                "amazon_search-b",
+                "google_search-c",
+                "google_search-d",
+                "universal_ecommerce-https://e.com",
+            ],
+        )
+        self.assertIn(
+            ("query", {"source": "google_search"}, ["a", "c"]), calls
+        )
+        self.assertIn(("query", {"source": "google_search"}, ["d"]), calls)
+        self.assertEqual(len(calls), 4)
+
+    async def test_scrape_batch_feeds_poll_pipeline(self):
+        """
+        Tests that batch job IDs are resolved through the regular
+        poll and fetch pipeline.
+        """
+        client = AsyncClient("user", "pass")
+
+        async def mock_submit_batch(payloads, request_timeout, session):
+            return ["1", None]
+
+        async def mock_get_job_result(
+            job_id, config, session, source, outcome
+        ):
+            if job_id is None:
+                return None
+            return {"results": [{"content": job_id}]}
+
+        with patch.object(
+            client, "submit_batch", side_effect=mock_submit_batch
+        ), patch.object(
+            client, "_get_job_result", side_effect=mock_get_job_result
+        ):
+            responses = await client.serp.scrape_batch(
+                [
+                    {"source": "bing_search", "query": "a", "pages": None},
+                    {"source": "bing_search", "query": "b"},
+                ]
+            )
+
+        self.assertEqual(responses[0].results[0].content, "1")
+        self.assertEqual(responses[1].results, [])
+
+    async def test_scrape_batch_holds_a_slot_per_job(self):
+        """
+        Tests that every batch job holds one of the rate limiter's slots
+        from its submission until its results are fetched.
+        """
+        client = AsyncClient(
+            "user", "pass", rate_limiter=RateLimiter(max_concurrency=2)
+        )
+        in_flight = set()
+        submitted = []
+
+        async def mock_submit_batch(payloads, request_timeout, session):
+            job_ids = [payload["query"] for payload in payloads]
+            in_flight.update(job_ids)
+            submitted.append(len(job_ids))
+            self.assertLessEqual(len(in_flight), 2)
+            return job_ids
+
+        async def mock_get_job_result(
+            job_id, config, session, source, outcome
+        ):
+            await asyncio.sleep(0.01)
+            in_flight.remove(job_id)
+            return {"results": [{"content": job_id}]}
+
+        with patch.object(
+            client, "submit_batch", side_effect=mock_submit_batch
+        ), patch.object(
+            client, "_get_job_result", side_effect=mock_get_job_result
+        ):
+            responses = await client.serp.scrape_batch(
+                [{"source": "bing_search", "query": str(i)} for i in range(6)]
+            )
+
+        self.assertEqual(sum(submitted), 6)
+        self.assertEqual(max(submitted), 2)
+        self.assertEqual(
+            [response.results[0].content for response in responses],
+            [str(i) for i in range(6)],
+        )
+        self.assertFalse(client._rate_limiter.async_slots().locked())
@@ -0,0 +1,162 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from oxylabs.internal import AsyncClient, RealtimeClient
+from oxylabs.sources.serp.response import SERPResponse
+
+
+class TestAsyncScrapeMany(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = AsyncClient("user", "pass")
+        self.running = 0
+        self.peak = 0
+        self.pulled = 0
+
+        async def mock_get_resp(payload, config):
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            await asyncio.sleep(0.001 * (hash(payload["query"]) % 5))
+            self.running -= 1
+            return SERPResponse({"results": [{"content": payload["query"]}]})
+
+        self.patcher = patch.object(
+            self.client.serp, "_get_resp", side_effect=mock_get_resp
+        )
+        self.patcher.start()
+
+    async def asyncTearDown(self):
+        self.patcher.stop()
+
+    def requests(self, count):
+        for i in range(count):
+            self.pulled += 1
+            yield (self.client.serp.google.scrape_search, {"query": str(i)})
+
+    async def test_concurrency_is_bounded(self):
+        """
+        Tests that at most `concurrency` requests run at once and every
+        request yields a result.
+        """
+        results = [
+            result
+            async for result in self.client.scrape_many(
+                self.requests(50), concurrency=3
+            )
+        ]
+
+        self.assertEqual(len(results), 50)
+        self.assertEqual(self.peak, 3)
+        self.assertEqual(
+            sorted(r.response.results[0].content for r in results),
+            sorted(str(i) for i in range(50)),
+        )
+        for result in results:
+            self.assertEqual(
+                result.response.results[0].content, str(result.index)
+            )
+
+    async def test_input_is_pulled_lazily(self):
+        """
+        Tests that the input is only consumed as slots free up.
+        """
+        results = self.client.scrape_many(self.requests(1000), concurrency=4)
+        try:
+            async for _ in results:
+                break
+        finally:
+            await results.aclose()
+        self.assertLessEqual(self.pulled, 5)
+
+    async def test_async_iterable_and_dotted_methods(self):
+        """
+        Tests that async iterables and dotted method paths are accepted and
+        failing requests are reported per item.
+        """
+
+        async def requests():
+            yield ("serp.bing.scrape_search", {"query": "a"})
+            yield ("serp.nothing.scrape_search", {"query": "b"})
+
+        results = {
+            result.index: result
+            async for result in self.client.scrape_many(requests())
+        }
+
+        self.assertTrue(results[0].ok)
+        self.assertFalse(results[1].ok)
+        self.assertIsInstance(results[1].error, ValueError)
+
+
+class TestRealtimeScrapeMany(unittest.TestCase):
+    def setUp(self):
+        self.client = RealtimeClient("user", "pass")
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+        def mock_get_resp(payload, config):
+            with self.lock:
+                self.running += 1
+                self.peak = max(self.peak, self.running)
+            # Later requests finish first.
+            time.sleep(0.02 / (int(payload["query"]) + 1))
+            with self.lock:
+                self.running -= 1
+            return SERPResponse({"results": [{"content": payload["query"]}]})
+
+        patcher = patch.object(
+            self.client.serp, "_get_resp", side_effect=mock_get_resp
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.client.close)
+
+    def requests(self, count):
+        return (
+            ("serp.google.scrape_search", {"query": str(i)})
+            for i in range(count)
+        )
+
+    def test_workers_are_bounded(self):
+        """
+        Tests that at most `max_workers` requests run at once.
+        """
+        results = list(self.client.scrape_many(self.requests(20), 4))
+
+        self.assertEqual(len(results), 20)
+        self.assertLessEqual(self.peak, 4)
+        self.assertTrue(all(result.ok for result in results))
+
+    def test_results_in_input_order(self):
+        """
+        Tests that `ordered=True` yields results in input order.
+        """
+        results = list(
+            self.client.scrape_many(self.requests(10), 4, ordered=True)
+        )
+
+        self.assertEqual([result.index for result in results], list(range(10)))
+        self.assertEqual(
+            [result.response.results[0].content for result in results],
+            [str(i) for i in range(10)],
+        )
+
+    def test_errors_are_reported_per_item(self):
+        """
+        Tests that a failing request is reported on its own result.
+        """
+        requests = [
+            ("serp.google.scrape_search", {"query": "0"}),
+            ("serp.google.missing", {"query": "1"}),
+        ]
+
+        results = {
+            result.index: result
+            for result in self.client.scrape_many(requests)
+        }
+
+        self.assertTrue(results[0].ok)
+        self.assertIsInstance(results[1].error, ValueError)
@@ -0,0 +1,278 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from oxylabs.internal import (
+    AsyncClient,
+    DiskCache,
+    RealtimeClient,
+    ResultCache,
+)
+
+
+class TestResultCache(unittest.TestCase):
+    def test_key_is_canonical(self):
+        """
+        Tests that payloads differing only in key order share an entry.
+        """
+        cache = ResultCache()
+        cache.set({"source": "google_search", "query": "nike"}, {"a": 1})
+
+        result = cache.get({"query": "nike", "source": "google_search"})
+
+        self.assertEqual(result, {"a": 1})
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_hits_are_copies(self):
+        """
+        Tests that modifying a cached result, or the result it was cached
+        from, does not modify the cache.
+        """
+        cache = ResultCache()
+        payload = {"source": "google_search", "query": "nike"}
+        result = {"results": [{"content": "a"}]}
+        cache.set(payload, result)
+
+        result["results"][0]["content"] = None
+        cache.get(payload)["results"].clear()
+
+        self.assertEqual(cache.get(payload), {"results": [{"content": "a"}]})
+
+    def test_entries_expire_per_source(self):
+        """
+        Tests that results expire after the TTL of their source.
+        """
+        cache = ResultCache(ttl=60, source_ttls={"amazon_pricing": 10})
+        pricing = {"source": "amazon_pricing", "query": "1"}
+        search = {"source": "amazon_search", "query": "1"}
+
+        with patch("oxylabs.internal.cache.time.monotonic", return_value=0):
+            cache.set(pricing, {"a": 1})
+            cache.set(search, {"b": 2})
+        with patch("oxylabs.internal.cache.time.monotonic", return_value=30):
+            self.assertIsNone(cache.get(pricing))
+            self.assertEqual(cache.get(search), {"b": 2})
+
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(len(cache), 1)
+
+    def test_least_recently_used_are_evicted(self):
+        """
+        Tests that the cache stays within its entry and byte bounds.
+        """
+        cache = ResultCache(max_entries=2)
+        for query in ("a", "b"):
+            cache.set({"query": query}, {"q": query})
+        cache.get({"query": "a"})
+        cache.set({"query": "c"}, {"q": "c"})
+
+        self.assertIsNone(cache.get({"query": "b"}))
+        self.assertIsNotNone(cache.get({"query": "a"}))
+
+        cache = ResultCache(max_bytes=20)
+        cache.set({"query": "a"}, {"q": "a" * 10})
+        cache.set({"query": "b"}, {"q": "b" * 10})
+
+        self.assertEqual(len(cache), 1)
+        self.assertLessEqual(cache.size, 20)
+
+    def test_error_results_are_not_cached(self):
+        """
+        Tests that results the target answered with an error are skipped.
+        """
+        cache = ResultCache()
+        cache.set({"query": "a"}, {"results": [{"status_code": 503}]})
+
+        self.assertEqual(len(cache), 0)
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache.db")
+
+    def test_results_survive_reopening(self):
+        """
+        Tests that results are read back from the file by a new instance.
+        """
+        payload = {"source": "amazon_product", "query": "B07FZ8S74R"}
+        result = {"results": [{"content": "<html>a</html>", "page": 1}]}
+        cache = DiskCache(self.path)
+        cache.set(payload, result)
+        cache.close()
+
+        cache = DiskCache(self.path)
+        self.addCleanup(cache.close)
+
+        self.assertEqual(cache.get(payload), result)
+        self.assertIsNone(cache.get({"source": "amazon_product"}))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_identical_contents_are_stored_once(self):
+        """
+        Tests that equal page contents of different results share a blob.
+        """
+        cache = DiskCache(self.path)
+        self.addCleanup(cache.close)
+        content = "<html>" + "x" * 10000 + "</html>"
+        cache.set({"query": "a"}, {"results": [{"content": content}]})
+        size = cache.size
+        cache.set({"query": "b"}, {"results": [{"content": content}]})
+
+        self.assertEqual(len(cache), 2)
+        self.assertLess(cache.size - size, 200)
+        self.assertEqual(
+            cache.get({"query": "b"})["results"][0]["content"], content
+        )
+
+    def test_expired_and_least_recently_used_are_evicted(self):
+        """
+        Tests that expired results are dropped and the file stays within
+        its size bound.
+        """
+        cache = DiskCache(self.path, ttl=60, source_ttls={"short": 10})
+        self.addCleanup(cache.close)
+        with patch("oxylabs.internal.cache.time.time", return_value=0):
+            cache.set({"source": "short"}, {"a": 1})
+        with patch("oxylabs.internal.cache.time.time", return_value=30):
+            self.assertIsNone(cache.get({"source": "short"}))
+
+        cache = DiskCache(self.path, max_bytes=3000)
+        for index in range(10):
+            content = os.urandom(500).hex()
+            cache.set({"query": index}, {"results": [{"content": content}]})
+
+        self.assertLessEqual(cache.size, 3000)
+        self.assertIsNotNone(cache.get({"query": 9}))
+        self.assertIsNone(cache.get({"query": 0}))
+
+    def test_size_is_not_recounted_on_every_write(self):
+        """
+        Tests that the stored size is counted once and then tracked as
+        results are written.
+        """
+        cache = DiskCache(self.path)
+        self.addCleanup(cache.close)
+
+        with patch.object(cache, "_size", wraps=cache._size) as size:
+            for index in range(5):
+                cache.set({"query": index}, {"results": [{"content": "x"}]})
+
+        self.assertEqual(size.call_count, 1)
+        self.assertEqual(cache._bytes, cache.size)
+
+
+class TestClientCache(unittest.IsolatedAsyncioTestCase):
+    def test_realtime_repeats_are_served_from_cache(self):
+        """
+        Tests that a repeated realtime request does not reach the API.
+        """
+        cache = ResultCache()
+        client = RealtimeClient("user", "pass", cache=cache)
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"results": [{"content": "x"}]}
+
+        with patch.object(
+            client._session, "post", return_value=mock_response
+        ) as mock_post:
+            first = client.serp.bing.scrape_search("nike")
+            second = client.serp.bing.scrape_search("nike", request_timeout=10)
+
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(second.results[0].content, first.results[0].content)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    async def test_async_repeats_are_served_from_cache(self):
+        """
+        Tests that a repeated push-pull request does not submit a job.
+        """
+        client = AsyncClient("user", "pass", cache=ResultCache())
+
+        async def mock_execute(payload, config, session, outcome):
+            return {"results": [{"content": payload["query"]}]}
+
+        with patch.object(
+            client, "_execute_with_timeout", side_effect=mock_execute
+        ) as mock_execute:
+            await client.ecommerce.amazon.scrape_search("nike")
+            result = await client.ecommerce.amazon.scrape_search("nike")
+
+        self.assertEqual(mock_execute.call_count, 1)
+        self.assertEqual(result.results[0].content, "nike")
+
+    async def test_disk_cache_is_used_off_the_event_loop(self):
+        """
+        Tests that the async client reads and writes a DiskCache on a
+        worker thread.
+        """
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        cache = DiskCache(os.path.join(directory.name, "cache.db"))
+        self.addCleanup(cache.close)
+        client = AsyncClient("user", "pass", cache=cache)
+        threads = set()
+
+        def record(method):
+            def wrapper(*args):
+                threads.add(threading.get_ident())
+                return method(*args)
+
+            return wrapper
+
+        async def mock_execute(payload, config, session, outcome):
+            return {"results": [{"content": payload["query"]}]}
+
+        with patch.object(cache, "get", record(cache.get)), patch.object(
+            cache, "set", record(cache.set)
+        ), patch.object(
+            client, "_execute_with_timeout", side_effect=mock_execute
+        ):
+            await client.ecommerce.amazon.scrape_search("nike")
+            result = await client.ecommerce.amazon.scrape_search("nike")
+
+        self.assertEqual(result.results[0].content, "nike")
+        self.assertEqual(cache.hits, 1)
+        self.assertTrue(threads)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    async def test_batch_only_submits_missing_payloads(self):
+        """
+        Tests that a rerun batch only submits payloads without a cached
+        result.
+        """
+        cache = ResultCache()
+        cache.set({"source": "google_search", "query": "a"}, {"q": "a"})
+        client = AsyncClient("user", "pass", cache=cache)
+
+        async def mock_submit_batch(payloads, request_timeout, session):
+            return [payload["query"] for payload in payloads]
+
+        async def mock_get_job_result(
+            job_id, config, session, source, outcome
+        ):
+            return {"results": [{"content": job_id}]}
+
+        with patch.object(
+            client, "submit_batch", side_effect=mock_submit_batch
+        ) as mock_submit, patch.object(
+            client, "_get_job_result", side_effect=mock_get_job_result
+        ):
+            responses = await client.serp.scrape_batch(
+                [
+                    {"source": "google_search", "query": "a"},
+                    {"source": "google_search", "query": "b"},
+                ]
+            )
+
+        submitted = mock_submit.call_args[0][0]
+        self.assertEqual(
+            submitted, [{"source": "google_search", "query": "b"}]
+        )
+        self.assertEqual(responses[1].results[0].content, "b")
+        self.assertIsNotNone(
+            cache.get({"source": "google_search", "query": "b"})
+        )
@@ -0,0 +1,103 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import aiohttp
+
+from oxylabs.internal import AsyncClient, CallbackServer
+
+
+class TestCallbackServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = CallbackServer(
+            "https://example.com/callback?src=oxylabs", port=0
+        )
+        await self.server.start()
+        self.client = AsyncClient("user", "pass", callback_server=self.server)
+
+    async def asyncTearDown(self):
+        await self.server.stop()
+
+    async def notify(self, job_id, status, token=None, expected=200):
+        """
+        Posts a job notification the same way the API does, forwarded to
+        the local server.
+        """
+        token = self.server.token if token is None else token
+        async with aiohttp.ClientSession() as session:
+            async with session.post(
+                f"http://127.0.0.1:{self.server.port}/callback",
+                params={"token": token},
+                json={"id": job_id, "status": status},
+            ) as response:
+                self.assertEqual(response.status, expected)
+
+    async def test_callback_resolves_job_without_polling(self):
+        """
+        Tests that a job completes as soon as its callback arrives and the
+        status endpoint is never polled.
+        """
+        with patch.object(self.client, "_poll_job_status") as mock_poll:
+            waiter = asyncio.ensure_future(
+                self.client._wait_for_job("123", 5, None, 50)
+            )
+            await asyncio.sleep(0)
+            await self.notify("123", "done")
+            self.assertTrue(await waiter)
+            mock_poll.assert_not_called()
+
+    async def test_early_callback_is_kept(self):
+        """
+        Tests that a callback arriving before anyone waits on the job is not
+        lost.
+        """
+        await self.notify("456", "faulted")
+        with patch.object(self.client, "_poll_job_status") as mock_poll:
+            self.assertFalse(
+                await self.client._wait_for_job("456", 5, None, 50)
+            )
+            mock_poll.assert_not_called()
+
+    async def test_callback_without_token_is_rejected(self):
+        """
+        Tests that callbacks not carrying the server's token are rejected
+        and do not resolve the job.
+        """
+        await self.notify("321", "done", token="wrong", expected=403)
+
+        self.assertNotIn("321", self.server._unclaimed)
+
+    async def test_missing_callback_falls_back_to_polling(self):
+        """
+        Tests that jobs whose callback never arrives are polled.
+        """
+        self.server.fallback_after = 0.01
+
+        async def mock_poll(job_id, poll_interval, session, timeout, source):
+            return True
+
+        with patch.object(
+            self.client, "_poll_job_status", side_effect=mock_poll
+        ) as poll:
+            self.assertTrue(
+                await self.client._wait_for_job("789", 5, None, 50)
+            )
+            poll.assert_called_once()
+
+    def test_callback_url_is_injected(self):
+        """
+        Tests that submitted payloads point their callback at the server
+        unless they set their own.
+        """
+        payload = self.client._prepare_payload({"source": "bing_search"})
+        self.assertEqual(payload["callback_url"], self.server.url)
+        self.assertEqual(
+            self.server.url,
+            "https://example.com/callback?src=oxylabs&token="
+            + self.server.token,
+        )
+
+        payload = self.client._prepare_payload(
+            {"source": "bing_search", "callback_url": "https://example.com"}
+        )
+        self.assertEqual(payload["callback_url"], "https://example.com")
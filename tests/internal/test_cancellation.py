@@ -0,0 +1,176 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from oxylabs.internal import AsyncClient
+
+
+class TestRemoteCancellation(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = AsyncClient("user", "pass")
+        self.waiting = asyncio.Event()
+
+        async def mock_get_job_id(payload, session, timeout, outcome=None):
+            return f"job-{payload['query']}"
+
+        async def mock_wait_for_job(
+            job_id, poll_interval, session, timeout, source
+        ):
+            self.waiting.set()
+            await asyncio.sleep(0 if job_id.endswith("fast") else 10)
+            return True
+
+        async def mock_get_http_resp(
+            job_id,
+            session,
+            outcome=None,
+            request_timeout=None,
+            typed_source=None,
+        ):
+            return {"results": [{"content": job_id}]}
+
+        for name, mock in (
+            ("_get_job_id", mock_get_job_id),
+            ("_wait_for_job", mock_wait_for_job),
+            ("_get_http_resp", mock_get_http_resp),
+        ):
+            patcher = patch.object(self.client, name, side_effect=mock)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        patcher = patch.object(self.client, "cancel_job", new=AsyncMock())
+        self.cancel_job = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_cancelling_the_caller_cancels_the_job(self):
+        """
+        Tests that cancelling a waiting scrape sends a job cancel.
+        """
+        task = asyncio.ensure_future(
+            self.client.serp.google.scrape_search("nike")
+        )
+        await self.waiting.wait()
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+        self.cancel_job.assert_awaited_once_with("job-nike")
+        self.assertIsNone(self.client._session)
+
+    async def test_job_submitted_after_cancelling_is_cancelled(self):
+        """
+        Tests that a job created by a submission in flight when the caller
+        was cancelled is cancelled once its ID arrives.
+        """
+        submitting = asyncio.Event()
+        submitted = asyncio.Event()
+
+        async def mock_get_job_id(payload, session, timeout, outcome=None):
+            submitting.set()
+            await submitted.wait()
+            return "job-nike"
+
+        with patch.object(
+            self.client, "_get_job_id", side_effect=mock_get_job_id
+        ):
+            task = asyncio.ensure_future(
+                self.client.serp.google.scrape_search("nike")
+            )
+            await submitting.wait()
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            self.cancel_job.assert_not_awaited()
+
+            submitted.set()
+            for _ in range(3):
+                await asyncio.sleep(0)
+
+        self.cancel_job.assert_awaited_once_with("job-nike")
+        self.assertIsNone(self.client._session)
+
+    async def test_deadline_cancels_the_job(self):
+        """
+        Tests that a job outliving its deadline is cancelled.
+        """
+        response = await self.client.serp.google.scrape_search(
+            "nike", deadline=0.05
+        )
+        await asyncio.sleep(0)
+
+        self.assertEqual(response.error, "Deadline exceeded")
+        self.cancel_job.assert_awaited_once_with("job-nike")
+
+    async def test_scrape_many_stops_after_enough_results(self):
+        """
+        Tests that scrape_many stops once enough requests succeeded and
+        cancels the jobs of the rest.
+        """
+        calls = [
+            ("serp.google.scrape_search", {"query": query})
+            for query in ("a-fast", "b", "c-fast", "d")
+        ]
+
+        results = self.client.scrape_many(calls, concurrency=4, stop_after=2)
+        try:
+            contents = [
+                result.response.results[0].content async for result in results
+            ]
+        finally:
+            await results.aclose()
+        await asyncio.sleep(0)
+
+        self.assertEqual(sorted(contents), ["job-a-fast", "job-c-fast"])
+        self.assertEqual(
+            sorted(call.args[0] for call in self.cancel_job.await_args_list),
+            ["job-b", "job-d"],
+        )
+
+    async def test_scrape_many_stops_at_the_deadline(self):
+        """
+        Tests that scrape_many stops once its deadline passed and cancels
+        the jobs still in flight.
+        """
+        calls = [
+            ("serp.google.scrape_search", {"query": query})
+            for query in ("a-fast", "b")
+        ]
+
+        results = self.client.scrape_many(calls, deadline=0.5)
+        try:
+            contents = [
+                result.response.results[0].content async for result in results
+            ]
+        finally:
+            await results.aclose()
+        await asyncio.sleep(0)
+
+        self.assertEqual(contents, ["job-a-fast"])
+        self.assertEqual(
+            [call.args[0] for call in self.cancel_job.await_args_list],
+            ["job-b"],
+        )
+
+
+class TestCancelJob(unittest.IsolatedAsyncioTestCase):
+    async def test_cancel_job_posts_to_the_cancel_endpoint(self):
+        """
+        Tests that cancel_job posts to the job's cancel endpoint and
+        reports failures instead of raising them.
+        """
+        client = AsyncClient("user", "pass")
+
+        with patch.object(
+            client, "_request_json", new=AsyncMock(return_value={})
+        ) as mock_request:
+            self.assertTrue(await client.cancel_job("1"))
+        self.assertEqual(
+            mock_request.await_args.args[:2],
+            ("POST", "https://data.oxylabs.io/v1/queries/1/cancel"),
+        )
+
+        with patch.object(
+            client, "_request_json", new=AsyncMock(side_effect=Exception)
+        ):
+            self.assertFalse(await client.cancel_job("1"))
@@ -0,0 +1,97 @@
+import importlib.util
+import json
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+from oxylabs.internal import (
+    AsyncClient,
+    JSONCodec,
+    OrjsonCodec,
+    RealtimeClient,
+)
+from oxylabs.internal.codec import get_codec
+
+HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+
+
+class TestGetCodec(unittest.TestCase):
+    def test_resolves_names_and_instances(self):
+        """
+        Tests that codecs are resolved by name, that instances are used
+        as they are, and that None keeps the HTTP library's JSON handling.
+        """
+        codec = JSONCodec()
+
+        self.assertIs(get_codec(codec), codec)
+        self.assertIsNone(get_codec(None))
+        self.assertIsInstance(get_codec("json"), JSONCodec)
+        with self.assertRaises(ValueError):
+            get_codec("yaml")
+
+    def test_auto_falls_back_to_stdlib(self):
+        """
+        Tests that "auto" uses the standard library when no faster codec
+        is installed.
+        """
+        with patch.dict("sys.modules", {"orjson": None, "msgspec": None}):
+            codec = get_codec("auto")
+
+        self.assertIs(type(codec), JSONCodec)
+
+    @unittest.skipUnless(HAS_ORJSON, "orjson is not installed")
+    def test_orjson_round_trip(self):
+        """
+        Tests that the orjson codec encodes and decodes like the standard
+        library.
+        """
+        codec = OrjsonCodec()
+        data = {"query": "nike", "pages": 2, "context": [{"key": "é"}]}
+
+        self.assertEqual(json.loads(codec.dumps(data)), data)
+        self.assertEqual(codec.loads(json.dumps(data).encode()), data)
+        self.assertIsInstance(get_codec("auto"), OrjsonCodec)
+
+
+class TestClientCodec(unittest.IsolatedAsyncioTestCase):
+    def test_realtime_client_uses_codec(self):
+        """
+        Tests that the realtime client sends payloads and decodes
+        responses with its codec.
+        """
+        client = RealtimeClient("user", "pass", codec="json")
+        self.addCleanup(client.close)
+        response = Mock(status_code=200, content=b'{"results": []}')
+
+        with patch.object(
+            client._session, "post", return_value=response
+        ) as mock_post:
+            result = client.serp.bing.scrape_search("nike")
+
+        sent = json.loads(mock_post.call_args.kwargs["data"])
+        self.assertEqual(sent["query"], "nike")
+        self.assertNotIn("json", mock_post.call_args.kwargs)
+        self.assertEqual(result.raw, {"results": []})
+
+    async def test_async_client_uses_codec(self):
+        """
+        Tests that the async client sends payloads and decodes responses
+        with its codec.
+        """
+        client = AsyncClient("user", "pass", codec="json")
+        response = MagicMock(status=200, headers={})
+        response.__aenter__.return_value = response
+
+        async def read():
+            return b'{"id": "1"}'
+
+        response.read = read
+        session = Mock()
+        session.request.return_value = response
+
+        data = await client._request_json(
+            "POST", "url", "url", session, payload={"query": "nike"}
+        )
+
+        self.assertEqual(data, {"id": "1"})
+        sent = session.request.call_args.kwargs["data"]
+        self.assertEqual(json.loads(sent), {"query": "nike"})
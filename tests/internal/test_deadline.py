@@ -0,0 +1,109 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from oxylabs.internal import AsyncClient
+
+
+class TestDeadline(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = AsyncClient("user", "pass")
+        self.timeouts = {}
+        self.job_durations = {}
+
+        async def mock_get_job_id(payload, session, timeout, outcome=None):
+            self.timeouts["submit"] = timeout
+            return payload.get("query")
+
+        async def mock_wait_for_job(
+            job_id, poll_interval, session, timeout, source
+        ):
+            self.timeouts["wait"] = timeout
+            await asyncio.sleep(self.job_durations.get(job_id, 0))
+            return True
+
+        async def mock_get_http_resp(
+            job_id,
+            session,
+            outcome=None,
+            request_timeout=None,
+            typed_source=None,
+        ):
+            self.timeouts["fetch"] = request_timeout
+            return {"results": [{"content": job_id}]}
+
+        self.mocks = {}
+        for name, mock in (
+            ("_get_job_id", mock_get_job_id),
+            ("_wait_for_job", mock_wait_for_job),
+            ("_get_http_resp", mock_get_http_resp),
+        ):
+            patcher = patch.object(self.client, name, side_effect=mock)
+            self.mocks[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_sub_calls_get_the_remaining_budget(self):
+        """
+        Tests that every request is given at most the time left until the
+        deadline.
+        """
+        response = await self.client.serp.google.scrape_search(
+            "nike", request_timeout=100, job_completion_timeout=100, deadline=5
+        )
+
+        self.assertIsNone(response.error)
+        for phase in ("submit", "wait", "fetch"):
+            self.assertLessEqual(self.timeouts[phase], 5)
+
+    async def test_deadline_bounds_the_whole_call(self):
+        """
+        Tests that a job not done by the deadline fails without fetching
+        its results.
+        """
+        self.job_durations["nike"] = 10
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        response = await self.client.serp.google.scrape_search(
+            "nike", deadline=0.1
+        )
+
+        self.assertLess(loop.time() - started, 1)
+        self.assertEqual(response.error, "Deadline exceeded")
+        self.mocks["_get_http_resp"].assert_not_called()
+
+    async def test_missing_job_id_fails_fast(self):
+        """
+        Tests that a failed submission does not go on to poll.
+        """
+        self.mocks["_get_job_id"].side_effect = None
+        self.mocks["_get_job_id"].return_value = None
+
+        response = await self.client.ecommerce.amazon.scrape_product("1")
+
+        self.assertEqual(response.error, "Failed to get job ID")
+        self.mocks["_wait_for_job"].assert_not_called()
+
+    async def test_batch_deadline(self):
+        """
+        Tests that jobs of a batch done in time are returned and the rest
+        fail once the batch deadline passes.
+        """
+        self.job_durations["slow"] = 10
+
+        async def mock_submit_batch(payloads, request_timeout, session):
+            return [payload["query"] for payload in payloads]
+
+        with patch.object(
+            self.client, "submit_batch", side_effect=mock_submit_batch
+        ):
+            fast, slow = await self.client.serp.scrape_batch(
+                [
+                    {"source": "google_search", "query": "fast"},
+                    {"source": "google_search", "query": "slow"},
+                ],
+                deadline=0.1,
+            )
+
+        self.assertEqual(fast.results[0].content, "fast")
+        self.assertEqual(slow.error, "Deadline exceeded")
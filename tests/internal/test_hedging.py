@@ -0,0 +1,124 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from oxylabs.internal import HedgePolicy, RealtimeClient
+
+
+class TestHedgePolicy(unittest.TestCase):
+    def test_delay_follows_latency_percentile(self):
+        """
+        Tests that requests are hedged at the latency percentile of their
+        source once enough latencies are known.
+        """
+        policy = HedgePolicy(percentile=0.5, min_samples=3)
+        policy.record("bing_search", 1)
+        policy.record("bing_search", 3)
+
+        self.assertIsNone(policy.hedge_delay("bing_search"))
+
+        policy.record("bing_search", 2)
+
+        self.assertEqual(policy.hedge_delay("bing_search"), 2)
+        self.assertIsNone(policy.hedge_delay("google_search"))
+
+    def test_budget_caps_hedged_ratio(self):
+        """
+        Tests that at most `max_ratio` of the requests are hedged.
+        """
+        policy = HedgePolicy(max_ratio=0.1, min_samples=1)
+        hedged = 0
+        for _ in range(100):
+            policy.hedge_delay("bing_search")
+            hedged += policy.acquire()
+
+        self.assertEqual(hedged, 10)
+        self.assertEqual(policy.hedged, 10)
+
+
+class TestRealtimeHedging(unittest.TestCase):
+    def setUp(self):
+        self.policy = HedgePolicy(min_samples=1, max_ratio=1)
+        self.policy.record("bing_search", 0.05)
+        self.client = RealtimeClient("user", "pass", hedge_policy=self.policy)
+        self.addCleanup(self.client.close)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+        def post(*args, **kwargs):
+            with self.lock:
+                self.calls += 1
+                call = self.calls
+            response = Mock(status_code=200)
+            response.json.return_value = {"results": [{"content": call}]}
+            if call == 1:
+                time.sleep(1)
+            return response
+
+        patcher = patch.object(self.client._session, "post", side_effect=post)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_slow_request_is_hedged(self):
+        """
+        Tests that a request slower than the hedge delay is duplicated and
+        the faster answer is used.
+        """
+        started = time.monotonic()
+        response = self.client.serp.bing.scrape_search("nike")
+
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(response.results[0].content, 2)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(self.policy.hedged, 1)
+
+    def test_requests_are_hedged_after_closing(self):
+        """
+        Tests that the client still hedges requests after it was closed.
+        """
+        self.client.serp.bing.scrape_search("nike")
+        self.client.close()
+        with self.lock:
+            self.calls = 0
+
+        response = self.client.serp.bing.scrape_search("nike")
+
+        self.assertEqual(response.results[0].content, 2)
+        self.assertEqual(self.policy.hedged, 2)
+
+    def test_queue_time_does_not_count_toward_the_delay(self):
+        """
+        Tests that the hedge delay starts when the request starts, not
+        while it waits for a free worker.
+        """
+        policy = HedgePolicy(min_samples=1, max_ratio=1)
+        policy.record("bing_search", 0.5)
+        client = RealtimeClient("user", "pass", hedge_policy=policy)
+        self.addCleanup(client.close)
+        client._hedge_executor = ThreadPoolExecutor(max_workers=1)
+        client._hedge_executor.submit(time.sleep, 0.6)
+        response = Mock(status_code=200)
+        response.json.return_value = {"results": [{"content": 1}]}
+
+        def post(*args, **kwargs):
+            time.sleep(0.1)
+            return response
+
+        with patch.object(client._session, "post", side_effect=post):
+            response = client.serp.bing.scrape_search("nike")
+
+        self.assertEqual(response.results[0].content, 1)
+        self.assertEqual(policy.hedged, 0)
+
+    def test_no_hedge_without_budget(self):
+        """
+        Tests that requests are not hedged once the budget is spent.
+        """
+        self.policy._max_ratio = 0
+
+        response = self.client.serp.bing.scrape_search("nike")
+
+        self.assertEqual(response.results[0].content, 1)
+        self.assertEqual(self.calls, 1)
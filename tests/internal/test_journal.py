@@ -0,0 +1,216 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from oxylabs.internal import (
+    AsyncClient,
+    JobJournal,
+    RateLimiter,
+    ResultCache,
+)
+from oxylabs.internal.retry import APIError
+
+
+class TestJobJournal(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "jobs.jsonl")
+
+    def test_pending_jobs_survive_reopening(self):
+        """
+        Tests that unfinished jobs are replayed from the file, torn records
+        are skipped and finished jobs are compacted away.
+        """
+        journal = JobJournal(self.path)
+        journal.record_submitted("1", {"source": "amazon_product", "q": 1})
+        journal.record_submitted("2", {"source": "amazon_product", "q": 2})
+        journal.record_finished("1")
+        journal.close()
+        with open(self.path, "a") as file:
+            file.write('{"event": "submi')
+
+        journal = JobJournal(self.path)
+        self.addCleanup(journal.close)
+
+        self.assertEqual(
+            journal.pending(), [("2", {"source": "amazon_product", "q": 2})]
+        )
+        self.assertEqual(
+            journal.pending_job({"q": 2, "source": "amazon_product"}), "2"
+        )
+        with open(self.path) as file:
+            self.assertEqual(len(file.readlines()), 1)
+
+    def test_old_pending_jobs_expire(self):
+        """
+        Tests that jobs pending for longer than the maximum age are dropped,
+        both while the journal is open and when it is reopened.
+        """
+        with patch("oxylabs.internal.journal.time.time", return_value=0):
+            journal = JobJournal(self.path, max_age=10)
+            journal.record_submitted("1", {"q": 1})
+        with patch("oxylabs.internal.journal.time.time", return_value=5):
+            journal.record_submitted("2", {"q": 2})
+        with patch("oxylabs.internal.journal.time.time", return_value=11):
+            self.assertEqual(journal.pending(), [("2", {"q": 2})])
+            self.assertIsNone(journal.pending_job({"q": 1}))
+        journal.close()
+
+        with patch("oxylabs.internal.journal.time.time", return_value=16):
+            journal = JobJournal(self.path, max_age=10)
+        self.addCleanup(journal.close)
+        self.assertEqual(len(journal), 0)
+
+
+class TestClientJournal(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.journal = JobJournal(os.path.join(directory.name, "jobs.jsonl"))
+        self.addCleanup(self.journal.close)
+        self.client = AsyncClient("user", "pass", journal=self.journal)
+
+        async def mock_wait_for_job(job_id, *args):
+            return True
+
+        async def mock_get_http_resp(
+            job_id,
+            session,
+            outcome=None,
+            request_timeout=None,
+            typed_source=None,
+        ):
+            return {"results": [{"content": job_id}]}
+
+        for name, mock in (
+            ("_wait_for_job", mock_wait_for_job),
+            ("_get_http_resp", mock_get_http_resp),
+        ):
+            patcher = patch.object(self.client, name, side_effect=mock)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_jobs_are_journaled_until_fetched(self):
+        """
+        Tests that a job is journaled when submitted and dropped once its
+        results were fetched.
+        """
+
+        async def mock_get_job_id(payload, session, timeout, outcome=None):
+            self.assertEqual(self.journal.pending(), [])
+            return "1"
+
+        with patch.object(
+            self.client, "_get_job_id", side_effect=mock_get_job_id
+        ), patch.object(
+            self.journal,
+            "record_submitted",
+            wraps=self.journal.record_submitted,
+        ) as mock_record:
+            response = await self.client.serp.google.scrape_search("nike")
+
+        self.assertEqual(response.results[0].content, "1")
+        mock_record.assert_called_once()
+        self.assertEqual(len(self.journal), 0)
+
+    async def test_pending_job_is_not_resubmitted(self):
+        """
+        Tests that a request whose job is journaled as pending awaits that
+        job instead of submitting a new one.
+        """
+        self.journal.record_submitted(
+            "42",
+            {"source": "amazon_product", "query": "B07FZ8S74R", "parse": True},
+        )
+
+        with patch.object(self.client, "_get_job_id") as mock_get_job_id:
+            response = await self.client.ecommerce.amazon.scrape_product(
+                "B07FZ8S74R", parse=True
+            )
+
+        mock_get_job_id.assert_not_called()
+        self.assertEqual(response.results[0].content, "42")
+        self.assertEqual(len(self.journal), 0)
+
+    async def test_resume_fetches_pending_jobs(self):
+        """
+        Tests that resume fetches every pending job without resubmitting it
+        and caches the results.
+        """
+        self.client._cache = ResultCache()
+        payloads = [
+            {"source": "google_search", "query": "a"},
+            {"source": "google_search", "query": "b"},
+        ]
+        self.journal.record_submitted("1", payloads[0])
+        self.journal.record_submitted("2", payloads[1])
+
+        results = await self.client.resume()
+
+        self.assertEqual([result.request for result in results], payloads)
+        self.assertEqual(
+            [result.response["results"][0]["content"] for result in results],
+            ["1", "2"],
+        )
+        self.assertEqual(len(self.journal), 0)
+        self.assertIsNotNone(self.client._cache.get(payloads[1]))
+
+        async def mock_submit_chunk(field, shared, values, session, timeout):
+            return [f"new-{value}" for value in values]
+
+        self.journal.record_submitted("3", payloads[0])
+        with patch.object(
+            self.client, "_submit_batch_chunk", side_effect=mock_submit_chunk
+        ):
+            job_ids = await self.client.submit_batch(payloads)
+
+        self.assertEqual(job_ids, ["3", "new-b"])
+
+    async def test_resume_bounds_the_jobs_awaited_at_once(self):
+        """
+        Tests that resume awaits at most as many jobs at a time as the
+        rate limiter's concurrency limit.
+        """
+        self.client._rate_limiter = RateLimiter(max_concurrency=2)
+        for job_id in range(5):
+            self.journal.record_submitted(str(job_id), {"query": job_id})
+        waiting = 0
+        most_waiting = 0
+
+        async def mock_wait_for_job(job_id, *args):
+            nonlocal waiting, most_waiting
+            waiting += 1
+            most_waiting = max(most_waiting, waiting)
+            await asyncio.sleep(0.01)
+            waiting -= 1
+            return True
+
+        with patch.object(
+            self.client, "_wait_for_job", side_effect=mock_wait_for_job
+        ):
+            results = await self.client.resume()
+
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(most_waiting, 2)
+
+    async def test_unknown_jobs_are_dropped(self):
+        """
+        Tests that a journaled job the API no longer knows is recorded as
+        finished instead of staying pending forever.
+        """
+        self.journal.record_submitted("1", {"source": "google_search"})
+        self.journal.record_submitted("2", {"source": "bing_search"})
+        config = {"request_timeout": 1}
+        errors = [APIError("HTTP error occurred: 404", 404), Exception("x")]
+
+        with patch.object(self.client, "_get_job_status", side_effect=errors):
+            await self.client._journal_faulted("1", None, config)
+            await self.client._journal_faulted("2", None, config)
+
+        self.assertEqual(
+            self.journal.pending(), [("2", {"source": "bing_search"})]
+        )
@@ -0,0 +1,178 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+from oxylabs.internal import (
+    AdaptivePollPolicy,
+    AsyncClient,
+    FixedPollPolicy,
+    PollPolicy,
+)
+
+
+class FakeResponse:
+    status = 200
+    reason = "OK"
+    headers = {}
+
+    def __init__(self, status):
+        self._status = status
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def json(self, content_type="application/json"):
+        return {"status": self._status}
+
+
+class TestAdaptivePollPolicy(unittest.TestCase):
+    def test_backoff_is_capped_by_poll_interval(self):
+        """
+        Tests that delays grow exponentially but never exceed the poll
+        interval of the call.
+        """
+        policy = AdaptivePollPolicy(first_check=1, multiplier=2, jitter=0)
+        delays = [policy.next_delay("src", n, 0, 5) for n in range(5)]
+        self.assertEqual(delays, [1, 2, 4, 5, 5])
+
+    def test_first_check_is_seeded_from_completion_times(self):
+        """
+        Tests that the first check moves to the observed completion time
+        percentile once enough jobs completed.
+        """
+        policy = AdaptivePollPolicy(
+            first_check=1, jitter=0, percentile=0.5, min_samples=3
+        )
+        for duration in (8, 2, 4):
+            policy.record("amazon_product", duration)
+
+        self.assertEqual(policy.completion_time("amazon_product"), 4)
+        self.assertEqual(policy.next_delay("amazon_product", 0, 1, 10), 3)
+        self.assertEqual(policy.next_delay("google_search", 0, 1, 10), 1)
+
+    def test_seeded_first_check_is_not_capped(self):
+        """
+        Tests that a first check seeded from completion times may exceed
+        the poll interval, while the backoff after it does not.
+        """
+        policy = AdaptivePollPolicy(
+            first_check=1, multiplier=2, jitter=0, min_samples=1
+        )
+        policy.record("amazon_product", 30)
+
+        self.assertEqual(policy.next_delay("amazon_product", 0, 0, 5), 30)
+        self.assertEqual(policy.next_delay("amazon_product", 3, 30, 5), 5)
+
+
+class TestPollJobStatus(unittest.IsolatedAsyncioTestCase):
+    async def test_custom_policy_schedules_checks(self):
+        """
+        Tests that a custom policy decides the delay before every status
+        check.
+        """
+
+        class RecordingPolicy(PollPolicy):
+            def __init__(self):
+                self.attempts = []
+
+            def next_delay(self, source, attempt, elapsed, poll_interval):
+                self.attempts.append((source, attempt))
+                return 0
+
+        policy = RecordingPolicy()
+        client = AsyncClient("user", "pass", poll_policy=policy)
+        session = MagicMock()
+        session.request.side_effect = [
+            FakeResponse("pending"),
+            FakeResponse("pending"),
+            FakeResponse("done"),
+        ]
+
+        completed = await client._poll_job_status(
+            "1", 5, session, 10, "bing_search"
+        )
+
+        self.assertTrue(completed)
+        self.assertEqual(session.request.call_count, 3)
+        self.assertEqual(
+            policy.attempts,
+            [("bing_search", 0), ("bing_search", 1), ("bing_search", 2)],
+        )
+
+    async def test_completion_times_are_recorded(self):
+        """
+        Tests that completed jobs feed their duration back to the policy.
+        """
+        policy = FixedPollPolicy()
+        client = AsyncClient("user", "pass", poll_policy=policy)
+        session = MagicMock()
+        session.request.return_value = FakeResponse("done")
+
+        with patch.object(policy, "record") as mock_record:
+            await client._wait_for_job("1", 5, session, 10, "bing_search")
+
+        mock_record.assert_called_once()
+        self.assertEqual(mock_record.call_args[0][0], "bing_search")
+
+
+class TestJobPoller(unittest.IsolatedAsyncioTestCase):
+    async def test_jobs_share_one_rate_limited_poller(self):
+        """
+        Tests that concurrently awaited jobs are checked by a single poller
+        under the client's status check budget.
+        """
+
+        class ImmediatePolicy(PollPolicy):
+            def next_delay(self, source, attempt, elapsed, poll_interval):
+                return 0
+
+        client = AsyncClient(
+            "user", "pass", poll_policy=ImmediatePolicy(), poll_rate=200
+        )
+        checks = {}
+
+        async def mock_get_job_status(job_id, session, request_timeout):
+            checks[job_id] = checks.get(job_id, 0) + 1
+            return "done" if checks[job_id] == 2 else "pending"
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with patch.object(
+            client, "_get_job_status", side_effect=mock_get_job_status
+        ):
+            results = await asyncio.gather(
+                *(
+                    client._poll_job_status(str(i), 5, None, 10)
+                    for i in range(20)
+                )
+            )
+
+        self.assertTrue(all(results))
+        self.assertEqual(sum(checks.values()), 40)
+        # 40 checks at 200 per second take at least ~0.2 seconds.
+        self.assertGreaterEqual(loop.time() - started, 0.19)
+        self.assertEqual(client._poller.pending, 0)
+
+    async def test_cancelled_waiter_is_dropped(self):
+        """
+        Tests that cancelling a waiting coroutine stops polling its job.
+        """
+        client = AsyncClient("user", "pass", poll_policy=FixedPollPolicy())
+
+        async def mock_get_job_status(job_id, session, request_timeout):
+            return "pending"
+
+        with patch.object(
+            client, "_get_job_status", side_effect=mock_get_job_status
+        ) as mock_status:
+            waiter = asyncio.ensure_future(
+                client._poll_job_status("1", 0.05, None, 10)
+            )
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            await asyncio.sleep(0.1)
+
+        self.assertEqual(mock_status.call_count, 1)
@@ -0,0 +1,86 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+from oxylabs.internal import AsyncClient, RateLimiter
+from oxylabs.internal.rate_limit import TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_reservations_queue_past_the_burst(self):
+        """
+        Tests that reservations beyond the burst are told to wait in order.
+        """
+        bucket = TokenBucket(rate=10, burst=2)
+        waits = [bucket.reserve() for _ in range(4)]
+
+        self.assertEqual(waits[:2], [0, 0])
+        self.assertAlmostEqual(waits[2], 0.1, places=2)
+        self.assertAlmostEqual(waits[3], 0.2, places=2)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_source_rate_applies_on_top_of_overall_rate(self):
+        """
+        Tests that a source with its own rate is paced by the slower of the
+        two buckets.
+        """
+        limiter = RateLimiter(rate=100, source_rates={"amazon_product": 1})
+        self.assertEqual(limiter._reserve("amazon_product", 1), 0)
+        self.assertGreater(limiter._reserve("amazon_product", 1), 0.9)
+        self.assertEqual(limiter._reserve("google_search", 1), 0)
+
+    def test_realtime_requests_are_paced(self):
+        """
+        Tests that realtime requests wait for the limiter before being sent.
+        """
+        limiter = RateLimiter(rate=20, burst=1)
+        started = time.monotonic()
+        for _ in range(3):
+            with limiter.limit("bing_search"):
+                pass
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+
+
+class TestAsyncRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_jobs_in_flight_are_capped(self):
+        """
+        Tests that no more than max_concurrency jobs run at the same time.
+        """
+        client = AsyncClient(
+            "user", "pass", rate_limiter=RateLimiter(max_concurrency=2)
+        )
+        running = 0
+        peak = 0
+
+        async def mock_get_job_id(payload, session, request_timeout, outcome):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            return "1"
+
+        async def mock_get_job_result(
+            job_id, config, session, source, outcome
+        ):
+            nonlocal running
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"results": []}
+
+        config = {"request_timeout": 5}
+        with patch.object(
+            client, "_get_job_id", side_effect=mock_get_job_id
+        ), patch.object(
+            client, "_get_job_result", side_effect=mock_get_job_result
+        ):
+            await asyncio.gather(
+                *(
+                    client._execute_with_timeout(
+                        {"source": "bing_search"}, config, None
+                    )
+                    for _ in range(6)
+                )
+            )
+
+        self.assertEqual(peak, 2)
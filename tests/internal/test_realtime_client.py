@@ -0,0 +1,38 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from oxylabs.internal import RealtimeClient
+
+
+class TestRealtimeClientSession(unittest.TestCase):
+    def test_requests_share_pooled_session(self):
+        """
+        Tests that realtime requests go through the client's pooled session
+        instead of opening a new connection per request.
+        """
+        client = RealtimeClient("user", "pass", pool_maxsize=4)
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"results": []}
+
+        with patch.object(
+            client._session, "post", return_value=mock_response
+        ) as mock_post:
+            client.serp.bing.scrape_search("nike")
+            client.serp.bing.scrape_search("adidas")
+
+        self.assertEqual(mock_post.call_count, 2)
+        adapter = client._session.get_adapter(client._base_url)
+        self.assertEqual(adapter._pool_maxsize, 4)
+
+    def test_context_manager_closes_session(self):
+        """
+        Tests that leaving the client's context closes its session.
+        """
+        client = RealtimeClient("user", "pass")
+        with patch.object(client._session, "close") as mock_close:
+            with client as entered:
+                self.assertIs(entered, client)
+                mock_close.assert_not_called()
+            mock_close.assert_called_once()
@@ -0,0 +1,245 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import requests
+
+from oxylabs.internal import AsyncClient, RealtimeClient
+from oxylabs.internal.retry import (
+    APIError,
+    CircuitBreaker,
+    CircuitOpenError,
+    RequestOutcome,
+    RetryableError,
+    RetryEngine,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+def mock_response(status_code, data=None, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.reason = "reason"
+    response.headers = headers or {}
+    response.text = ""
+    response.json.return_value = data
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            f"{status_code} error"
+        )
+    return response
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_backoff_honors_retry_after(self):
+        """
+        Tests that a Retry-After value overrides the jittered backoff, up
+        to the maximum backoff.
+        """
+        policy = RetryPolicy(backoff_base=1, backoff_max=4)
+        self.assertEqual(policy.backoff(0, retry_after=3), 3)
+        self.assertEqual(policy.backoff(0, retry_after=3600), 4)
+        for retry in range(5):
+            self.assertLessEqual(policy.backoff(retry), 4)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("3"), 3)
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_circuit_opens_after_consecutive_failures(self):
+        """
+        Tests that an endpoint is shed once it keeps failing, while other
+        endpoints and rate limited responses are unaffected.
+        """
+        engine = RetryEngine(
+            RetryPolicy(max_retries=0),
+            CircuitBreaker(failure_threshold=2, recovery_timeout=60),
+        )
+
+        def failing():
+            raise RetryableError("HTTP error occurred: 503", 503)
+
+        def rate_limited():
+            raise RetryableError("HTTP error occurred: 429", 429)
+
+        for _ in range(3):
+            with self.assertRaises(RetryableError):
+                engine.call("results", rate_limited)
+        for _ in range(2):
+            with self.assertRaises(RetryableError):
+                engine.call("submit", failing)
+
+        outcome = RequestOutcome()
+        with self.assertRaises(CircuitOpenError):
+            engine.call("submit", lambda: "ok", outcome)
+        self.assertIn("Circuit open", outcome.error)
+        self.assertEqual(engine.call("results", lambda: "ok"), "ok")
+
+    def test_half_open_circuit_lets_a_single_probe_through(self):
+        """
+        Tests that once the recovery timeout passed only one call probes
+        the endpoint, and its success closes the circuit.
+        """
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        with patch("oxylabs.internal.retry.time.monotonic", return_value=0):
+            breaker.record_failure("submit")
+        with patch("oxylabs.internal.retry.time.monotonic", return_value=5):
+            self.assertFalse(breaker.allow("submit"))
+        with patch("oxylabs.internal.retry.time.monotonic", return_value=11):
+            self.assertTrue(breaker.allow("submit"))
+            self.assertFalse(breaker.allow("submit"))
+            breaker.record_success("submit")
+            self.assertTrue(breaker.allow("submit"))
+            self.assertTrue(breaker.allow("submit"))
+
+    def test_non_retryable_errors_are_not_retried(self):
+        """
+        Tests that a transient error flagged as not retryable is raised
+        right away, as a transient failure.
+        """
+        engine = RetryEngine(RetryPolicy(max_retries=3, backoff_base=0))
+        attempt = Mock(side_effect=RetryableError("Timeout", retry=False))
+        outcome = RequestOutcome()
+
+        with self.assertRaises(RetryableError):
+            engine.call("submit", attempt, outcome)
+
+        self.assertEqual(attempt.call_count, 1)
+        self.assertTrue(outcome.transient)
+        self.assertEqual(outcome.retries, 0)
+
+
+class TestRealtimeRetries(unittest.TestCase):
+    def setUp(self):
+        self.client = RealtimeClient(
+            "user",
+            "pass",
+            retry_policy=RetryPolicy(max_retries=2, backoff_base=0),
+        )
+
+    def test_transient_errors_are_retried(self):
+        """
+        Tests that a 503 is retried and the retry count is recorded on the
+        response.
+        """
+        responses = [
+            mock_response(503),
+            mock_response(200, {"results": [{"content": "ok"}]}),
+        ]
+        with patch.object(self.client._session, "post", side_effect=responses):
+            result = self.client.serp.bing.scrape_search("nike")
+
+        self.assertEqual(result.results[0].content, "ok")
+        self.assertEqual(result.retries, 1)
+        self.assertIsNone(result.error)
+
+    def test_final_failure_reason_is_recorded(self):
+        """
+        Tests that exhausted retries leave the failure reason on the
+        response instead of a silently empty one.
+        """
+        with patch.object(
+            self.client._session,
+            "post",
+            side_effect=[mock_response(502) for _ in range(3)],
+        ):
+            result = self.client.serp.bing.scrape_search("nike")
+
+        self.assertEqual(result.results, [])
+        self.assertEqual(result.retries, 2)
+        self.assertIn("502", result.error)
+
+    def test_read_timeouts_are_not_retried(self):
+        """
+        Tests that a query that timed out waiting for the response is not
+        sent again, while one that failed to connect is.
+        """
+        with patch.object(
+            self.client._session,
+            "post",
+            side_effect=requests.exceptions.ReadTimeout(),
+        ) as mock_post:
+            result = self.client.serp.bing.scrape_search("nike")
+
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertIn("timed out", result.error)
+
+        with patch.object(
+            self.client._session,
+            "post",
+            side_effect=[
+                requests.exceptions.ConnectTimeout(),
+                mock_response(200, {"results": [{"content": "ok"}]}),
+            ],
+        ) as mock_post:
+            result = self.client.serp.bing.scrape_search("nike")
+
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(result.results[0].content, "ok")
+
+    def test_client_errors_are_not_retried(self):
+        with patch.object(
+            self.client._session,
+            "post",
+            side_effect=[mock_response(401)],
+        ) as mock_post:
+            result = self.client.serp.bing.scrape_search("nike")
+
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(result.retries, 0)
+        self.assertIn("401", result.error)
+
+
+class TestAsyncRetries(unittest.IsolatedAsyncioTestCase):
+    async def test_post_timeouts_are_not_retried(self):
+        """
+        Tests that a job submission that timed out is not sent again,
+        while a status check that timed out is.
+        """
+        client = AsyncClient(
+            "user",
+            "pass",
+            retry_policy=RetryPolicy(max_retries=2, backoff_base=0),
+        )
+        session = Mock()
+        session.request.side_effect = asyncio.TimeoutError
+
+        with self.assertRaises(RetryableError):
+            await client._request_json(
+                "POST", "url", "submit", session, payload={"query": "nike"}
+            )
+        self.assertEqual(session.request.call_count, 1)
+
+        session.request.reset_mock()
+        with self.assertRaises(RetryableError):
+            await client._request_json("GET", "url", "status", session)
+        self.assertEqual(session.request.call_count, 3)
+
+    async def test_error_bodies_keep_their_status(self):
+        """
+        Tests that an error response is raised as an APIError with its
+        status whatever its body holds.
+        """
+        client = AsyncClient("user", "pass")
+        for body, message in (
+            (b'{"message": "Not found"}', "Not found"),
+            (b"<html>Not found</html>", "<html>Not found</html>"),
+            (b"[]", "[]"),
+            (b"", "None"),
+        ):
+            response = MagicMock(status=404, reason="Not Found", headers={})
+            response.__aenter__.return_value = response
+            response.read = AsyncMock(return_value=body)
+            session = Mock()
+            session.request.return_value = response
+
+            with self.assertRaises(APIError) as error:
+                await client._request_json("GET", "url", "status", session)
+
+            self.assertEqual(error.exception.status, 404)
+            self.assertTrue(str(error.exception).endswith(message))
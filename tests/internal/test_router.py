@@ -0,0 +1,154 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from oxylabs.internal import RateLimiter, RetryPolicy, RouterClient
+
+
+class TestRouterClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = RouterClient(
+            "user",
+            "pass",
+            realtime_concurrency=1,
+            retry_policy=RetryPolicy(max_retries=0),
+        )
+        self.realtime_delay = 0
+        self.realtime_error = None
+        self.realtime_calls = []
+
+        def post(*args, **kwargs):
+            self.realtime_calls.append(time.monotonic())
+            time.sleep(self.realtime_delay)
+            if self.realtime_error is not None:
+                raise self.realtime_error
+            response = Mock(status_code=200)
+            response.json.return_value = {"results": [{"content": "realtime"}]}
+            return response
+
+        async def mock_get_job_id(payload, session, timeout, outcome=None):
+            return "job"
+
+        async def mock_wait_for_job(
+            job_id, poll_interval, session, timeout, source
+        ):
+            return True
+
+        async def mock_get_http_resp(
+            job_id,
+            session,
+            outcome=None,
+            request_timeout=None,
+            typed_source=None,
+        ):
+            return {"results": [{"content": "push_pull"}]}
+
+        for target, name, mock in (
+            (self.client._realtime._session, "post", post),
+            (self.client, "_get_job_id", mock_get_job_id),
+            (self.client, "_wait_for_job", mock_wait_for_job),
+            (self.client, "_get_http_resp", mock_get_http_resp),
+        ):
+            patcher = patch.object(target, name, side_effect=mock)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        await self.client.__aexit__(None, None, None)
+
+    async def test_uses_realtime_with_headroom(self):
+        """
+        Tests that requests are sent through Realtime while it has free
+        slots, and their latency is recorded.
+        """
+        response = await self.client.serp.bing.scrape_search("nike")
+
+        self.assertEqual(response.results[0].content, "realtime")
+        self.assertEqual(self.client.stats["realtime"], 1)
+        self.assertEqual(self.client.stats["realtime_in_flight"], 0)
+        self.assertIsNotNone(self.client.realtime_latency("bing_search"))
+        # Without a context manager, only the Push-Pull session is closed
+        # once idle, the Realtime lane is kept until the client is closed.
+        self.assertIsNone(self.client._session)
+        self.assertIsNotNone(self.client._executor)
+        with patch.object(self.client._realtime, "close") as close:
+            await self.client.close()
+        close.assert_called_once()
+        self.assertIsNone(self.client._executor)
+
+    async def test_saturated_realtime_overflows_to_push_pull(self):
+        """
+        Tests that requests beyond the Realtime concurrency are sent
+        through Push-Pull.
+        """
+        self.realtime_delay = 0.2
+
+        responses = await asyncio.gather(
+            self.client.serp.bing.scrape_search("nike"),
+            self.client.serp.bing.scrape_search("adidas"),
+        )
+
+        contents = sorted(r.results[0].content for r in responses)
+        self.assertEqual(contents, ["push_pull", "realtime"])
+        self.assertEqual(self.client.routed["push_pull"], 1)
+
+    async def test_integrations_share_the_concurrency_limit(self):
+        """
+        Tests that Realtime requests take their slot from the rate limiter's
+        concurrency limit, shared with Push-Pull jobs.
+        """
+        self.client._realtime_concurrency = 2
+        self.client._rate_limiter = RateLimiter(max_concurrency=1)
+        self.realtime_delay = 0.2
+
+        responses = await asyncio.gather(
+            self.client.serp.bing.scrape_search("nike"),
+            self.client.serp.bing.scrape_search("adidas"),
+        )
+
+        self.assertEqual(
+            [r.results[0].content for r in responses], ["realtime"] * 2
+        )
+        first, second = self.realtime_calls
+        self.assertGreaterEqual(second - first, 0.2)
+
+    async def test_slow_realtime_is_skipped_within_budget(self):
+        """
+        Tests that requests go through Push-Pull when recent Realtime
+        latencies exceed the latency budget.
+        """
+        self.client._latency_budget = 1
+        self.client._latencies["bing_search"] = [5]
+
+        response = await self.client.serp.bing.scrape_search("nike")
+
+        self.assertEqual(response.results[0].content, "push_pull")
+        google = await self.client.serp.google.scrape_search("nike")
+        self.assertEqual(google.results[0].content, "realtime")
+
+    async def test_realtime_timeout_falls_back_to_push_pull(self):
+        """
+        Tests that a Realtime request that times out is retried through
+        Push-Pull.
+        """
+        self.realtime_error = requests.exceptions.Timeout()
+
+        response = await self.client.serp.bing.scrape_search("nike")
+
+        self.assertIsNone(response.error)
+        self.assertEqual(response.results[0].content, "push_pull")
+        self.assertEqual(self.client.routed["fallback"], 1)
+
+    async def test_callbacks_use_push_pull(self):
+        """
+        Tests that requests with a callback URL are always sent through
+        Push-Pull.
+        """
+        response = await self.client.serp.bing.scrape_search(
+            "nike", callback_url="https://example.com/callback"
+        )
+
+        self.assertEqual(response.results[0].content, "push_pull")
@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from oxylabs.internal import AsyncClient, RealtimeClient
+from oxylabs.internal.singleflight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_calls_share_one_result(self):
+        """
+        Tests that threads asking for the same key share the first call.
+        """
+        flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            release.wait()
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [
+                executor.submit(flight.do, "key", fetch) for _ in range(5)
+            ]
+            time.sleep(0.05)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(results, ["result"] * 5)
+        self.assertEqual(len(calls), 1)
+
+    def test_errors_are_shared_and_not_kept(self):
+        """
+        Tests that waiters get the leader's error and the next call runs
+        again.
+        """
+        flight = SingleFlight()
+
+        with self.assertRaises(ValueError):
+            flight.do("key", Mock(side_effect=ValueError))
+        self.assertEqual(flight.do("key", lambda: 1), 1)
+
+    def test_realtime_client_coalesces_threads(self):
+        """
+        Tests that identical realtime requests from several threads make
+        one round trip.
+        """
+        client = RealtimeClient("user", "pass")
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"results": [{"content": "x"}]}
+
+        def post(*args, **kwargs):
+            time.sleep(0.05)
+            return mock_response
+
+        with patch.object(
+            client._session, "post", side_effect=post
+        ) as mock_post, ThreadPoolExecutor(max_workers=4) as executor:
+            responses = list(
+                executor.map(
+                    lambda _: client.serp.bing.scrape_search("nike"), range(4)
+                )
+            )
+
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertTrue(
+            all(response.results[0].content == "x" for response in responses)
+        )
+
+
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_async_client_coalesces_coroutines(self):
+        """
+        Tests that identical push-pull requests made concurrently share one
+        job, and different ones do not.
+        """
+        client = AsyncClient("user", "pass")
+
+        async def mock_execute(payload, config, session, outcome):
+            await asyncio.sleep(0.01)
+            return {"results": [{"content": payload["query"]}]}
+
+        with patch.object(
+            client, "_execute_with_timeout", side_effect=mock_execute
+        ) as mock_execute:
+            responses = await asyncio.gather(
+                client.serp.google.scrape_search("nike"),
+                client.serp.google.scrape_search("nike"),
+                client.serp.google.scrape_search("adidas"),
+            )
+
+        self.assertEqual(mock_execute.call_count, 2)
+        self.assertEqual(
+            [response.results[0].content for response in responses],
+            ["nike", "nike", "adidas"],
+        )
+
+    async def test_calls_with_different_configs_are_not_shared(self):
+        """
+        Tests that identical payloads requested with different timeouts or
+        deadlines do not share a job.
+        """
+        client = AsyncClient("user", "pass")
+
+        async def mock_execute(payload, config, session, outcome):
+            await asyncio.sleep(0.01)
+            return {"results": [{"content": config["deadline"]}]}
+
+        with patch.object(
+            client, "_execute_with_timeout", side_effect=mock_execute
+        ) as mock_execute:
+            responses = await asyncio.gather(
+                client.serp.google.scrape_search("nike"),
+                client.serp.google.scrape_search("nike", deadline=5),
+                client.serp.google.scrape_search("nike", deadline=5),
+                client.serp.google.scrape_search("nike", request_timeout=1),
+            )
+
+        self.assertEqual(mock_execute.call_count, 3)
+        self.assertEqual(
+            [response.results[0].content for response in responses],
+            [None, 5, 5, None],
+        )
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """
+        Tests that the call keeps running while any caller still waits and
+        is cancelled once all of them gave up.
+        """
+        flight = AsyncSingleFlight()
+        started = asyncio.Event()
+
+        async def fetch():
+            started.set()
+            await asyncio.sleep(0.05)
+            return "result"
+
+        first = asyncio.ensure_future(flight.do("key", fetch))
+        second = asyncio.ensure_future(flight.do("key", fetch))
+        await started.wait()
+        first.cancel()
+
+        self.assertEqual(await second, "result")
+
+        never_started = asyncio.Event()
+
+        async def slow_fetch():
+            await asyncio.sleep(10)
+            never_started.set()
+
+        waiter = asyncio.ensure_future(flight.do("other", slow_fetch))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(0)
+
+        self.assertEqual(flight._calls, {})
+        self.assertFalse(never_started.is_set())
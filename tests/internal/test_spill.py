@@ -0,0 +1,169 @@
+import asyncio
+import gc
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from oxylabs.internal import (
+    AsyncClient,
+    RealtimeClient,
+    ResultCache,
+    SpilledContent,
+)
+from oxylabs.internal.spill import spill_results
+
+HTML = "<html>" + "é中" * 100 + "</html>"
+
+
+class TestSpilledContent(unittest.TestCase):
+    def setUp(self):
+        self.spill_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.spill_dir.cleanup)
+
+    def test_value_is_read_on_demand(self):
+        """
+        Tests that a spilled value reads back as a string, bytes, a
+        memory-mapped view and a file.
+        """
+        content = SpilledContent.from_text(HTML, self.spill_dir.name)
+        encoded = HTML.encode()
+
+        self.assertEqual(len(content), len(encoded))
+        self.assertEqual(content.read(), HTML)
+        self.assertEqual(content.read_bytes(), encoded)
+        view = content.view()
+        self.assertEqual(bytes(view[:6]), b"<html>")
+        self.assertEqual(view.tobytes(), encoded)
+        view.release()
+        with content.open("r") as file:
+            self.assertEqual(file.read(), HTML)
+        self.assertEqual(
+            SpilledContent.from_text("", self.spill_dir.name).view(), b""
+        )
+
+    def test_file_is_deleted_with_handle(self):
+        """
+        Tests that the scratch file is deleted once the handle is garbage
+        collected.
+        """
+        content = SpilledContent.from_text(HTML, self.spill_dir.name)
+        path = content.path
+
+        self.assertTrue(os.path.exists(path))
+        del content
+        gc.collect()
+
+        self.assertFalse(os.path.exists(path))
+
+    def test_only_large_content_is_spilled(self):
+        """
+        Tests that only content strings above the threshold are spilled,
+        without modifying the original document.
+        """
+        result = {
+            "results": [
+                {"content": HTML, "page": 1},
+                {"content": "<p></p>", "page": 2},
+                {"content": {"parsed": True}, "page": 3},
+            ],
+            "job": {"id": "1"},
+        }
+
+        spilled = spill_results(result, 100, self.spill_dir.name)
+
+        self.assertIsInstance(spilled["results"][0]["content"], SpilledContent)
+        self.assertEqual(spilled["results"][0]["content"].read(), HTML)
+        self.assertEqual(spilled["results"][0]["page"], 1)
+        self.assertIs(spilled["results"][1], result["results"][1])
+        self.assertIs(spilled["results"][2], result["results"][2])
+        self.assertIs(spilled["job"], result["job"])
+        self.assertEqual(result["results"][0]["content"], HTML)
+
+    def test_threshold_is_in_bytes(self):
+        """
+        Tests that the threshold is compared with the UTF-8 encoded size of
+        values, not their length in characters.
+        """
+        result = {"results": [{"content": "中" * 50}]}
+
+        spilled = spill_results(result, 100, self.spill_dir.name)
+
+        self.assertIsInstance(spilled["results"][0]["content"], SpilledContent)
+        self.assertEqual(spill_results(result, 150), result)
+
+
+class TestClientSpill(unittest.IsolatedAsyncioTestCase):
+    def test_responses_hold_spilled_content(self):
+        """
+        Tests that responses of a client with a spill threshold hold large
+        content values as handles.
+        """
+        spill_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(spill_dir.cleanup)
+        client = RealtimeClient(
+            "user", "pass", spill_threshold=100, spill_dir=spill_dir.name
+        )
+        self.addCleanup(client.close)
+        response = Mock(status_code=200)
+        response.json.return_value = {"results": [{"content": HTML}]}
+
+        with patch.object(client._session, "post", return_value=response):
+            result = client.ecommerce.universal.scrape_url("https://a")
+
+        content = result.results[0].content
+        self.assertIsInstance(content, SpilledContent)
+        self.assertEqual(os.path.dirname(content.path), spill_dir.name)
+        self.assertEqual(content.read(), HTML)
+
+    def test_cache_hits_are_not_spilled_again(self):
+        """
+        Tests that serving a cached result does not write another scratch
+        file.
+        """
+        spill_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(spill_dir.cleanup)
+        client = RealtimeClient(
+            "user",
+            "pass",
+            cache=ResultCache(),
+            spill_threshold=100,
+            spill_dir=spill_dir.name,
+        )
+        self.addCleanup(client.close)
+        response = Mock(status_code=200)
+        response.json.return_value = {"results": [{"content": HTML}]}
+
+        with patch.object(client._session, "post", return_value=response):
+            first = client.ecommerce.universal.scrape_url("https://a")
+            second = client.ecommerce.universal.scrape_url("https://a")
+
+        self.assertIsInstance(first.results[0].content, SpilledContent)
+        self.assertEqual(second.results[0].content, HTML)
+        self.assertEqual(len(os.listdir(spill_dir.name)), 1)
+
+    async def test_async_spilling_runs_off_the_event_loop(self):
+        """
+        Tests that the asynchronous client spills content values on a
+        worker thread.
+        """
+        spill_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(spill_dir.cleanup)
+        client = AsyncClient(
+            "user", "pass", spill_threshold=100, spill_dir=spill_dir.name
+        )
+        loop = asyncio.get_running_loop()
+
+        with patch.object(
+            loop, "run_in_executor", wraps=loop.run_in_executor
+        ) as run_in_executor:
+            response = await client.ecommerce._response(
+                {"results": [{"content": HTML}]}
+            )
+
+        self.assertIs(run_in_executor.call_args.args[1], spill_results)
+        self.assertIsInstance(response.results[0].content, SpilledContent)
+
+
+if __name__ == "__main__":
+    unittest.main()
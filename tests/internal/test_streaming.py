@@ -0,0 +1,241 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+from oxylabs.internal import AsyncClient, RealtimeClient
+from oxylabs.internal.streaming import ResultStream, SpilledContent
+from oxylabs.sources.ecommerce.response import Results
+
+CONTENT = '<div class="a">\\ "quoted" é中\U0001f600 \n\t</div>' * 50
+
+DOCUMENT = {
+    "job": {"id": "1", "status": "done", "context": [{"key": "results"}]},
+    "results": [
+        {
+            "content": CONTENT,
+            "page": page,
+            "content_parsed": {"results": [{"content": "nested"}]},
+            "status_code": 200,
+        }
+        for page in range(1, 4)
+    ]
+    + [{"content": "small", "page": 4}, {"content": {"parsed": True}}],
+}
+
+
+def chunks(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def parse(data: bytes, size: int, **kwargs) -> list:
+    stream = ResultStream(**kwargs)
+    items = []
+    for chunk in chunks(data, size):
+        items.extend(stream.feed(chunk))
+    stream.close()
+    return items
+
+
+class TestResultStream(unittest.TestCase):
+    def setUp(self):
+        self.spill_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.spill_dir.cleanup)
+
+    def test_items_are_parsed_across_chunk_boundaries(self):
+        """
+        Tests that the results items are returned as parsed whatever the
+        chunk boundaries.
+        """
+        for encode in (json.dumps, lambda data: json.dumps(data, indent=2)):
+            data = encode(DOCUMENT).encode()
+            for size in (1, 7, 4096):
+                self.assertEqual(parse(data, size), DOCUMENT["results"])
+
+    def test_items_are_returned_as_they_complete(self):
+        """
+        Tests that an item is returned with the chunk holding its last
+        byte.
+        """
+        data = json.dumps(DOCUMENT).encode()
+        end = data.index(b', {"content": "small"')
+        stream = ResultStream()
+
+        items = stream.feed(data[:end])
+
+        self.assertEqual(items, DOCUMENT["results"][:3])
+        self.assertEqual(stream.feed(data[end:]), DOCUMENT["results"][3:])
+
+    def test_large_content_is_spilled(self):
+        """
+        Tests that content values above the threshold are written to
+        files with escapes and multi-byte characters decoded intact.
+        """
+        for ensure_ascii in (True, False):
+            data = json.dumps(DOCUMENT, ensure_ascii=ensure_ascii).encode()
+            for size in (1, 5, 7, 4096):
+                items = parse(
+                    data,
+                    size,
+                    spill_threshold=100,
+                    spill_dir=self.spill_dir.name,
+                )
+
+                for item in items[:3]:
+                    self.assertIsInstance(item["content"], SpilledContent)
+                    self.assertEqual(item["content"].read(), CONTENT)
+                    self.assertEqual(
+                        item["content"].size, len(CONTENT.encode())
+                    )
+                    self.assertEqual(
+                        item["content_parsed"]["results"],
+                        [{"content": "nested"}],
+                    )
+                self.assertEqual(items[3:], DOCUMENT["results"][3:])
+
+    def test_spilled_files_are_deleted(self):
+        """
+        Tests that spill files are deleted explicitly or with their handle.
+        """
+        data = json.dumps(DOCUMENT).encode()
+        items = parse(
+            data, 4096, spill_threshold=100, spill_dir=self.spill_dir.name
+        )
+        first, second = items[0]["content"], items[1]["content"]
+        path = second.path
+
+        first.delete()
+        del items, second
+
+        self.assertFalse(os.path.exists(first.path))
+        self.assertFalse(os.path.exists(path))
+
+    def test_abandoned_spill_files_are_deleted(self):
+        """
+        Tests that aborting a stream deletes the file of a value it was
+        still spilling.
+        """
+        data = json.dumps(DOCUMENT).encode()
+        stream = ResultStream(
+            spill_threshold=100, spill_dir=self.spill_dir.name
+        )
+        stream.feed(data[: data.index(b"</div>") + 500])
+        self.assertEqual(len(os.listdir(self.spill_dir.name)), 1)
+
+        stream.abort()
+
+        self.assertEqual(os.listdir(self.spill_dir.name), [])
+
+    def test_incomplete_document_is_rejected(self):
+        """
+        Tests that a document cut short is reported on close.
+        """
+        data = json.dumps(DOCUMENT).encode()
+        stream = ResultStream()
+        stream.feed(data[:-10])
+
+        with self.assertRaises(ValueError):
+            stream.close()
+
+
+class TestStreamResults(unittest.IsolatedAsyncioTestCase):
+    def test_realtime_results_are_streamed(self):
+        """
+        Tests that realtime results are read from the socket in chunks and
+        yielded as response objects.
+        """
+        client = RealtimeClient("user", "pass")
+        self.addCleanup(client.close)
+        response = MagicMock(status_code=200)
+        response.__enter__.return_value = response
+        response.iter_content.return_value = chunks(
+            json.dumps(DOCUMENT).encode(), 1000
+        )
+
+        with patch.object(
+            client._session, "post", return_value=response
+        ) as post:
+            results = list(
+                client.ecommerce.stream_results(
+                    {"source": "universal", "url": "https://a", "geo": None}
+                )
+            )
+
+        self.assertTrue(post.call_args.kwargs["stream"])
+        self.assertEqual(
+            post.call_args.kwargs["json"],
+            {"source": "universal", "url": "https://a"},
+        )
+        self.assertEqual(len(results), 5)
+        self.assertIsInstance(results[0], Results)
+        self.assertEqual(results[0].content, CONTENT)
+        self.assertEqual(results[3].page, 4)
+
+    def test_failed_stream_leaves_no_spill_files(self):
+        """
+        Tests that a body ending in the middle of a spilled value leaves no
+        file behind.
+        """
+        spill_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(spill_dir.cleanup)
+        client = RealtimeClient(
+            "user", "pass", spill_threshold=100, spill_dir=spill_dir.name
+        )
+        self.addCleanup(client.close)
+        data = json.dumps(DOCUMENT).encode()
+        response = MagicMock(status_code=200)
+        response.__enter__.return_value = response
+        response.iter_content.return_value = chunks(data[:2000], 100)
+
+        with patch.object(client._session, "post", return_value=response):
+            with self.assertRaises(ValueError):
+                list(client.ecommerce.stream_results({"source": "universal"}))
+
+        self.assertEqual(os.listdir(spill_dir.name), [])
+
+    async def test_async_results_are_streamed(self):
+        """
+        Tests that the results of a completed job are read from the socket
+        in chunks and yielded as response objects.
+        """
+        client = AsyncClient("user", "pass")
+        response = MagicMock()
+        response.__aenter__.return_value = response
+        response.raise_for_status = Mock()
+
+        async def iter_chunked(size):
+            for chunk in chunks(json.dumps(DOCUMENT).encode(), 1000):
+                yield chunk
+
+        response.content.iter_chunked = iter_chunked
+        session = Mock()
+        session.request.return_value = response
+        release = AsyncMock()
+
+        with patch.object(
+            client, "_acquire_session", AsyncMock(return_value=session)
+        ), patch.object(client, "_release_session", release), patch.object(
+            client, "_get_job_id", AsyncMock(return_value="1")
+        ), patch.object(
+            client, "_wait_for_job", AsyncMock(return_value=True)
+        ):
+            results = [
+                result
+                async for result in client.serp.stream_results(
+                    {"source": "google_search", "query": "nike"},
+                    spill_threshold=100,
+                )
+            ]
+
+        self.assertEqual(
+            session.request.call_args.args[1], client._base_url + "/1/results"
+        )
+        self.assertEqual(len(results), 5)
+        self.assertEqual(results[1].content.read(), CONTENT)
+        self.assertEqual(results[4].content, {"parsed": True})
+        release.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+from oxylabs.internal import AsyncClient, JobJournal, RealtimeClient
+from oxylabs.internal.retry import RequestOutcome
+from oxylabs.sources.serp.response import SERPResponse
+
+HAS_MSGSPEC = importlib.util.find_spec("msgspec") is not None
+
+GOOGLE_SEARCH = {
+    "results": [
+        {
+            "content": {
+                "url": "https://www.google.com/search?q=nike",
+                "results": {
+                    "organic": [
+                        {
+                            "pos": 1,
+                            "url": "https://nike.com",
+                            "title": "Nike",
+                            "sitelinks": {"inline": [{"url": "https://a"}]},
+                            "unknown_field": {"skipped": True},
+                        }
+                    ]
+                },
+                "parse_status_code": 12000,
+            },
+            "status_code": 200,
+        }
+    ],
+    "job": {"id": "1", "status": "done"},
+}
+
+
+@unittest.skipUnless(HAS_MSGSPEC, "msgspec is not installed")
+class TestTypedDecoding(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = RealtimeClient("user", "pass", typed=True)
+        self.addCleanup(self.client.close)
+
+    def scrape(self, document, method, *args, **kwargs):
+        response = Mock(status_code=200, content=json.dumps(document))
+        response.json.return_value = document
+        with patch.object(self.client._session, "post", return_value=response):
+            return method(*args, **kwargs)
+
+    def test_parsed_results_are_decoded_into_structs(self):
+        """
+        Tests that parsed results of a typed source are decoded straight
+        into structs.
+        """
+        from oxylabs.sources.structs import GoogleSearch, TypedResponse
+
+        response = self.scrape(
+            GOOGLE_SEARCH,
+            self.client.serp.google.scrape_search,
+            "nike",
+            parse=True,
+        )
+
+        self.assertIsInstance(response, TypedResponse)
+        content = response.results[0].content
+        self.assertIsInstance(content, GoogleSearch)
+        organic = content.results.organic[0]
+        self.assertEqual(organic.title, "Nike")
+        self.assertEqual(organic.site_links.inline[0].url, "https://a")
+        self.assertEqual(response.job.id, "1")
+        self.assertEqual(response.retries, 0)
+
+    def test_other_results_use_response_objects(self):
+        """
+        Tests that unparsed results and sources without structs still
+        return response objects.
+        """
+        unparsed = self.scrape(
+            {"results": [{"content": "<html></html>"}]},
+            self.client.serp.google.scrape_search,
+            "nike",
+        )
+        bing = self.scrape(
+            GOOGLE_SEARCH,
+            self.client.serp.bing.scrape_search,
+            "nike",
+            parse=True,
+        )
+
+        self.assertIsInstance(unparsed, SERPResponse)
+        self.assertIsInstance(bing, SERPResponse)
+
+    def test_shared_structs_are_not_mutated(self):
+        """
+        Tests that the retries and error of a call are set on a copy of
+        the struct, which coalesced callers and the cache may share.
+        """
+        shared = self.scrape(
+            GOOGLE_SEARCH,
+            self.client.serp.google.scrape_search,
+            "nike",
+            parse=True,
+        )
+        outcome = RequestOutcome()
+        outcome.error = "failed"
+
+        response = self.client.serp._response(shared, outcome)
+
+        self.assertEqual(response.error, "failed")
+        self.assertIsNone(shared.error)
+
+    def test_mismatched_results_fall_back_to_response_objects(self):
+        """
+        Tests that results not matching the structs are decoded untyped.
+        """
+        document = {"results": [{"content": {"page": "first"}}]}
+
+        response = self.scrape(
+            document,
+            self.client.serp.google.scrape_search,
+            "nike",
+            parse=True,
+        )
+
+        self.assertIsInstance(response, SERPResponse)
+        self.assertEqual(response.raw, document)
+
+    async def test_push_pull_results_are_decoded_into_structs(self):
+        """
+        Tests that results of jobs submitted for a typed source are
+        decoded into structs when fetched.
+        """
+        client = AsyncClient("user", "pass", typed=True)
+        client._typed_jobs["1"] = "amazon_product"
+        body = {"results": [{"content": {"asin": "B0", "price": 10}}]}
+        response = MagicMock(status=200, headers={})
+        response.__aenter__.return_value = response
+
+        async def read():
+            return json.dumps(body).encode()
+
+        response.read = read
+        session = Mock()
+        session.request.return_value = response
+
+        result = await client._get_http_resp("1", session)
+
+        self.assertEqual(result.results[0].content.asin, "B0")
+        self.assertEqual(result.results[0].content.price, 10.0)
+        self.assertEqual(client._typed_jobs, {})
+
+    async def test_typed_jobs_are_tracked_on_every_path(self):
+        """
+        Tests that jobs awaited again from the journal are decoded into
+        structs, and that jobs which did not complete are not tracked
+        anymore.
+        """
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        journal = JobJournal(os.path.join(directory.name, "jobs.jsonl"))
+        self.addCleanup(journal.close)
+        client = AsyncClient("user", "pass", typed=True, journal=journal)
+        journal.record_submitted(
+            "1", {"source": "amazon_product", "query": "B0", "parse": True}
+        )
+        typed_sources = []
+
+        async def mock_request_json(method, url, *args, **kwargs):
+            if method == "POST":
+                return {"id": "2"}
+            typed_sources.append(kwargs.get("typed_source"))
+            return {"results": []}
+
+        with patch.object(
+            client, "_request_json", side_effect=mock_request_json
+        ), patch.object(client, "_wait_for_job", return_value=True):
+            await client.ecommerce.amazon.scrape_product("B0", parse=True)
+        self.assertEqual(typed_sources, ["amazon_product"])
+
+        with patch.object(
+            client, "_request_json", side_effect=mock_request_json
+        ), patch.object(client, "_wait_for_job", return_value=False):
+            await client.ecommerce.amazon.scrape_product("B1", parse=True)
+        self.assertEqual(client._typed_jobs, {})
+
+
+@unittest.skipIf(HAS_MSGSPEC, "msgspec is installed")
+class TestTypedDecodingUnavailable(unittest.TestCase):
+    def test_typed_requires_msgspec(self):
+        """
+        Tests that typed decoding cannot be enabled without msgspec.
+        """
+        with self.assertRaises(ImportError):
+            RealtimeClient("user", "pass", typed=True)
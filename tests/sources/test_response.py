@@ -0,0 +1,198 @@
+import base64
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from oxylabs.internal import RealtimeClient, ResultCache, SpilledContent
+from oxylabs.sources.ecommerce.response import EcommerceResponse
+from oxylabs.sources.serp.response import Organic, SERPResponse
+
+SERP_DATA = {
+    "results": [
+        {
+            "content": "<html></html>",
+            "status_code": 200,
+            "content_parsed": {
+                "url": "https://www.google.com/search?q=nike",
+                "results": {
+                    "organic": [
+                        {"pos": 1, "url": "https://nike.com", "title": "Nike"}
+                    ],
+                    "pla": {"items": [{"pos": 1, "price": "$10"}]},
+                },
+            },
+        }
+    ],
+    "job": {"id": "1", "status": "done"},
+}
+
+
+class TestLazyResponse(unittest.TestCase):
+    def test_nested_models_are_built_on_first_access(self):
+        """
+        Tests that nested models are only built when read, and then kept.
+        """
+        response = SERPResponse(SERP_DATA)
+
+        self.assertFalse(hasattr(response, "_results"))
+        result = response.results[0]
+        self.assertIs(response.results[0], result)
+        self.assertFalse(hasattr(result, "_content_parsed"))
+
+        self.assertEqual(result.content, "<html></html>")
+        self.assertEqual(result.status_code, 200)
+        organic = result.content_parsed.results.organic
+        self.assertIs(result.content_parsed.results.organic, organic)
+        self.assertEqual(organic[0].title, "Nike")
+        self.assertEqual(
+            result.content_parsed.results.pla.items[0].price, "$10"
+        )
+        self.assertEqual(response.job.status, "done")
+
+    def test_missing_nested_data_builds_empty_models(self):
+        """
+        Tests that missing or null nested data builds empty models, as
+        before.
+        """
+        response = EcommerceResponse({"results": [{"content_parsed": None}]})
+        content = response.results[0].content_parsed
+
+        self.assertEqual(content.pricing, [])
+        self.assertIsNone(content.variants.type)
+        self.assertIsNone(content.results.search_information.query)
+        self.assertEqual(EcommerceResponse(None).results, [])
+
+    def test_nested_models_can_be_assigned(self):
+        """
+        Tests that nested attributes can still be assigned.
+        """
+        response = SERPResponse(SERP_DATA)
+        result = response.results[0].content_parsed.results
+        result.organic = [Organic({"pos": 2})]
+
+        self.assertEqual(result.organic[0].pos, 2)
+
+    def test_models_have_no_instance_dict(self):
+        """
+        Tests that response models use slots instead of a per-instance
+        `__dict__`.
+        """
+        response = SERPResponse(SERP_DATA)
+        organic = response.results[0].content_parsed.results.organic[0]
+
+        for model in (response, response.results[0], organic):
+            self.assertFalse(hasattr(model, "__dict__"))
+
+    def test_drop_raw_keeps_only_models(self):
+        """
+        Tests that a response built without its raw data keeps every
+        nested model but no reference to the response data.
+        """
+        response = SERPResponse(SERP_DATA, keep_raw=False)
+        result = response.results[0]
+
+        self.assertIsNone(response.raw)
+        self.assertIsNone(response._data)
+        self.assertIsNone(result._data)
+        self.assertEqual(result.content_parsed.results.organic[0].pos, 1)
+        self.assertEqual(result.content_parsed.results.pla.items[0].pos, 1)
+        self.assertEqual(result.content_parsed.results.paid, [])
+        self.assertEqual(response.job.id, "1")
+
+        ecommerce = EcommerceResponse({"results": [{}]}, keep_raw=False)
+        self.assertIsNone(ecommerce.results[0].content_parsed.raw)
+
+
+PNG = bytes(range(256)) * 40
+ENCODED = base64.encodebytes(PNG).decode()
+
+
+class TestDecodeContent(unittest.TestCase):
+    def response(self, content=ENCODED):
+        return EcommerceResponse({"results": [{"content": content}]})
+
+    def test_content_is_decoded_in_chunks(self):
+        """
+        Tests that base64 content with line breaks is decoded whatever the
+        chunk size.
+        """
+        for chunk_size in (1, 3, 77, 1024 * 1024):
+            result = self.response().results[0]
+
+            self.assertEqual(result.decode_content(chunk_size=chunk_size), PNG)
+        unpadded = ENCODED.replace("\n", "").rstrip("=")
+        self.assertEqual(
+            self.response(unpadded).results[0].decode_content(), PNG
+        )
+
+    def test_content_is_decoded_to_a_target(self):
+        """
+        Tests that content is written to a buffer or a path.
+        """
+        result = self.response().results[0]
+        buffer = io.BytesIO()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "page.png")
+
+            self.assertEqual(result.decode_content(buffer), len(PNG))
+            self.assertEqual(
+                result.decode_content(path, chunk_size=64), len(PNG)
+            )
+
+            with open(path, "rb") as file:
+                self.assertEqual(file.read(), PNG)
+        self.assertEqual(buffer.getvalue(), PNG)
+
+    def test_release_drops_encoded_content(self):
+        """
+        Tests that releasing drops the encoded content from the results but
+        leaves the raw data, which may be shared, untouched.
+        """
+        response = self.response()
+        result = response.results[0]
+
+        decoded = result.decode_content(release=True)
+
+        self.assertEqual(decoded, PNG)
+        self.assertIsNone(result.content)
+        self.assertEqual(response.raw["results"][0]["content"], ENCODED)
+
+    def test_cache_hit_after_release_is_decoded(self):
+        """
+        Tests that a cached result can still be decoded after a response
+        built from it released its content.
+        """
+        client = RealtimeClient("user", "pass", cache=ResultCache())
+        self.addCleanup(client.close)
+        response = Mock(status_code=200)
+        response.json.return_value = {"results": [{"content": ENCODED}]}
+
+        with patch.object(client._session, "post", return_value=response):
+            first = client.ecommerce.universal.scrape_url("https://a")
+            first.results[0].decode_content(release=True)
+            second = client.ecommerce.universal.scrape_url("https://a")
+
+        self.assertEqual(second.results[0].decode_content(), PNG)
+
+    def test_spilled_content_is_decoded(self):
+        """
+        Tests that content spilled to a file is decoded from the file.
+        """
+        content = SpilledContent.from_text(ENCODED)
+        self.addCleanup(content.delete)
+
+        result = self.response(content).results[0]
+
+        self.assertEqual(result.decode_content(chunk_size=100), PNG)
+
+    def test_missing_content_is_rejected(self):
+        """
+        Tests that results without encoded content cannot be decoded.
+        """
+        for content in (None, {"parsed": True}):
+            with self.assertRaises(ValueError):
+                self.response(content).results[0].decode_content()
+        with self.assertRaises(ValueError):
+            self.response("not base64!").results[0].decode_content()